@@ -6,15 +6,22 @@
 - 热重载
 """
 import os
+import atexit
+import threading
+import time
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Callable, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 # 加载环境变量
 load_dotenv()
 
 
+# save_async 合并写盘的等待时间（秒）
+_SAVE_DEBOUNCE = 0.2
+
+
 class ConfigManager:
     """配置管理器 - 单例模式"""
     
@@ -32,8 +39,13 @@ class ConfigManager:
             return
         
         self.config_path = config_path
+        self._loaded_path = None  # 实际加载的配置文件路径
+        self._mtime = None  # 加载时该文件的 mtime，用于 reload_if_changed
         self._config = self._load_config()
         self._observers: List[Callable[[str, Any, Any], None]] = []
+        self._snapshot = None  # (id(_config), 扁平字典)，set/save/reload 时失效
+        self._save_event = threading.Event()  # save_async 置位，由后台写入线程合并写盘
+        self._save_thread = None
         ConfigManager._initialized = True
     
     def _load_config(self):
@@ -55,8 +67,11 @@ class ConfigManager:
         for path in paths_to_check:
              if os.path.exists(path):
                  try:
+                     mtime = os.stat(path).st_mtime
                      with open(path, 'r', encoding='utf-8') as f:
-                         return yaml.safe_load(f)
+                         data = yaml.safe_load(f)
+                     self._loaded_path, self._mtime = path, mtime
+                     return data
                  except Exception as e:
                      print(f"Error loading config from {path}: {e}")
                      
@@ -182,6 +197,7 @@ class ConfigManager:
     def reload(self):
         """热重载配置文件"""
         self._config = self._load_config()
+        self._snapshot = None
         # 通知观察者配置已重载
         for callback in self._observers:
             try:
@@ -189,6 +205,22 @@ class ConfigManager:
             except Exception:
                 pass
     
+    def reload_if_changed(self) -> bool:
+        """
+        配置文件 mtime 变化时才热重载
+        
+        Returns:
+            是否执行了重载
+        """
+        try:
+            mtime = os.stat(self._loaded_path or self.config_path).st_mtime
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self.reload()
+        return True
+    
     def get(self, key_path: str, default=None):
         """
         获取配置值
@@ -208,6 +240,30 @@ class ConfigManager:
         
         return value
     
+    def snapshot(self) -> dict:
+        """
+        获取扁平化的配置视图 {'model_routing.default': ..., ...}
+        
+        结果缓存至 set/save/reload 或 _config 被整体替换；
+        直接原地修改 _config 后需调用 save() 使其失效
+        """
+        snap = self._snapshot
+        if snap is not None and snap[0] == id(self._config):
+            return snap[1]
+        
+        flat = {}
+        stack = [('', self._config or {})]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + '.', value))
+        
+        self._snapshot = (id(self._config), flat)
+        return flat
+    
     def set(self, key_path: str, value: Any, notify: bool = True):
         """
         设置配置值
@@ -229,15 +285,87 @@ class ConfigManager:
             config = config[key]
         
         config[keys[-1]] = value
+        self._snapshot = None
         
         # 通知观察者
         if notify and old_value != value:
             self._notify(key_path, old_value, value)
     
+    def update(self, updates: Dict[str, Any], notify: bool = True):
+        """
+        批量设置配置值，全部写入后再依次通知观察者
+        
+        Args:
+            updates: {配置路径: 新值}
+            notify: 是否通知观察者
+        """
+        parents = {}  # 父路径 -> 节点，相同前缀只遍历一次
+        changed = []
+        for key_path, value in updates.items():
+            parent_path, _, leaf = key_path.rpartition('.')
+            node = parents.get(parent_path)
+            if node is None:
+                node = self._config
+                if parent_path:
+                    for key in parent_path.split('.'):
+                        if key not in node:
+                            node[key] = {}
+                        node = node[key]
+                parents[parent_path] = node
+            old_value = node.get(leaf)
+            node[leaf] = value
+            if old_value != value:
+                changed.append((key_path, old_value, value))
+        self._snapshot = None
+        
+        if notify:
+            for key_path, old_value, value in changed:
+                self._notify(key_path, old_value, value)
+    
     def save(self):
-        """保存配置到文件"""
-        with open(self.config_path, 'w', encoding='utf-8') as f:
+        """保存配置到文件（先写临时文件再替换，避免写入中断导致配置损坏）"""
+        self._snapshot = None
+        tmp_path = f"{self.config_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             yaml.dump(self._config, f, allow_unicode=True, default_flow_style=False)
+        os.replace(tmp_path, self.config_path)
+        if self._loaded_path in (None, self.config_path):
+            # 内存即是最新内容，记录 mtime 避免 reload_if_changed 重复解析
+            self._loaded_path = self.config_path
+            self._mtime = os.stat(self.config_path).st_mtime
+    
+    def save_async(self):
+        """
+        异步保存：由后台线程在 _SAVE_DEBOUNCE 秒内合并多次请求后写盘一次
+        
+        进程退出时若仍有未写入的修改会同步保存
+        """
+        self._snapshot = None
+        self._save_event.set()
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._save_worker, name='config-save', daemon=True)
+            self._save_thread.start()
+            atexit.register(self._flush_pending_save)
+    
+    def _save_worker(self):
+        """后台写入线程"""
+        while True:
+            self._save_event.wait()
+            time.sleep(_SAVE_DEBOUNCE)
+            self._save_event.clear()
+            try:
+                self.save()
+            except RuntimeError:
+                # 写盘期间配置被并发修改（dict changed size），稍后重试
+                self._save_event.set()
+            except Exception as e:
+                print(f"Error saving config to {self.config_path}: {e}")
+    
+    def _flush_pending_save(self):
+        """退出前写入尚未落盘的修改"""
+        if self._save_event.is_set():
+            self._save_event.clear()
+            self.save()
 
 
 # 兼容旧代码：保留 Config 类别名
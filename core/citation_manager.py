@@ -67,7 +67,7 @@ class CitationManager:
         self.citation_usage_count = {}  # {citation_num: usage_count}
         self.max_citation_reuse = 2  # 每条引用最多使用2次（初次+1次复用）
         
-        logger.info(f"引用配额系统: 总计{total}条, 引言{intro_quota}, 章节1-3各{chapter_quota}, 结论0")
+        logger.info("引用配额系统: 总计%s条, 引言%s, 章节1-3各%s, 结论0", total, intro_quota, chapter_quota)
     
     def set_current_section(self, section_type, chapter_idx=0, subsection_idx=0):
         """
@@ -90,7 +90,7 @@ class CitationManager:
             self.current_subsection = subsection_idx
             self.subsection_used = 0
         
-        logger.debug(f"切换到章节: {self.current_chapter}, 二级标题: {subsection_idx}")
+        logger.debug("切换到章节: %s, 二级标题: %s", self.current_chapter, subsection_idx)
     
     def _llm_select_best_citation(self, sentence, candidates):
         """
@@ -136,13 +136,13 @@ class CitationManager:
                 selected_idx = int(match.group(1)) - 1
                 if 0 <= selected_idx < len(candidates):
                     selected_lit = candidates[selected_idx]['literature']
-                    logger.info(f"LLM选择了第 {selected_idx + 1} 篇文献: {selected_lit['title'][:40]}...")
+                    logger.info("LLM选择了第 %s 篇文献: %s...", selected_idx + 1, selected_lit['title'][:40])
                     return candidates[selected_idx]
             
-            logger.warning(f"LLM返回无效: '{response}', 使用相似度最高的候选")
+            logger.warning("LLM返回无效: '%s', 使用相似度最高的候选", response)
             return candidates[0]
         except Exception as e:
-            logger.error(f"LLM筛选失败: {e}, 使用相似度最高的候选")
+            logger.error("LLM筛选失败: %s, 使用相似度最高的候选", e)
             return candidates[0]
     
     def generate_sentence_with_citations(self, sentence_skeleton, query):
@@ -177,16 +177,14 @@ class CitationManager:
         can_add = chapter_remaining > 0 and subsection_remaining > 0 and total_remaining > 0
         target_new = 1 if can_add else 0
         
-        logger.debug(f"[{chapter}] 章节配额{chapter_used}/{chapter_quota}, "
-                    f"二级标题{self.subsection_used}/{subsection_max}, "
-                    f"全局{total_used}/{self.max_total_citations}, 添加={target_new}")
+        logger.debug("[%s] 章节配额%s/%s, 二级标题%s/%s, 全局%s/%s, 添加=%s", chapter, chapter_used, chapter_quota, self.subsection_used, subsection_max, total_used, self.max_total_citations, target_new)
         
         # [*] 使用LLM智能筛选模式
         # 1. 获取原始候选文献（不应用阈值）
         raw_candidates = self.retriever.get_raw_candidates(query, top_k=10)
         
         if not raw_candidates:
-            logger.warning(f"查询 '{query}' 未找到相关文献")
+            logger.warning("查询 '%s' 未找到相关文献", query)
             return f"{sentence_skeleton}。", []
         
         # 2. 使用LLM选择最佳文献（如果配置了model_router）
@@ -208,7 +206,7 @@ class CitationManager:
                 break  # 已达到本次目标新增数
             
             if len(self.citation_tracker) >= self.max_total_citations:
-                logger.info(f"已达到最大引用数量限制 ({self.max_total_citations})，停止添加新引用")
+                logger.info("已达到最大引用数量限制 (%s)，停止添加新引用", self.max_total_citations)
                 break
             
             lit = lit_info['literature']
@@ -216,7 +214,7 @@ class CitationManager:
             
             # 严格不重复引用检查
             if lit_id in self.citation_tracker:
-                logger.debug(f"文献 {lit_id} 已引用过，跳过")
+                logger.debug("文献 %s 已引用过，跳过", lit_id)
                 continue
             
             # 分配新序号
@@ -247,10 +245,10 @@ class CitationManager:
                 citation_nums = [selected_num]
                 # 更新使用次数
                 self.citation_usage_count[selected_num] = self.citation_usage_count.get(selected_num, 1) + 1
-                logger.debug(f"复用引用 [{selected_num}]（第{self.citation_usage_count[selected_num]}次使用）")
+                logger.debug("复用引用 [%s]（第%s次使用）", selected_num, self.citation_usage_count[selected_num])
             else:
                 # 所有引用都已达到复用上限，不添加任何引用
-                logger.debug(f"所有引用已达复用上限({self.max_citation_reuse}次)，本句不添加引用")
+                logger.debug("所有引用已达复用上限(%s次)，本句不添加引用", self.max_citation_reuse)
         
         # 插入引用
         # 预处理：去掉骨架句末尾标点（包括可能的多余标点）
@@ -262,7 +260,7 @@ class CitationManager:
         if citation_nums:
             citation_str = ''.join([f'[{num}]' for num in citation_nums])
             sentence_with_citation = f"{clean_skeleton}{citation_str}。"
-            logger.debug(f"为句子添加了 {len(citation_nums)} 个引用: {citation_nums}")
+            logger.debug("为句子添加了 %s 个引用: %s", len(citation_nums), citation_nums)
         else:
             sentence_with_citation = f"{clean_skeleton}。"
         
@@ -339,7 +337,7 @@ class CitationManager:
             reference = f"[{citation_num}] {clean_cit}"
             reference_list.append(reference)
         
-        logger.info(f"生成参考文献列表: {len(reference_list)} 条")
+        logger.info("生成参考文献列表: %s 条", len(reference_list))
         # 使用双换行确保分段
         return '\n\n'.join(reference_list)
     
@@ -393,7 +391,7 @@ class CitationManager:
         report['text_citations'] = text_citation_nums
         report['tracker_citations'] = set(self.citation_tracker.values())
         
-        logger.info(f"引用同步: 正文中有 {len(text_citation_nums)} 个引用编号, tracker中有 {len(self.citation_tracker)} 条记录")
+        logger.info("引用同步: 正文中有 %s 个引用编号, tracker中有 %s 条记录", len(text_citation_nums), len(self.citation_tracker))
         
         # 2. 找出差异
         tracker_nums = set(self.citation_tracker.values())
@@ -411,14 +409,14 @@ class CitationManager:
         # 3. 记录缺失的引用（不再随机分配，只记录警告）
         # [*] 移除随机分配逻辑 - 确保引用的真实性
         if missing_in_tracker:
-            logger.warning(f"发现 {len(missing_in_tracker)} 个正文引用未在tracker中: {sorted(missing_in_tracker)}")
+            logger.warning("发现 %s 个正文引用未在tracker中: %s", len(missing_in_tracker), sorted(missing_in_tracker))
             logger.warning("这些引用可能是AI在优化/扩写时错误添加的，将被保留但无法生成对应参考文献")
             report['missing'] = list(missing_in_tracker)
         
         # 4. 移除未使用的引用（可选，默认保留以避免丢失数据）
         # 注意：这里选择不移除，因为某些引用可能在后续处理中被使用
         if unused_in_text:
-            logger.info(f"tracker中有 {len(unused_in_text)} 个引用未在正文中使用: {unused_in_text}")
+            logger.info("tracker中有 %s 个引用未在正文中使用: %s", len(unused_in_text), unused_in_text)
             report['removed'] = list(unused_in_text)
             # 不实际删除，只记录
             # for lit_id, num in list(self.citation_tracker.items()):
@@ -429,7 +427,7 @@ class CitationManager:
         if text_citation_nums:
             self.next_citation_num = max(text_citation_nums) + 1
         
-        logger.info(f"引用同步完成: 匹配{len(matched)}个, 新增{len(report['added'])}个")
+        logger.info("引用同步完成: 匹配%s个, 新增%s个", len(matched), len(report['added']))
         return report
     
     def get_tracker_state(self):
@@ -486,14 +484,14 @@ class CitationManager:
         for num, positions in citation_positions.items():
             # 检查是否超限编号
             if num > max_valid_num:
-                logger.warning(f"发现超限引用 [{num}]（最大允许 {max_valid_num}），将全部移除")
+                logger.warning("发现超限引用 [%s]（最大允许 %s），将全部移除", num, max_valid_num)
                 positions_to_remove.extend(positions)
                 issues_found['over_limit'].append(num)
                 continue
             
             # 检查是否不在 tracker 中
             if num not in valid_tracker_nums:
-                logger.warning(f"发现未追踪引用 [{num}]，将全部移除")
+                logger.warning("发现未追踪引用 [%s]，将全部移除", num)
                 positions_to_remove.extend(positions)
                 issues_found['untracked'].append(num)
                 continue
@@ -501,7 +499,7 @@ class CitationManager:
             # 检查使用次数是否超限
             if len(positions) > max_reuse:
                 excess_count = len(positions) - max_reuse
-                logger.warning(f"引用 [{num}] 使用了 {len(positions)} 次（超限 {excess_count} 次），移除多余的")
+                logger.warning("引用 [%s] 使用了 %s 次（超限 %s 次），移除多余的", num, len(positions), excess_count)
                 # 保留前 max_reuse 个，移除后面的
                 positions_to_remove.extend(positions[max_reuse:])
                 issues_found['over_reuse'].append((num, len(positions)))
@@ -521,13 +519,13 @@ class CitationManager:
         
         # 5. 日志汇总
         if positions_to_remove:
-            logger.info(f"引用分布验证: 移除了 {len(positions_to_remove)} 处不合规引用")
+            logger.info("引用分布验证: 移除了 %s 处不合规引用", len(positions_to_remove))
             if issues_found['over_limit']:
-                logger.info(f"  - 超限编号: {issues_found['over_limit']}")
+                logger.info("  - 超限编号: %s", issues_found['over_limit'])
             if issues_found['untracked']:
-                logger.info(f"  - 未追踪编号: {issues_found['untracked']}")
+                logger.info("  - 未追踪编号: %s", issues_found['untracked'])
             if issues_found['over_reuse']:
-                logger.info(f"  - 过度复用: {[(f'[{n}]使用{c}次' ) for n, c in issues_found['over_reuse']]}")
+                logger.info("  - 过度复用: %s", [f'[{n}]使用{c}次' for n, c in issues_found['over_reuse']])
         else:
             logger.info("引用分布验证: 全部引用符合规范")
         
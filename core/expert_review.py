@@ -27,7 +27,7 @@ class ExpertReviewSystem:
         self.web_search = web_search
         self.max_rounds = max_rounds
         self.target_score = target_score
-        logger.info(f"专家审稿系统初始化完成（目标评分≥{self.target_score}分，最多{self.max_rounds}轮）")
+        logger.info("专家审稿系统初始化完成（目标评分≥%s分，最多%s轮）", self.target_score, self.max_rounds)
     
     def review_and_optimize_iteratively(self, paper_content):
         """
@@ -47,9 +47,9 @@ class ExpertReviewSystem:
         best_score = 0
         
         for round_num in range(1, self.max_rounds + 1):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"第 {round_num}/{self.max_rounds} 轮审稿")
-            logger.info(f"{'='*60}")
+            logger.info("\n%s", '=' * 60)
+            logger.info("第 %s/%s 轮审稿", round_num, self.max_rounds)
+            logger.info("%s", '=' * 60)
             
             # 执行一轮完整审稿
             review_result = self._single_round_review_and_optimize(current_paper, round_num)
@@ -58,25 +58,25 @@ class ExpertReviewSystem:
             optimized_paper = review_result['optimized_paper']
             current_score = review_result['综合评分']
             
-            logger.info(f"第{round_num}轮综合评分: {current_score}/100")
+            logger.info("第%s轮综合评分: %s/100", round_num, current_score)
             
             # [*] 检查是否比之前更好
             if current_score > best_score:
                 best_paper = optimized_paper
                 best_score = current_score
                 current_paper = optimized_paper
-                logger.info(f"[OK] 评分提升！更新最佳版本 ({best_score}分)")
+                logger.info("[OK] 评分提升！更新最佳版本 (%s分)", best_score)
             else:
                 # 评分下降，回退到最佳版本
-                logger.warning(f"[!] 评分下降 ({current_score} < {best_score})，回退到最佳版本")
+                logger.warning("[!] 评分下降 (%s < %s)，回退到最佳版本", current_score, best_score)
                 current_paper = best_paper
             
             # 判断是否达标
             if best_score >= self.target_score:
-                logger.info(f"[OK] 最佳评分已达{best_score}分（≥{self.target_score}），停止优化")
+                logger.info("[OK] 最佳评分已达%s分（≥%s），停止优化", best_score, self.target_score)
                 break
             else:
-                logger.info(f"未达标（需≥{self.target_score}分），继续下一轮优化...")
+                logger.info("未达标（需≥%s分），继续下一轮优化...", self.target_score)
             
             # [*] 实时保存本轮结果
             if self.output_dir:
@@ -85,12 +85,12 @@ class ExpertReviewSystem:
                     round_file = os.path.join(self.output_dir, f'expert_review_round_{round_num}.json')
                     with open(round_file, 'w', encoding='utf-8') as f:
                         json.dump(review_result, f, ensure_ascii=False, indent=2)
-                    logger.info(f"第{round_num}轮审稿结果已保存: {round_file}")
+                    logger.info("第%s轮审稿结果已保存: %s", round_num, round_file)
                 except Exception as e:
-                    logger.error(f"保存第{round_num}轮审稿结果失败: {e}")
+                    logger.error("保存第%s轮审稿结果失败: %s", round_num, e)
         
         logger.info("="*60)
-        logger.info(f"审稿优化流程完成！共{round_num}轮，最终评分{best_score}/100")
+        logger.info("审稿优化流程完成！共%s轮，最终评分%s/100", round_num, best_score)
         logger.info("="*60)
         
         return {
@@ -114,26 +114,26 @@ class ExpertReviewSystem:
             }
         """
         # 阶段1: 4位专家并行审稿
-        logger.info(f"阶段1: 4位专家并行审稿...")
+        logger.info("阶段1: 4位专家并行审稿...")
         
         expert1_feedback = self._expert1_innovation_review(paper)
         expert1_score = self._extract_score(expert1_feedback)
-        logger.info(f"  [OK] 专家1（创新点）: {expert1_score}/25")
+        logger.info("  [OK] 专家1（创新点）: %s/25", expert1_score)
         
         expert2_feedback = self._expert2_logic_review(paper)
         expert2_score = self._extract_score(expert2_feedback)
-        logger.info(f"  [OK] 专家2（逻辑性）: {expert2_score}/25")
+        logger.info("  [OK] 专家2（逻辑性）: %s/25", expert2_score)
         
         expert3_feedback = self._expert3_accuracy_review(paper)
         expert3_score = self._extract_score(expert3_feedback)
-        logger.info(f"  [OK] 专家3（准确性）: {expert3_score}/25")
+        logger.info("  [OK] 专家3（准确性）: %s/25", expert3_score)
         
         expert4_feedback = self._expert4_norm_review(paper)
         expert4_score = self._extract_score(expert4_feedback)
-        logger.info(f"  [OK] 专家4（规范性）: {expert4_score}/25")
+        logger.info("  [OK] 专家4（规范性）: %s/25", expert4_score)
         
         # 阶段2: 整合意见并计算综合评分
-        logger.info(f"\n阶段2: 专家5整合意见并评分...")
+        logger.info("\n阶段2: 专家5整合意见并评分...")
         integrated_result = self._expert5_integrate_feedback(
             expert1_feedback, expert2_feedback, 
             expert3_feedback, expert4_feedback
@@ -147,19 +147,19 @@ class ExpertReviewSystem:
             direct_sum = expert1_score + expert2_score + expert3_score + expert4_score
             if direct_sum > 0:
                 comprehensive_score = direct_sum
-                logger.info(f"  使用4位专家分数直接求和: {comprehensive_score}/100")
+                logger.info("  使用4位专家分数直接求和: %s/100", comprehensive_score)
         
-        logger.info(f"  [OK] 综合评分: {comprehensive_score}/100")
+        logger.info("  [OK] 综合评分: %s/100", comprehensive_score)
         
         # 阶段3: 中间层AI拆解任务
-        logger.info(f"\n阶段3: 中间层AI拆解修改任务...")
+        logger.info("\n阶段3: 中间层AI拆解修改任务...")
         task_list = self._task_decomposer(paper, integrated_result)
-        logger.info(f"  [OK] 拆解出 {len(task_list)} 个修改任务")
+        logger.info("  [OK] 拆解出 %s 个修改任务", len(task_list))
         
         # 阶段4: 写作AI逐条执行任务
-        logger.info(f"\n阶段4: 写作AI逐条执行修改...")
+        logger.info("\n阶段4: 写作AI逐条执行修改...")
         optimized_paper = self._execute_tasks_sequentially(paper, task_list)
-        logger.info(f"  [OK] 所有任务执行完成")
+        logger.info("  [OK] 所有任务执行完成")
         
         return {
             'expert_reviews': {
@@ -506,7 +506,7 @@ class ExpertReviewSystem:
                     'requirement': parts[1].strip(),
                     'keywords': parts[2].strip() if len(parts) > 2 else ''
                 })
-                logger.info(f"  任务{len(tasks)}: {parts[0].strip()[:40]}...")
+                logger.info("  任务%s: %s...", len(tasks), parts[0].strip()[:40])
         
         if not tasks:
             logger.warning("任务解析为空，创建通用优化任务")
@@ -517,7 +517,7 @@ class ExpertReviewSystem:
                 'keywords': ''
             })
         
-        logger.info(f"拆解出 {len(tasks)} 个修改任务")
+        logger.info("拆解出 %s 个修改任务", len(tasks))
         return tasks
     
     def _parse_tasks_with_regex(self, response, paragraphs, feedback):
@@ -595,7 +595,7 @@ class ExpertReviewSystem:
                         if len(tasks) >= 3:
                             break
         except Exception as e:
-            logger.error(f"任务提取失败: {e}")
+            logger.error("任务提取失败: %s", e)
         
         return tasks
     
@@ -712,7 +712,7 @@ class ExpertReviewSystem:
             
             tasks.append(task)
         
-        logger.info(f"Fallback: 生成了 {len(tasks)} 个默认修改任务")
+        logger.info("Fallback: 生成了 %s 个默认修改任务", len(tasks))
         return tasks
     
     def _execute_tasks_sequentially(self, paper, task_list):
@@ -751,7 +751,7 @@ class ExpertReviewSystem:
             problem = task.get('problem', '')
             keywords = task.get('keywords', '')
             
-            logger.info(f"  任务{task_id}: {problem[:30]}...")
+            logger.info("  任务%s: %s...", task_id, problem[:30])
             
             # 定位目标段落
             target_para = None
@@ -785,25 +785,25 @@ class ExpertReviewSystem:
                         target_para = p
             
             if not target_para:
-                logger.warning(f"  无法定位任务{task_id}对应的段落，跳过")
+                logger.warning("  无法定位任务%s对应的段落，跳过", task_id)
                 continue
                 
             if target_para['idx'] in modified_indices:
-                logger.warning(f"  段落{target_para['idx']}已被修改过，跳过避免冲突")
+                logger.warning("  段落%s已被修改过，跳过避免冲突", target_para['idx'])
                 continue
                 
             # 执行局部修改
-            logger.info(f"  定位成功: [{target_para['location']}] {target_para['preview'][:30]}...")
+            logger.info("  定位成功: [%s] %s...", target_para['location'], target_para['preview'][:30])
             new_content = self._patch_modify_paragraph(target_para['full_text'], task)
             
             if new_content and new_content != target_para['full_text']:
                 # 更新段落内容
                 paragraphs[target_para['idx']]['full_text'] = new_content
                 modified_indices.add(target_para['idx'])
-                logger.info(f"  修改完成 (索引{target_para['idx']})")
+                logger.info("  修改完成 (索引%s)", target_para['idx'])
         
         # 3. 重新组装论文
-        logger.info(f"局部修改完成，共修改 {len(modified_indices)} 处")
+        logger.info("局部修改完成，共修改 %s 处", len(modified_indices))
         new_paper = "\n\n".join([p['full_text'] for p in paragraphs])
         
         return new_paper
@@ -855,19 +855,19 @@ class ExpertReviewSystem:
             if orig_refs:
                 lost_refs = orig_refs - new_refs
                 if lost_refs:
-                    logger.warning(f"  修改导致引用丢失: {lost_refs}，回退到原文")
+                    logger.warning("  修改导致引用丢失: %s，回退到原文", lost_refs)
                     return original_text
             
             # 验证长度变化不超过50%
             length_ratio = len(result) / len(original_text)
             if length_ratio < 0.5 or length_ratio > 2.0:
-                logger.warning(f"  修改后长度变化过大 ({length_ratio:.1f}x)，回退到原文")
+                logger.warning("  修改后长度变化过大 (%.1fx)，回退到原文", length_ratio)
                 return original_text
                 
             return result
             
         except Exception as e:
-            logger.error(f"  局部修改失败: {e}")
+            logger.error("  局部修改失败: %s", e)
             return original_text
     
     def _rewrite_paragraph(self, paper, task, search_context=""):
@@ -913,16 +913,16 @@ class ExpertReviewSystem:
             if match:
                 target_idx = int(match.group())
                 if 0 <= target_idx < len(paragraphs):
-                    logger.info(f"  [OK] AI定位成功，定位到段落 {target_idx}")
+                    logger.info("  [OK] AI定位成功，定位到段落 %s", target_idx)
                 else:
-                    logger.warning(f"  AI返回编号{target_idx}超出范围，使用第一个正文段落")
+                    logger.warning("  AI返回编号%s超出范围，使用第一个正文段落", target_idx)
                     target_idx = next((i for i, p in enumerate(paragraphs) if p.strip() and not p.startswith('#')), 1)
             else:
-                logger.warning(f"  AI定位失败，无法解析: {response}")
+                logger.warning("  AI定位失败，无法解析: %s", response)
                 return paper
                 
         except Exception as e:
-            logger.error(f"  AI定位异常: {e}")
+            logger.error("  AI定位异常: %s", e)
             return paper
         
         original_para = paragraphs[target_idx]
@@ -963,11 +963,11 @@ class ExpertReviewSystem:
             
             # 替换段落
             paragraphs[target_idx] = new_para
-            logger.info(f"  [OK] 已重写段落 (原{len(original_para)}字 -> 新{len(new_para)}字)")
+            logger.info("  [OK] 已重写段落 (原%s字 -> 新%s字)", len(original_para), len(new_para))
             
             return '\n\n'.join(paragraphs)
         except Exception as e:
-            logger.error(f"  段落重写失败: {e}")
+            logger.error("  段落重写失败: %s", e)
             return paper
     
     def _execute_single_task(self, paper, task, search_context=""):
@@ -1028,7 +1028,7 @@ class ExpertReviewSystem:
         match = re.search(r'\*?\*?综合评分[:：]\s*\*?\*?\s*(\d+(?:\.\d+)?)/100', integrated_feedback)
         if match:
             score = float(match.group(1))
-            logger.info(f"  评分提取成功(模式1): {score}/100")
+            logger.info("  评分提取成功(模式1): %s/100", score)
             return score
         
         # 模式2: 纯数字格式 "综合评分: 75" 或 "综合评分：75分"
@@ -1036,28 +1036,28 @@ class ExpertReviewSystem:
         if match:
             score = float(match.group(1))
             if score <= 100:  # 确保是百分制
-                logger.info(f"  评分提取成功(模式2): {score}/100")
+                logger.info("  评分提取成功(模式2): %s/100", score)
                 return score
         
         # 模式3: 带计算公式 "综合评分: (计算公式) = X.XX" 或 "≈ X"
         match = re.search(r'综合评分[:：].*?[=≈]\s*(\d+(?:\.\d+)?)', integrated_feedback)
         if match:
             score = float(match.group(1))
-            logger.info(f"  评分提取成功(模式3): {score}/100")
+            logger.info("  评分提取成功(模式3): %s/100", score)
             return score
         
         # 模式4: 总分格式 "总分: X/100"
         match = re.search(r'总分[:：]\s*(\d+(?:\.\d+)?)/100', integrated_feedback)
         if match:
             score = float(match.group(1))
-            logger.info(f"  评分提取成功(模式4-总分): {score}/100")
+            logger.info("  评分提取成功(模式4-总分): %s/100", score)
             return score
         
         # 模式5: 备用 - 直接查找0-100范围的分数（取最后一个）
         matches = re.findall(r'(\d{1,3}(?:\.\d+)?)/100', integrated_feedback)
         if matches:
             score = float(matches[-1])
-            logger.info(f"  评分提取成功(模式5-末尾匹配): {score}/100")
+            logger.info("  评分提取成功(模式5-末尾匹配): %s/100", score)
             return score
         
         logger.warning("未能直接提取综合评分，尝试从专家分数求和...")
@@ -1066,14 +1066,14 @@ class ExpertReviewSystem:
         dimension_scores = re.findall(r'(?:创新点|逻辑性|准确性|规范性)得分[:：]\s*(\d+(?:\.\d+)?)/25', integrated_feedback)
         if len(dimension_scores) == 4:
             total = sum(float(s) for s in dimension_scores)
-            logger.info(f"  从维度得分求和: {total}/100")
+            logger.info("  从维度得分求和: %s/100", total)
             return total
         
         # 模式7: 从四位专家小计求和（最终备用）
         expert_scores = re.findall(r'小计[:：]\s*(\d+(?:\.\d+)?)/25', integrated_feedback)
         if len(expert_scores) >= 4:
             total = sum(float(s) for s in expert_scores[:4])
-            logger.info(f"  从专家小计求和: {total}/100")
+            logger.info("  从专家小计求和: %s/100", total)
             return total
         
         logger.warning("所有评分提取模式均失败，默认返回60分（避免过低导致无限循环）")
@@ -18,7 +18,12 @@ class SearXNGSearcher:
         """
         self.base_url = searxng_url.rstrip('/')
         self.results_per_query = results_per_query
-        logger.info(f"SearXNG搜索器初始化: {self.base_url}, 每次{results_per_query}条结果")
+        # 复用HTTP连接，避免每次检索重新建立TCP连接
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        logger.info("SearXNG搜索器初始化: %s, 每次%s条结果", self.base_url, results_per_query)
     
     def search(self, query: str, num_results: int = None) -> List[Dict]:
         """
@@ -53,7 +58,7 @@ class SearXNGSearcher:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 search_url,
                 params=params,
                 headers=headers,
@@ -73,18 +78,18 @@ class SearXNGSearcher:
                     'engine': item.get('engine', 'unknown')
                 })
             
-            logger.info(f"SearXNG搜索完成: '{query}' -> {len(results)}条结果")
+            logger.info("SearXNG搜索完成: '%s' -> %s条结果", query, len(results))
             return results
             
         except Exception as e:
             # ⭐ 自动回退：如果JSON API被禁用(403)，尝试HTML解析
             if "403" in str(e):
                 if not getattr(self, 'json_api_blocked', False):
-                    logger.warning(f"SearXNG JSON API受限(403)，已自动切换至网页采集模式 (HTML Fallback)")
+                    logger.warning("SearXNG JSON API受限(403)，已自动切换至网页采集模式 (HTML Fallback)")
                     self.json_api_blocked = True
                 return self._search_html(query, num_results)
             
-            logger.error(f"SearXNG搜索失败: {str(e)}")
+            logger.error("SearXNG搜索失败: %s", str(e))
             return []
 
     def _search_html(self, query: str, num_results: int) -> List[Dict]:
@@ -102,7 +107,7 @@ class SearXNGSearcher:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(search_url, params=params, headers=headers, timeout=30)
+            response = self.session.get(search_url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
             html = response.text
             
@@ -142,11 +147,11 @@ class SearXNGSearcher:
                     'engine': 'html_fallback'
                 })
             
-            logger.info(f"SearXNG HTML fallback搜索完成: {len(results)}条结果")
+            logger.info("SearXNG HTML fallback搜索完成: %s条结果", len(results))
             return results
             
         except Exception as e:
-            logger.error(f"SearXNG HTML fallback失败: {e}")
+            logger.error("SearXNG HTML fallback失败: %s", e)
             return []
     
     def search_multiple_queries(self, queries: List[str], num_results_per_query: int = None) -> List[Dict]:
@@ -173,7 +178,7 @@ class SearXNGSearcher:
                     seen_urls.add(url)
                     all_results.append(result)
         
-        logger.info(f"批量搜索完成: {len(queries)}个查询 -> {len(all_results)}条去重结果")
+        logger.info("批量搜索完成: %s个查询 -> %s条去重结果", len(queries), len(all_results))
         return all_results
     
     def format_results_for_llm(self, results: List[Dict], max_length: int = 5000) -> str:
@@ -235,7 +240,7 @@ class ExternalSearchIntegration:
             logger.warning("智谱AI搜索暂未实现")
             self.searcher = None
         else:
-            logger.warning(f"未知的检索模式: {self.mode}")
+            logger.warning("未知的检索模式: %s", self.mode)
             self.searcher = None
     
     def search_for_context(self, topic: str, num_results: int = 30) -> str:
@@ -257,5 +262,5 @@ class ExternalSearchIntegration:
             formatted = self.searcher.format_results_for_llm(results)
             return formatted
         except Exception as e:
-            logger.error(f"联网检索失败: {str(e)}")
+            logger.error("联网检索失败: %s", str(e))
             return ""
@@ -22,10 +22,10 @@ class LiteratureParser:
             文献列表
         """
         if not os.path.exists(filepath):
-            logger.warning(f"文献池文件不存在: {filepath}，将进入纯网络检索模式")
+            logger.warning("文献池文件不存在: %s，将进入纯网络检索模式", filepath)
             return []
 
-        logger.info(f"开始解析文献池: {filepath}")
+        logger.info("开始解析文献池: %s", filepath)
         
         with open(filepath, 'r', encoding='utf-8') as f:
             lines = f.readlines()
@@ -77,7 +77,7 @@ class LiteratureParser:
         # 去重
         unique_pool = self._deduplicate(literature_pool)
         
-        logger.info(f"文献池解析完成: 原始{len(literature_pool)}条，去重后{len(unique_pool)}条")
+        logger.info("文献池解析完成: 原始%s条，去重后%s条", len(literature_pool), len(unique_pool))
         return unique_pool
 
     def _parse_citation_line(self, line, id_match):
@@ -139,7 +139,7 @@ class LiteratureParser:
                 'full_citation': line
             }
         except Exception as e:
-            logger.warning(f"解析引用行出错: {line[:30]}... {e}")
+            logger.warning("解析引用行出错: %s... %s", line[:30], e)
             return {
                 'id': int(id_match.group(1)),
                 'authors': '未知',
@@ -163,6 +163,6 @@ class LiteratureParser:
                 seen_titles.add(clean_title)
                 unique_pool.append(lit)
             else:
-                logger.debug(f"重复文献已过滤: {lit['title']}")
+                logger.debug("重复文献已过滤: %s", lit['title'])
         
         return unique_pool
@@ -42,12 +42,17 @@ class ModelRouter:
         self.providers: Dict[str, ProviderConfig] = {}
         self.active_provider_name = config.get('model_routing.default_provider', 'online')
         self._last_request_time: Dict[str, float] = {}
+        # 复用HTTP连接，同一提供商的连续调用免去TCP/TLS握手
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # 初始化所有提供商
         self._init_providers(config)
         
-        logger.info(f"模型路由器初始化完成，默认提供商: {self.active_provider_name}")
-        logger.info(f"已加载提供商: {list(self.providers.keys())}")
+        logger.info("模型路由器初始化完成，默认提供商: %s", self.active_provider_name)
+        logger.info("已加载提供商: %s", list(self.providers.keys()))
     
     def _init_providers(self, config: Dict[str, Any]):
         """从配置初始化提供商"""
@@ -104,7 +109,7 @@ class ModelRouter:
             if not available:
                 raise ValueError("没有可用的API提供商")
             self.active_provider_name = available[0]
-            logger.warning(f"默认提供商 {self.active_provider_name} 不可用，切换到 {self.active_provider_name}")
+            logger.warning("默认提供商 %s 不可用，切换到 %s", self.active_provider_name, self.active_provider_name)
         
         return self.providers[self.active_provider_name]
     
@@ -114,7 +119,7 @@ class ModelRouter:
             available = ", ".join(self.providers.keys())
             raise ValueError(f"提供商 '{name}' 不存在。可用: {available}")
         self.active_provider_name = name
-        logger.info(f"切换到提供商: {name}")
+        logger.info("切换到提供商: %s", name)
     
     def generate_for_stage(
         self,
@@ -144,13 +149,13 @@ class ModelRouter:
         # 获取阶段配置
         stage_config = stage_models.get(stage, {})
         if not stage_config:
-            logger.warning(f"阶段 '{stage}' 没有配置，使用默认提供商")
+            logger.warning("阶段 '%s' 没有配置，使用默认提供商", stage)
             return self.generate(prompt, context, max_tokens=max_tokens)
         
         # 获取阶段指定的提供商
         provider_name = stage_config.get('provider', self.active_provider_name)
         if provider_name not in self.providers:
-            logger.warning(f"阶段 '{stage}' 指定的提供商 '{provider_name}' 不存在，使用默认提供商")
+            logger.warning("阶段 '%s' 指定的提供商 '%s' 不存在，使用默认提供商", stage, provider_name)
             return self.generate(prompt, context, max_tokens=max_tokens)
         
         provider = self.providers[provider_name]
@@ -174,7 +179,7 @@ class ModelRouter:
             if 'model' in stage_config:
                 provider.models = [stage_config['model']]
             
-            logger.info(f"[分阶段模型] {stage}: 使用 {provider_name}/{provider.models[0] if provider.models else '默认'}")
+            logger.info("[分阶段模型] %s: 使用 %s/%s", stage, provider_name, provider.models[0] if provider.models else '默认')
             
             return self._call_provider(provider, prompt, context, max_tokens)
         finally:
@@ -208,7 +213,7 @@ class ModelRouter:
         # 确定使用的提供商
         if provider_name and provider_name in self.providers:
             provider = self.providers[provider_name]
-            logger.info(f"使用指定提供商: {provider_name}")
+            logger.info("使用指定提供商: %s", provider_name)
         else:
             provider = self.get_active_provider()
         
@@ -230,7 +235,7 @@ class ModelRouter:
             elapsed = current_time - last_time
             if elapsed < provider.rate_limit_seconds:
                 wait_time = provider.rate_limit_seconds - elapsed
-                logger.info(f"[{provider.name}] 触发频率限制，等待 {wait_time:.2f} 秒...")
+                logger.info("[%s] 触发频率限制，等待 %.2f 秒...", provider.name, wait_time)
                 time.sleep(wait_time)
         
         self._last_request_time[provider.name] = time.time()
@@ -317,7 +322,7 @@ class ModelRouter:
                     "Content-Type": "application/json"
                 }
                 
-                response = requests.post(
+                response = self.session.post(
                     base_url,
                     headers=headers,
                     json=payload,
@@ -337,10 +342,10 @@ class ModelRouter:
 
                 # 检查是否因长度限制被截断
                 if finish_reason == "length":
-                    logger.warning(f"[{provider.name}] 警告: 响应因max_tokens限制被截断! 当前max_tokens={payload.get('max_tokens', provider.max_tokens)}")
-                    logger.warning(f"[{provider.name}] 建议增加max_tokens配置以获得完整响应")
+                    logger.warning("[%s] 警告: 响应因max_tokens限制被截断! 当前max_tokens=%s", provider.name, payload.get('max_tokens', provider.max_tokens))
+                    logger.warning("[%s] 建议增加max_tokens配置以获得完整响应", provider.name)
 
-                logger.debug(f"[{provider.name}] 生成完成，长度: {len(result)} 字符, finish_reason: {finish_reason}")
+                logger.debug("[%s] 生成完成，长度: %s 字符, finish_reason: %s", provider.name, len(result), finish_reason)
                 return result
                 
             except (requests.exceptions.ConnectionError, 
@@ -348,10 +353,10 @@ class ModelRouter:
                     requests.exceptions.ChunkedEncodingError) as e:
                 if attempt < max_retries - 1:
                     wait_time = retry_delay * (2 ** attempt)
-                    logger.warning(f"[{provider.name}] 连接失败 (尝试 {attempt+1}/{max_retries})，{wait_time}秒后重试...")
+                    logger.warning("[%s] 连接失败 (尝试 %s/%s)，%s秒后重试...", provider.name, attempt + 1, max_retries, wait_time)
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"[{provider.name}] 连接失败，已达最大重试次数")
+                    logger.error("[%s] 连接失败，已达最大重试次数", provider.name)
                     raise
             except requests.exceptions.HTTPError as e:
                 # 特别处理429频率限制错误
@@ -363,16 +368,16 @@ class ModelRouter:
                             wait_time = int(retry_after)
                         else:
                             wait_time = 60 * (2 ** attempt)  # 60秒起步，指数增长
-                        logger.warning(f"[{provider.name}] 触发频率限制(429) (尝试 {attempt+1}/{max_retries})，等待 {wait_time}秒后重试...")
+                        logger.warning("[%s] 触发频率限制(429) (尝试 %s/%s)，等待 %s秒后重试...", provider.name, attempt + 1, max_retries, wait_time)
                         time.sleep(wait_time)
                     else:
-                        logger.error(f"[{provider.name}] 频率限制(429)，已达最大重试次数。请稍后再试或检查API配额。")
+                        logger.error("[%s] 频率限制(429)，已达最大重试次数。请稍后再试或检查API配额。", provider.name)
                         raise
                 else:
-                    logger.error(f"[{provider.name}] HTTP错误: {e.response.status_code}")
+                    logger.error("[%s] HTTP错误: %s", provider.name, e.response.status_code)
                     raise
             except Exception as e:
-                logger.error(f"[{provider.name}] API调用失败: {str(e)}")
+                logger.error("[%s] API调用失败: %s", provider.name, str(e))
                 raise
     
     def update_provider_config(self, provider_name: str, **kwargs):
@@ -385,7 +390,7 @@ class ModelRouter:
             if hasattr(provider, key):
                 setattr(provider, key, value)
         
-        logger.info(f"[{provider_name}] 配置已更新: {kwargs}")
+        logger.info("[%s] 配置已更新: %s", provider_name, kwargs)
     
     def list_providers(self) -> List[Dict[str, Any]]:
         """列出所有提供商信息"""
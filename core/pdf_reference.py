@@ -24,7 +24,7 @@ class PDFReferenceManager:
         self.documents = []
         
         if not os.path.exists(pdf_folder_path):
-            logger.warning(f"PDF文件夹不存在: {pdf_folder_path}")
+            logger.warning("PDF文件夹不存在: %s", pdf_folder_path)
             return
         
         self._load_pdfs()
@@ -35,7 +35,7 @@ class PDFReferenceManager:
             logger.error("未安装PyPDF2，无法解析PDF。请运行：pip install PyPDF2")
             return
         
-        logger.info(f"开始加载PDF文件: {self.pdf_folder}")
+        logger.info("开始加载PDF文件: %s", self.pdf_folder)
         
         pdf_count = 0
         for filename in os.listdir(self.pdf_folder):
@@ -52,7 +52,7 @@ class PDFReferenceManager:
                     })
                     pdf_count += 1
         
-        logger.info(f"PDF加载完成: {pdf_count} 个文件，共 {sum(len(d['snippets']) for d in self.documents)} 个片段")
+        logger.info("PDF加载完成: %s 个文件，共 %s 个片段", pdf_count, sum((len(d['snippets']) for d in self.documents)))
     
     def _extract_pdf_text(self, filepath):
         """提取PDF文本内容"""
@@ -65,10 +65,10 @@ class PDFReferenceManager:
                     if page_text:
                         text += page_text + "\n\n"
                 
-                logger.debug(f"成功提取PDF: {filepath} ({len(text)} 字符)")
+                logger.debug("成功提取PDF: %s (%s 字符)", filepath, len(text))
                 return text.strip()
         except Exception as e:
-            logger.error(f"PDF解析失败 {filepath}: {e}")
+            logger.error("PDF解析失败 %s: %s", filepath, e)
             return ""
     
     def _split_into_snippets(self, content, snippet_length=500):
@@ -125,7 +125,7 @@ class PDFReferenceManager:
         # 返回topK
         results = all_snippets[:top_k]
         
-        logger.debug(f"PDF检索: 查询='{query[:50]}...', 找到{len(results)}个相关片段")
+        logger.debug("PDF检索: 查询='%s...', 找到%s个相关片段", query[:50], len(results))
         return [r['content'] for r in results]
     
     def _keyword_match_score(self, query, text):
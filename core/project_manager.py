@@ -18,7 +18,7 @@ class ProjectLiteratureManager:
         """
         self.base_dir = base_dir
         os.makedirs(base_dir, exist_ok=True)
-        logger.info(f"项目文献池管理器初始化: {base_dir}")
+        logger.info("项目文献池管理器初始化: %s", base_dir)
     
     def create_project(self, project_name):
         """
@@ -42,7 +42,7 @@ class ProjectLiteratureManager:
         os.makedirs(os.path.join(project_path, "pdfs"), exist_ok=True)
         os.makedirs(os.path.join(project_path, "output"), exist_ok=True)
         
-        logger.info(f"创建项目: {project_id}")
+        logger.info("创建项目: %s", project_id)
         return project_path
     
     def save_literature_txt(self, project_path, uploaded_file_path):
@@ -64,7 +64,7 @@ class ProjectLiteratureManager:
         # 复制文件
         shutil.copy2(uploaded_file_path, target_path)
         
-        logger.info(f"文献池已保存: {target_path}")
+        logger.info("文献池已保存: %s", target_path)
         return target_path
     
     def get_literature_pool_path(self, project_path):
@@ -26,7 +26,7 @@ class SemanticRetriever:
             logger.warning("文献池为空，跳过语义模型加载和索引构建")
             return
 
-        logger.info(f"加载语义模型: {model_name}")
+        logger.info("加载语义模型: %s", model_name)
         self.model = SentenceTransformer(model_name)
         
         self._build_index()
@@ -36,7 +36,7 @@ class SemanticRetriever:
         if not self.pool:
             return
             
-        logger.info(f"开始构建FAISS索引，文献数量: {len(self.pool)}")
+        logger.info("开始构建FAISS索引，文献数量: %s", len(self.pool))
         
         # 组合标题和摘要作为检索文本
         texts = [f"{lit['title']} {lit['abstract']}" for lit in self.pool]
@@ -53,7 +53,7 @@ class SemanticRetriever:
         self.index = faiss.IndexFlatIP(dimension)  # 内积相似度（归一化后等于余弦相似度）
         self.index.add(self.embeddings)
         
-        logger.info(f"FAISS索引构建完成，维度: {dimension}")
+        logger.info("FAISS索引构建完成，维度: %s", dimension)
     
     def search(self, query, top_k=5, threshold=0.05):
         """
@@ -97,7 +97,7 @@ class SemanticRetriever:
         
         # [*] 如果严格过滤后无结果，降低标准重试（模糊匹配）
         if not results and indices[0].size > 0:
-            logger.info(f"严格检索无结果，使用模糊匹配模式")
+            logger.info("严格检索无结果，使用模糊匹配模式")
             # 选择相似度最高的未使用文献，无论阈值
             for dist, idx in zip(distances[0], indices[0]):
                 if not self.pool[idx]['used']:
@@ -109,9 +109,9 @@ class SemanticRetriever:
                     break  # 只取一个
         
         if results:
-            logger.debug(f"检索到 {len(results)} 条文献 (跳过已用{skipped_used}, 低相似{skipped_threshold})")
+            logger.debug("检索到 %s 条文献 (跳过已用%s, 低相似%s)", len(results), skipped_used, skipped_threshold)
         else:
-            logger.warning(f"查询'{query[:30]}...'无检索结果 (已用{skipped_used}, 低相似{skipped_threshold})")
+            logger.warning("查询'%s...'无检索结果 (已用%s, 低相似%s)", query[:30], skipped_used, skipped_threshold)
         
         return results
     
@@ -151,7 +151,7 @@ class SemanticRetriever:
             if len(results) >= top_k:
                 break
         
-        logger.debug(f"获取原始候选文献: {len(results)} 条 (查询: '{query[:30]}...')")
+        logger.debug("获取原始候选文献: %s 条 (查询: '%s...')", len(results), query[:30])
         return results
     
     def get_unused_count(self):
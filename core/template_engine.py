@@ -34,7 +34,7 @@ class TemplateEngine:
         
         # 加载模板
         self.template = self._load_template()
-        logger.info(f"模板引擎初始化: {self.template['template_name']}")
+        logger.info("模板引擎初始化: %s", self.template['template_name'])
     
     def _load_template(self):
         """加载YAML模板"""
@@ -99,7 +99,7 @@ class TemplateEngine:
                 'sections', 'v1'
             )
         os.makedirs(sections_folder, exist_ok=True)
-        logger.info(f"章节保存目录: {sections_folder}")
+        logger.info("章节保存目录: %s", sections_folder)
         
         # 获取用户确认的大纲数据
         outline_data = self.project_context.get('outline_data', None)
@@ -125,7 +125,7 @@ class TemplateEngine:
         intro_title = intro.get('title', '一、引言')
         intro_idea = intro.get('idea', '')
         
-        logger.info(f"生成引言: {intro_title}")
+        logger.info("生成引言: %s", intro_title)
         report_progress(30, f"生成引言: {intro_title[:20]}")
         # [*] 设置当前章节为引言
         self.citation_mgr.set_current_section('introduction')
@@ -147,7 +147,7 @@ class TemplateEngine:
             chapter_title = chapter.get('title', f'{["二", "三", "四"][ch_idx]}、研究维度{ch_idx+1}')
             subsections = chapter.get('subsections', [])
             
-            logger.info(f"生成主体章节 {ch_idx+1}: {chapter_title}")
+            logger.info("生成主体章节 %s: %s", ch_idx + 1, chapter_title)
             
             chapter_header = f"## {chapter_title}"
             chapter_parts = [chapter_header]
@@ -160,7 +160,7 @@ class TemplateEngine:
                 sub_num = chinese_nums[sub_idx] if sub_idx < len(chinese_nums) else str(sub_idx + 1)
                 sub_header = f"### （{sub_num}）{sub_title}"
                 
-                logger.info(f"  生成二级标题 {sub_idx+1}: {sub_title}")
+                logger.info("  生成二级标题 %s: %s", sub_idx + 1, sub_title)
                 
                 # 计算当前进度: 引言(30%) + 章节(30%-60%) = 30% + (ch_idx*3 + sub_idx + 1) / 9 * 30%
                 section_progress = 30 + int((ch_idx * 3 + sub_idx + 1) / 9 * 30)
@@ -174,10 +174,10 @@ class TemplateEngine:
                     
                     # 验证内容非空
                     if not sub_text or len(sub_text.strip()) < 50:
-                        logger.error(f"二级标题 '{sub_title}' 生成内容过短或为空，使用回退内容")
+                        logger.error("二级标题 '%s' 生成内容过短或为空，使用回退内容", sub_title)
                         sub_text = f'本节围绕"{sub_title}"展开论述。{sub_idea if sub_idea else ""}'
                 except Exception as e:
-                    logger.error(f"生成二级标题 '{sub_title}' 时发生异常: {e}")
+                    logger.error("生成二级标题 '%s' 时发生异常: %s", sub_title, e)
                     sub_text = f'[内容生成异常: {str(e)[:100]}] 本节主题：{sub_title}'
                 
                 # 保存每个二级标题为单独的MD文件
@@ -197,7 +197,7 @@ class TemplateEngine:
                     'header': sub_header,
                     'path': md_path
                 })
-                logger.info(f"    保存: {md_filename}")
+                logger.info("    保存: %s", md_filename)
                 file_index += 1
                 
                 chapter_parts.append(sub_header)
@@ -212,7 +212,7 @@ class TemplateEngine:
         concl_title = conclusion.get('title', '结论')
         concl_idea = conclusion.get('idea', '')
         
-        logger.info(f"生成结论: {concl_title}")
+        logger.info("生成结论: %s", concl_title)
         report_progress(62, f"生成结论: {concl_title[:15]}")
         # [*] 设置当前章节为结论（配额为0，不添加新引用）
         self.citation_mgr.set_current_section('conclusion')
@@ -232,8 +232,7 @@ class TemplateEngine:
         # [*] 新增：在生成参考文献前，同步正文中的引用与citation_tracker
         full_body_text = "\n\n".join(body_sections)
         sync_report = self.citation_mgr.sync_with_text(full_body_text)
-        logger.info(f"引用同步报告: 正文引用{len(sync_report['text_citations'])}个, "
-                   f"匹配{len(sync_report['matched'])}个, 缺失{len(sync_report.get('missing', []))}个")
+        logger.info("引用同步报告: 正文引用%s个, 匹配%s个, 缺失%s个", len(sync_report['text_citations']), len(sync_report['matched']), len(sync_report.get('missing', [])))
         
         references = self.citation_mgr.generate_reference_list()
         # [*] 确保参考文献始终保存，即使为空也创建占位
@@ -244,7 +243,7 @@ class TemplateEngine:
         with open(ref_path, 'w', encoding='utf-8') as f:
             f.write(ref_text)
         saved_md_files.append({'index': file_index, 'type': 'references', 'title': '参考文献', 'path': ref_path})
-        logger.info(f"保存参考文献: {ref_path} ({len(references) if references else 0}字)")
+        logger.info("保存参考文献: %s (%s字)", ref_path, len(references) if references else 0)
         
         # ===== 5. 生成摘要 (基于全文) =====
         full_body_text = "\n\n".join(body_sections)
@@ -269,7 +268,7 @@ class TemplateEngine:
         # 组合完整论文
         paper = "\n\n".join(sections_content)
         
-        logger.info(f"论文生成完成，共保存 {len(saved_md_files)} 个MD文件")
+        logger.info("论文生成完成，共保存 %s 个MD文件", len(saved_md_files))
         return paper
     
     def _generate_introduction(self, title, idea):
@@ -295,9 +294,9 @@ class TemplateEngine:
         # 验证结果
         cleaned_result = self._clean_ai_artifacts(result)
         if not cleaned_result or len(cleaned_result.strip()) < 100:
-            logger.warning(f"引言生成结果过短或为空(raw_len={len(result) if result else 0}, cleaned_len={len(cleaned_result) if cleaned_result else 0})，尝试重试...")
+            logger.warning("引言生成结果过短或为空(raw_len=%s, cleaned_len=%s)，尝试重试...", len(result) if result else 0, len(cleaned_result) if cleaned_result else 0)
             if result:
-                logger.debug(f"Raw Result Preview: {result[:200]}...")
+                logger.debug("Raw Result Preview: %s...", result[:200])
             retry_prompt = prompt + "\n\n【警告】上次生成的内容为空，请务必输出详细的引言内容！"
             result = self.router.generate(retry_prompt, context="你是学术论文写作专家", max_tokens=8000)
             cleaned_result = self._clean_ai_artifacts(result)
@@ -400,7 +399,7 @@ class TemplateEngine:
             
             if section.get('dynamic', False):
                 # 这是一个动态章节，需要AI设计框架
-                logger.info(f"处理动态章节: {section['title']}")
+                logger.info("处理动态章节: %s", section['title'])
                 
                 # 获取框架
                 framework = self._get_dynamic_framework(section)
@@ -452,7 +451,7 @@ class TemplateEngine:
                                 'sub_num': sub_num       # [*] 保存序号
                             })
                         expanded_section['paragraphs'] = paragraphs
-                        logger.info(f"  已为 '{l1_title}' 生成 {len(paragraphs)} 个二级标题任务")
+                        logger.info("  已为 '%s' 生成 %s 个二级标题任务", l1_title, len(paragraphs))
                     else:
                         #以此类推
                         pass
@@ -489,7 +488,7 @@ class TemplateEngine:
         # 解析响应（假设格式：维度1: xxx\n概要: xxx\n\n维度2: ...）
         framework = self._parse_framework_response(response, section.get('expand_count', 4))
         
-        logger.info(f"框架生成完成: {len(framework)} 个子章节")
+        logger.info("框架生成完成: %s 个子章节", len(framework))
         return framework
 
     def _parse_framework_response(self, response, count):
@@ -616,9 +615,9 @@ class TemplateEngine:
 
                 if search_results:
                     search_context = self.web_search.format_results_as_context(search_results) + "\n\n"
-                    logger.info(f"已添加网络检索上下文")
+                    logger.info("已添加网络检索上下文")
             except Exception as e:
-                logger.warning(f"网络检索失败: {e}")
+                logger.warning("网络检索失败: %s", e)
         
         # 阶段1: 生成句子骨架与检索查询
         skeleton_prompt = f"""{additional_context}{search_context}
@@ -645,11 +644,11 @@ class TemplateEngine:
             self._format_context_string(),
             node_id=node_id
         )
-        logger.debug(f"骨架生成原始响应:\n{skeleton_response}")
+        logger.debug("骨架生成原始响应:\n%s", skeleton_response)
         
         # 验证骨架响应不为空
         if not skeleton_response or len(skeleton_response.strip()) < 50:
-            logger.warning(f"骨架生成响应过短或为空，使用直接生成模式")
+            logger.warning("骨架生成响应过短或为空，使用直接生成模式")
             # 直接生成模式：跳过骨架+引用流程
             direct_prompt = f"""{additional_context}
 
@@ -674,7 +673,7 @@ class TemplateEngine:
         
         # 验证解析结果
         if not sentences_and_queries:
-            logger.warning(f"骨架解析失败，使用直接输出模式")
+            logger.warning("骨架解析失败，使用直接输出模式")
             # 直接使用AI响应，清理后返回（去除假引用）
             cleaned = self._clean_ai_artifacts(skeleton_response)
             return self._remove_fake_citations(cleaned)
@@ -692,7 +691,7 @@ class TemplateEngine:
         
         # 最终验证：确保输出不为空
         if not paragraph_draft or len(paragraph_draft.strip()) < 50:
-            logger.warning(f"段落生成结果过短，使用骨架响应作为回退")
+            logger.warning("段落生成结果过短，使用骨架响应作为回退")
             cleaned = self._clean_ai_artifacts(skeleton_response)
             return self._remove_fake_citations(cleaned)
         
@@ -724,7 +723,7 @@ class TemplateEngine:
                 expanded_paragraphs.append(para)
                 continue
                 
-            logger.info(f"正在执行终极扩写 {idx+1}/{total} (原长: {len(para)})")
+            logger.info("正在执行终极扩写 %s/%s (原长: %s)", idx + 1, total, len(para))
             
             prompt = f"""【这里是需要优化的段落】
 {para}
@@ -748,7 +747,7 @@ class TemplateEngine:
                 else:
                     expanded_paragraphs.append(para)
             except Exception as e:
-                logger.error(f"段落扩写失败: {e}")
+                logger.error("段落扩写失败: %s", e)
                 expanded_paragraphs.append(para)
                 
         return "\n\n".join(expanded_paragraphs)
@@ -803,7 +802,7 @@ class TemplateEngine:
                 if clean_s:
                     sentences_and_queries.append((clean_s + '。', clean_s))
         
-        logger.debug(f"骨架解析: 提取到 {len(sentences_and_queries)} 个句子对")
+        logger.debug("骨架解析: 提取到 %s 个句子对", len(sentences_and_queries))
         return sentences_and_queries
 
     def _parse_paper_into_sections(self, paper_text):
@@ -935,12 +934,12 @@ class TemplateEngine:
                 
                 if content and len(content) > 10:
                     result['references'] = {'title': title, 'content': content, 'type': 'references'}
-                    logger.info(f"兜底提取成功: {len(content)}字")
+                    logger.info("兜底提取成功: %s字", len(content))
 
         # Debug: Log parsed structure summary
-        logger.debug(f"解析结果: Section count={len(result['sections'])}")
+        logger.debug("解析结果: Section count=%s", len(result['sections']))
         if result['references']:
-            logger.debug(f"参考文献解析: Title='{result['references']['title']}', Content Length={len(result['references']['content'])}")
+            logger.debug("参考文献解析: Title='%s', Content Length=%s", result['references']['title'], len(result['references']['content']))
             if not result['references']['content']:
                 logger.warning("参考文献内容为空！")
         else:
@@ -960,7 +959,7 @@ class TemplateEngine:
         logger.info("="*60)
         
         original_length = len(paper_text)
-        logger.info(f"原始论文长度: {original_length}字")
+        logger.info("原始论文长度: %s字", original_length)
         
         # 解析论文结构
         parsed = self._parse_paper_into_sections(paper_text)
@@ -968,7 +967,7 @@ class TemplateEngine:
         # 统计解析结果
         section_count = len(parsed['sections'])
         subsection_count = sum(len(s.get('subsections', [])) for s in parsed['sections'])
-        logger.info(f"解析结果: {section_count}个一级章节, {subsection_count}个二级章节")
+        logger.info("解析结果: %s个一级章节, %s个二级章节", section_count, subsection_count)
         
         if section_count == 0:
             logger.warning("未找到章节结构，跳过优化")
@@ -980,13 +979,13 @@ class TemplateEngine:
         title_match = re.search(r'^(#\s+[^#\n]+)', paper_text, re.MULTILINE)
         if title_match:
             optimized_parts.append(title_match.group(1).strip())
-            logger.info(f"保留标题: {title_match.group(1)[:30]}...")
+            logger.info("保留标题: %s...", title_match.group(1)[:30])
         
         # 2. 摘要保持不变 (遍历所有摘要类章节)
         if parsed.get('abstracts'):
             for abs_sec in parsed['abstracts']:
                 optimized_parts.append(f"## {abs_sec['title']}\n\n{abs_sec['content']}")
-            logger.info(f"摘要/关键词 ({len(parsed['abstracts'])}个) - 保持不变")
+            logger.info("摘要/关键词 (%s个) - 保持不变", len(parsed['abstracts']))
         
         # 3. 优化每个主体章节（保留标题，只优化内容）
         # [*] 关键修改：从"引言"章节开始优化，之前的内容保持不变
@@ -998,10 +997,10 @@ class TemplateEngine:
             if not found_introduction:
                 if '引言' in section_title or 'Introduction' in section_title or section_title.startswith('一'):
                     found_introduction = True
-                    logger.info(f"从此章节开始优化: {section_title}")
+                    logger.info("从此章节开始优化: %s", section_title)
                 else:
                     # 引言之前的章节保持不变（可能是被误识别的摘要等）
-                    logger.info(f"跳过优化（引言之前）: {section_title}")
+                    logger.info("跳过优化（引言之前）: %s", section_title)
                     content = section.get('content', '')
                     if content:
                         optimized_parts.append(f"## {section_title}\n\n{content}")
@@ -1009,7 +1008,7 @@ class TemplateEngine:
                         optimized_parts.append(f"## {section_title}")
                     continue
             
-            logger.info(f"处理章节: {section_title}")
+            logger.info("处理章节: %s", section_title)
             
             section_parts = [f"## {section_title}"]  # 保留原始标题
             
@@ -1021,7 +1020,7 @@ class TemplateEngine:
                     
                     # 保留原始二级标题
                     if sub_content and len(sub_content) > 100:
-                        logger.info(f"  优化: ### {sub_title[:20]}... ({len(sub_content)}字)")
+                        logger.info("  优化: ### %s... (%s字)", sub_title[:20], len(sub_content))
                         # 只发送内容给AI，不包含标题
                         optimized_content = self._optimize_content_only(sub_content, sub_title)
                         section_parts.append(f"### {sub_title}\n\n{optimized_content}")
@@ -1031,7 +1030,7 @@ class TemplateEngine:
                 # 无二级标题（引言、结论等）
                 content = section.get('content', '')
                 if content and len(content) > 100:
-                    logger.info(f"  优化内容: ({len(content)}字)")
+                    logger.info("  优化内容: (%s字)", len(content))
                     optimized_content = self._optimize_content_only(content, section_title)
                     section_parts.append(optimized_content)
                 else:
@@ -1048,12 +1047,12 @@ class TemplateEngine:
             ref_content = parsed['references']['content']
             # 如果有缺失的引用，尝试从citation_mgr补充
             if sync_report.get('missing_in_refs'):
-                logger.warning(f"正文中有引用未在参考文献中找到: {sync_report['missing_in_refs']}")
+                logger.warning("正文中有引用未在参考文献中找到: %s", sync_report['missing_in_refs'])
                 # 尝试从citation_mgr获取补充
                 supplemental_refs = self._get_supplemental_references(sync_report['missing_in_refs'])
                 if supplemental_refs:
                     ref_content = ref_content + '\n\n' + supplemental_refs
-                    logger.info(f"已补充 {len(sync_report['missing_in_refs'])} 条参考文献")
+                    logger.info("已补充 %s 条参考文献", len(sync_report['missing_in_refs']))
             
             optimized_parts.append(f"## {parsed['references']['title']}\n\n{ref_content}")
             logger.info("参考文献 - 验证同步完成")
@@ -1064,7 +1063,7 @@ class TemplateEngine:
         if hasattr(self, 'citation_mgr') and self.citation_mgr:
             result = self.citation_mgr.validate_and_fix_distribution(result)
         
-        logger.info(f"V2优化完成: {original_length}字 -> {len(result)}字")
+        logger.info("V2优化完成: %s字 -> %s字", original_length, len(result))
         
         return result
     
@@ -1122,18 +1121,18 @@ class TemplateEngine:
                 # [*] 移除引用验证 - 优化阶段的引用都是初稿阶段生成的合法引用
                 
                 if 0.7 <= ratio <= 100.0 and not has_english and not has_lazy and result:
-                    logger.info(f"    [OK] 优化成功 ({original_length}字 -> {result_length}字)")
+                    logger.info("    [OK] 优化成功 (%s字 -> %s字)", original_length, result_length)
                     # [*] 清理AI可能编造的虚假引用
                     result = self._remove_fake_citations(result)
                     return result
                 else:
-                    logger.warning(f"    [FAIL] 尝试{attempt}失败 (比例={ratio:.1f}, 英文={has_english}, 占位符={has_lazy})")
+                    logger.warning("    [FAIL] 尝试%s失败 (比例=%.1f, 英文=%s, 占位符=%s)", attempt, ratio, has_english, has_lazy)
                     
             except Exception as e:
-                logger.error(f"    优化失败: {e}")
+                logger.error("    优化失败: %s", e)
         
         # 所有尝试失败，返回原文
-        logger.warning(f"    所有尝试失败，保留原文")
+        logger.warning("    所有尝试失败，保留原文")
         return content
     
     def _optimize_whole_body(self, body_text, attempt=1):
@@ -1182,7 +1181,7 @@ class TemplateEngine:
             return None
             
         except Exception as e:
-            logger.error(f"优化失败: {e}")
+            logger.error("优化失败: %s", e)
             return None
 
     def _optimize_section_content(self, content, section_title):
@@ -1237,33 +1236,33 @@ class TemplateEngine:
             import re
             english_pattern = r'[A-Za-z]{3,}(?:\s+[A-Za-z]{3,}){19,}'
             if re.search(english_pattern, result):
-                logger.warning(f"优化结果包含大量英文内容，保留原文")
+                logger.warning("优化结果包含大量英文内容，保留原文")
                 return content
             
             # 检测是否包含省略标记
             lazy_patterns = ['【后续内容保持不变】', '【其他内容', '...省略', '（略）', '此处省略', '[省略]']
             for lazy_pattern in lazy_patterns:
                 if lazy_pattern in result:
-                    logger.warning(f"优化结果包含省略标记'{lazy_pattern}'，保留原文")
+                    logger.warning("优化结果包含省略标记'%s'，保留原文", lazy_pattern)
                     return content
             
             # [*] 移除引用验证 - 优化阶段的引用是初稿生成的合法引用
 
             # 验证内容完整性：优化后不应该明显变短
             if len(result) < original_length * 0.7:
-                logger.warning(f"优化后内容过短（原{original_length}字 -> 现{len(result)}字），保留原文")
+                logger.warning("优化后内容过短（原%s字 -> 现%s字），保留原文", original_length, len(result))
                 return content
             
             # 验证结果不为空
             if not result or len(result.strip()) < 100:
-                logger.warning(f"优化结果为空或过短，保留原文")
+                logger.warning("优化结果为空或过短，保留原文")
                 return content
             
-            logger.info(f"  章节优化完成: {original_length}字 -> {len(result)}字")
+            logger.info("  章节优化完成: %s字 -> %s字", original_length, len(result))
             return result
             
         except Exception as e:
-            logger.error(f"章节优化失败: {e}")
+            logger.error("章节优化失败: %s", e)
             return content
 
     def _clean_ai_artifacts(self, text):
@@ -1361,7 +1360,7 @@ class TemplateEngine:
                 if clean_first and clean_second and (clean_first == clean_second or clean_first in clean_second or clean_second in clean_first):
                     lines = [lines[0]] + lines[2:]
                     text = '\n'.join(lines)
-                    logger.debug(f"移除了重复的标题行: {clean_second[:30]}...")
+                    logger.debug("移除了重复的标题行: %s...", clean_second[:30])
         
         if not text.strip() and len(original_text) > 50:
             logger.warning("清理后内容为空但原始内容较长，可能清理过度，回退到原始内容")
@@ -1388,7 +1387,7 @@ class TemplateEngine:
             if num in valid_nums:
                 return match.group(0)  # 保留合法引用
             else:
-                logger.debug(f"移除假引用: [{num}]")
+                logger.debug("移除假引用: [%s]", num)
                 return ""  # 移除非法引用
         
         # 替换所有[N]格式引用
@@ -1477,12 +1476,12 @@ class TemplateEngine:
         
         # 4. 日志记录
         if report['missing_in_refs']:
-            logger.warning(f"引用一致性检查: 正文中{len(report['missing_in_refs'])}个引用未在参考文献中: {sorted(report['missing_in_refs'])}")
+            logger.warning("引用一致性检查: 正文中%s个引用未在参考文献中: %s", len(report['missing_in_refs']), sorted(report['missing_in_refs']))
         if report['unused_in_text']:
-            logger.info(f"引用一致性检查: 参考文献中{len(report['unused_in_text'])}个条目未在正文使用: {sorted(report['unused_in_text'])}")
+            logger.info("引用一致性检查: 参考文献中%s个条目未在正文使用: %s", len(report['unused_in_text']), sorted(report['unused_in_text']))
         
         if not report['missing_in_refs'] and not report['unused_in_text']:
-            logger.info(f"引用一致性检查: 完全匹配 ({len(text_citation_nums)}个引用)")
+            logger.info("引用一致性检查: 完全匹配 (%s个引用)", len(text_citation_nums))
         
         return report
     
@@ -1517,7 +1516,7 @@ class TemplateEngine:
                     full_cit = lit.get('full_citation', '')
                     clean_cit = re.sub(r'^\[\d+\]\s*', '', full_cit)
                     supplemental.append(f"[{num}] {clean_cit}")
-                    logger.info(f"  补充参考文献[{num}]: {clean_cit[:50]}...")
+                    logger.info("  补充参考文献[%s]: %s...", num, clean_cit[:50])
         
         return '\n\n'.join(supplemental)
 
@@ -1533,7 +1532,7 @@ class TemplateEngine:
         logger.info("="*60)
         
         original_length = len(paper_text)
-        logger.info(f"原始论文长度: {original_length}字")
+        logger.info("原始论文长度: %s字", original_length)
         
         # 解析论文结构
         parsed = self._parse_paper_into_sections(paper_text)
@@ -1541,7 +1540,7 @@ class TemplateEngine:
         # 统计解析结果
         section_count = len(parsed['sections'])
         subsection_count = sum(len(s.get('subsections', [])) for s in parsed['sections'])
-        logger.info(f"解析结果: {section_count}个一级章节, {subsection_count}个二级章节")
+        logger.info("解析结果: %s个一级章节, %s个二级章节", section_count, subsection_count)
         
         if section_count == 0:
             logger.warning("未找到章节结构，跳过扩写")
@@ -1553,13 +1552,13 @@ class TemplateEngine:
         title_match = re.search(r'^(#\s+[^#\n]+)', paper_text, re.MULTILINE)
         if title_match:
             expanded_parts.append(title_match.group(1).strip())
-            logger.info(f"保留标题: {title_match.group(1)[:30]}...")
+            logger.info("保留标题: %s...", title_match.group(1)[:30])
         
         # 2. 摘要保持不变 (遍历所有)
         if parsed.get('abstracts'):
             for abs_sec in parsed['abstracts']:
                 expanded_parts.append(f"## {abs_sec['title']}\n\n{abs_sec['content']}")
-            logger.info(f"摘要/关键词 ({len(parsed['abstracts'])}个) - 保持不变")
+            logger.info("摘要/关键词 (%s个) - 保持不变", len(parsed['abstracts']))
         
         # 3. 扩写每个主体章节（保留标题，只扩写内容）
         # [*] 关键修改：从"引言"章节开始扩写，之前的内容保持不变
@@ -1571,10 +1570,10 @@ class TemplateEngine:
             if not found_introduction:
                 if '引言' in section_title or 'Introduction' in section_title or section_title.startswith('一'):
                     found_introduction = True
-                    logger.info(f"从此章节开始扩写: {section_title}")
+                    logger.info("从此章节开始扩写: %s", section_title)
                 else:
                     # 引言之前的章节保持不变（可能是被误识别的摘要等）
-                    logger.info(f"跳过扩写（引言之前）: {section_title}")
+                    logger.info("跳过扩写（引言之前）: %s", section_title)
                     content = section.get('content', '')
                     if content:
                         expanded_parts.append(f"## {section_title}\n\n{content}")
@@ -1582,7 +1581,7 @@ class TemplateEngine:
                         expanded_parts.append(f"## {section_title}")
                     continue
             
-            logger.info(f"处理章节: {section_title}")
+            logger.info("处理章节: %s", section_title)
             
             section_parts = [f"## {section_title}"]  # 保留原始标题
             
@@ -1594,7 +1593,7 @@ class TemplateEngine:
                     
                     # 保留原始二级标题
                     if sub_content and len(sub_content) > 100:
-                        logger.info(f"  扩写: ### {sub_title[:20]}... ({len(sub_content)}字)")
+                        logger.info("  扩写: ### %s... (%s字)", sub_title[:20], len(sub_content))
                         # 只发送内容给AI，不包含标题
                         expanded_content = self._expand_content_only(sub_content, sub_title)
                         section_parts.append(f"### {sub_title}\n\n{expanded_content}")
@@ -1604,7 +1603,7 @@ class TemplateEngine:
                 # 无二级标题（引言、结论等）
                 content = section.get('content', '')
                 if content and len(content) > 100:
-                    logger.info(f"  扩写内容: ({len(content)}字)")
+                    logger.info("  扩写内容: (%s字)", len(content))
                     expanded_content = self._expand_content_only(content, section_title)
                     section_parts.append(expanded_content)
                 else:
@@ -1621,11 +1620,11 @@ class TemplateEngine:
             ref_content = parsed['references']['content']
             # 如果有缺失的引用，尝试从citation_mgr补充
             if sync_report.get('missing_in_refs'):
-                logger.warning(f"正文中有引用未在参考文献中找到: {sync_report['missing_in_refs']}")
+                logger.warning("正文中有引用未在参考文献中找到: %s", sync_report['missing_in_refs'])
                 supplemental_refs = self._get_supplemental_references(sync_report['missing_in_refs'])
                 if supplemental_refs:
                     ref_content = ref_content + '\n\n' + supplemental_refs
-                    logger.info(f"已补充 {len(sync_report['missing_in_refs'])} 条参考文献")
+                    logger.info("已补充 %s 条参考文献", len(sync_report['missing_in_refs']))
             
             expanded_parts.append(f"## {parsed['references']['title']}\n\n{ref_content}")
             logger.info("参考文献 - 验证同步完成")
@@ -1636,7 +1635,7 @@ class TemplateEngine:
         if hasattr(self, 'citation_mgr') and self.citation_mgr:
             result = self.citation_mgr.validate_and_fix_distribution(result)
         
-        logger.info(f"V3扩写完成: {original_length}字 -> {len(result)}字")
+        logger.info("V3扩写完成: %s字 -> %s字", original_length, len(result))
         
         return result
     
@@ -1698,16 +1697,16 @@ class TemplateEngine:
 
                 # 扩写后应该变长（至少100%）
                 if ratio >= 1.0 and not has_english and not has_lazy and result:
-                    logger.info(f"    [OK] 扩写成功 ({original_length}字 -> {result_length}字, +{(ratio-1)*100:.0f}%)")
+                    logger.info("    [OK] 扩写成功 (%s字 -> %s字, +%.0f%%)", original_length, result_length, (ratio - 1) * 100)
                     return result
                 else:
-                    logger.warning(f"    [FAIL] 尝试{attempt}失败 (比例={ratio:.1f}, 英文={has_english}, 占位符={has_lazy})")
+                    logger.warning("    [FAIL] 尝试%s失败 (比例=%.1f, 英文=%s, 占位符=%s)", attempt, ratio, has_english, has_lazy)
                     
             except Exception as e:
-                logger.error(f"    扩写失败: {e}")
+                logger.error("    扩写失败: %s", e)
         
         # 所有尝试失败，返回原文
-        logger.warning(f"    所有尝试失败，保留原文")
+        logger.warning("    所有尝试失败，保留原文")
         return content
     
     def _expand_whole_body(self, body_text, attempt=1):
@@ -1754,7 +1753,7 @@ class TemplateEngine:
             return None
             
         except Exception as e:
-            logger.error(f"扩写失败: {e}")
+            logger.error("扩写失败: %s", e)
             return None
 
     def _expand_section_content(self, content, section_title):
@@ -1807,30 +1806,30 @@ class TemplateEngine:
             import re
             english_pattern = r'[A-Za-z]{3,}(?:\s+[A-Za-z]{3,}){19,}'
             if re.search(english_pattern, result):
-                logger.warning(f"扩写结果包含大量英文内容，保留原文")
+                logger.warning("扩写结果包含大量英文内容，保留原文")
                 return content
             
             # 检测是否包含省略标记
             lazy_patterns = ['【后续内容保持不变】', '【其他内容', '...省略', '（略）', '此处省略', '[省略]']
             for lazy_pattern in lazy_patterns:
                 if lazy_pattern in result:
-                    logger.warning(f"扩写结果包含省略标记'{lazy_pattern}'，保留原文")
+                    logger.warning("扩写结果包含省略标记'%s'，保留原文", lazy_pattern)
                     return content
             
             # 验证扩写效果：扩写后应该变长（至少不能变短）
             if len(result) < original_length:
-                logger.warning(f"扩写后内容反而变短（原{original_length}字 -> 现{len(result)}字），保留原文")
+                logger.warning("扩写后内容反而变短（原%s字 -> 现%s字），保留原文", original_length, len(result))
                 return content
             
             # 验证结果不为空
             if not result or len(result.strip()) < 100:
-                logger.warning(f"扩写结果为空或过短，保留原文")
+                logger.warning("扩写结果为空或过短，保留原文")
                 return content
             
-            logger.info(f"  章节扩写完成: {original_length}字 -> {len(result)}字 (+{(len(result)/original_length-1)*100:.0f}%)")
+            logger.info("  章节扩写完成: %s字 -> %s字 (+%.0f%%)", original_length, len(result), (len(result) / original_length - 1) * 100)
             return result
             
         except Exception as e:
-            logger.error(f"章节扩写失败: {e}")
+            logger.error("章节扩写失败: %s", e)
             return content
 
@@ -61,7 +61,7 @@ class DuckDuckGoSearcher:
                 if results:
                     return results
             except Exception as e:
-                logger.warning(f"DDGS搜索失败: {e}, 尝试备用方案")
+                logger.warning("DDGS搜索失败: {}, 尝试备用方案", e)
         
         # 方案2: 使用httpx轻量级搜索
         try:
@@ -69,7 +69,7 @@ class DuckDuckGoSearcher:
             if results:
                 return results
         except Exception as e:
-            logger.warning(f"轻量级搜索失败: {e}, 尝试Playwright搜索")
+            logger.warning("轻量级搜索失败: {}, 尝试Playwright搜索", e)
         
         # 方案3: 回退到Playwright搜索
         return await self.search_playwright(query, max_results, region, time)
@@ -90,7 +90,7 @@ class DuckDuckGoSearcher:
                 ))
                 return search_results
             except Exception as e:
-                logger.warning(f"DDGS同步搜索异常: {e}")
+                logger.warning("DDGS同步搜索异常: {}", e)
                 return []
         
         loop = asyncio.get_event_loop()
@@ -103,7 +103,7 @@ class DuckDuckGoSearcher:
                 "snippet": r.get("body", r.get("snippet", ""))
             })
         
-        logger.info(f"DDGS搜索获取到 {len(results)} 条结果")
+        logger.info("DDGS搜索获取到 {} 条结果", len(results))
         return results
     
     async def search_lite(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -155,9 +155,9 @@ class DuckDuckGoSearcher:
                     except Exception as e:
                         continue
                 
-                logger.info(f"轻量级搜索获取到 {len(results)} 条结果")
+                logger.info("轻量级搜索获取到 {} 条结果", len(results))
         except Exception as e:
-            logger.warning(f"轻量级搜索请求失败: {e}")
+            logger.warning("轻量级搜索请求失败: {}", e)
         
         return results
     
@@ -197,7 +197,7 @@ class DuckDuckGoSearcher:
                 if time:
                     search_url += f"&df={time}"
                 
-                logger.info(f"搜索: {query}")
+                logger.info("搜索: {}", query)
                 await page.goto(search_url, wait_until="domcontentloaded", timeout=self.timeout)
                 
                 # 等待页面加载完成，尝试多个可能的选择器
@@ -214,7 +214,7 @@ class DuckDuckGoSearcher:
                     try:
                         await page.wait_for_selector(selector, timeout=8000)
                         result_found = True
-                        logger.info(f"使用选择器: {selector}")
+                        logger.info("使用选择器: {}", selector)
                         break
                     except:
                         continue
@@ -230,7 +230,7 @@ class DuckDuckGoSearcher:
                 # 限制结果数量
                 results = results[:max_results]
                 
-                logger.info(f"获取到 {len(results)} 条搜索结果")
+                logger.info("获取到 {} 条搜索结果", len(results))
                 return results
                 
             finally:
@@ -255,7 +255,7 @@ class DuckDuckGoSearcher:
         for selector in article_selectors:
             articles = await page.query_selector_all(selector)
             if articles:
-                logger.info(f"结果选择器 {selector} 找到 {len(articles)} 条")
+                logger.info("结果选择器 {} 找到 {} 条", selector, len(articles))
                 break
         
         if not articles:
@@ -312,7 +312,7 @@ class DuckDuckGoSearcher:
                         "snippet": snippet
                     })
             except Exception as e:
-                logger.warning(f"解析单个结果失败: {e}")
+                logger.warning("解析单个结果失败: {}", e)
                 continue
         
         return results
@@ -338,7 +338,7 @@ class DuckDuckGoSearcher:
             page = await context.new_page()
             
             try:
-                logger.info(f"深度抓取: {url}")
+                logger.info("深度抓取: {}", url)
                 await page.goto(url, wait_until="networkidle", timeout=self.timeout)
                 
                 # [*] 模拟滚动以触发懒加载
@@ -348,17 +348,17 @@ class DuckDuckGoSearcher:
                     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                     await page.wait_for_timeout(1000)
                 except Exception as e:
-                    logger.warning(f"滚动页面失败: {e}")
+                    logger.warning("滚动页面失败: {}", e)
                 
                 # 提取页面内容
                 content = await self._extract_page_content(page, extract_full_content)
                 content["url"] = url
                 
-                logger.info(f"抓取完成，内容长度: {len(content.get('content', ''))}")
+                logger.info("抓取完成，内容长度: {}", len(content.get('content', '')))
                 return content
                 
             except Exception as e:
-                logger.error(f"深度抓取失败 {url}: {e}")
+                logger.error("深度抓取失败 {}: {}", url, e)
                 return {
                     "url": url,
                     "title": "",
@@ -541,7 +541,7 @@ class WebSearchIntegration:
         
         self.searcher = DuckDuckGoSearcher(headless=self.headless) if self.enabled else None
         
-        logger.info(f"WebSearchIntegration 初始化: enabled={self.enabled}, mode={self.mode}")
+        logger.info("WebSearchIntegration 初始化: enabled={}, mode={}", self.enabled, self.mode)
     
     async def search(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -54,7 +54,7 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
         if project_name and os.path.exists(os.path.join(config.get('literature.projects_base_dir'), project_name)):
             is_existing_id = True
             project_path = os.path.join(config.get('literature.projects_base_dir'), project_name)
-            logger.info(f"使用现有项目: {project_path}")
+            logger.info("使用现有项目: %s", project_path)
         
         # 路径解析优先级：传入参数 > 项目文件夹推断 > 默认配置
         if literature_txt_path:
@@ -79,14 +79,14 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
         # 最终成果：在根目录 output 文件夹下
         output_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
         os.makedirs(output_folder, exist_ok=True)
-        logger.info(f"最终输出目录: {output_folder}")
-        logger.info(f"章节文件目录: {sections_folder}")
+        logger.info("最终输出目录: %s", output_folder)
+        logger.info("章节文件目录: %s", sections_folder)
         
         # 1. 加载文献池
-        logger.info(f"步骤1: 加载文献池: {lit_pool_path}")
+        logger.info("步骤1: 加载文献池: %s", lit_pool_path)
         parser = LiteratureParser()
         literature_pool = parser.parse_txt_pool(lit_pool_path)
-        logger.info(f"文献池加载完成: {len(literature_pool)} 条文献")
+        logger.info("文献池加载完成: %s 条文献", len(literature_pool))
         report_progress(15, "构建语义检索引擎")
         
         # 2. 构建语义检索引擎
@@ -136,7 +136,7 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
         output_path_draft = os.path.join(output_folder, f'{safe_filename}_初稿版.md')
         with open(output_path_draft, 'w', encoding='utf-8') as f:
             f.write(paper_draft)
-        logger.info(f"初稿版已保存: {output_path_draft}")
+        logger.info("初稿版已保存: %s", output_path_draft)
         report_progress(70, "专家审稿优化", word_count=len(paper_draft))
         
         # 8. 专家审稿与优化（如果启用）
@@ -166,9 +166,9 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
                     'all_reviews': review_results['all_reviews']
                 }, f, ensure_ascii=False, indent=2)
             
-            logger.info(f"审稿报告已保存: {review_report_path}")
-            logger.info(f"优化轮次: {review_results['rounds']} 轮")
-            logger.info(f"最终评分: {review_results['final_score']}/100")
+            logger.info("审稿报告已保存: %s", review_report_path)
+            logger.info("优化轮次: %s 轮", review_results['rounds'])
+            logger.info("最终评分: %s/100", review_results['final_score'])
         else:
             logger.info("步骤7: 专家审稿未启用，跳过")
         
@@ -188,9 +188,9 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
         try:
             from core.docx_exporter import convert_markdown_to_docx
             convert_markdown_to_docx(optimized_paper, docx_path_std)
-            logger.info(f"标准版Word已导出: {docx_path_std}")
+            logger.info("标准版Word已导出: %s", docx_path_std)
         except Exception as e:
-            logger.error(f"导出标准版Word失败: {str(e)}")
+            logger.error("导出标准版Word失败: %s", str(e))
             docx_path_std = output_path_std
 
         # 10. V3: 逐章节扩写 - 扩写版
@@ -207,9 +207,9 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
         docx_path_exp = os.path.join(output_folder, f'{safe_filename}_扩写版.docx')
         try:
             convert_markdown_to_docx(expanded_paper, docx_path_exp)
-            logger.info(f"扩写版Word已导出: {docx_path_exp}")
+            logger.info("扩写版Word已导出: %s", docx_path_exp)
         except Exception as e:
-            logger.error(f"导出扩写版Word失败: {str(e)}")
+            logger.error("导出扩写版Word失败: %s", str(e))
             docx_path_exp = output_path_exp
         
         report_progress(95, "生成质量报告", word_count=len(expanded_paper))
@@ -228,12 +228,12 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
             with open(report_path, 'w', encoding='utf-8') as f:
                 json.dump(stats, f, ensure_ascii=False, indent=2)
             
-            logger.info(f"质量报告已生成: {report_path}")
+            logger.info("质量报告已生成: %s", report_path)
         
         logger.info("="*60)
         logger.info("论文生成全流程完成!")
-        logger.info(f"标准版: {docx_path_std}")
-        logger.info(f"扩写版: {docx_path_exp}")
+        logger.info("标准版: %s", docx_path_std)
+        logger.info("扩写版: %s", docx_path_exp)
         logger.info("="*60)
         
         return {
@@ -252,7 +252,7 @@ def main(project_name=None, literature_txt_path=None, extra_idea=None, outline_d
             'cancelled': True
         }
     except Exception as e:
-        logger.error(f"程序执行出错: {str(e)}", exc_info=True)
+        logger.error("程序执行出错: %s", str(e), exc_info=True)
         raise e
 
 if __name__ == "__main__":
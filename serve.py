@@ -0,0 +1,32 @@
+"""Web UI 生产环境启动入口 - 使用 waitress WSGI 服务器运行 web_api"""
+import os
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+HOST = os.getenv('WEB_HOST', '0.0.0.0')
+PORT = int(os.getenv('WEB_PORT', '5000'))
+# 线程数需覆盖 SSE 长连接 + 上传 + 普通请求
+THREADS = int(os.getenv('WEB_THREADS', '16'))
+
+
+def run(app):
+    """用 waitress 运行给定的 WSGI 应用"""
+    print(f"WEB UI服务启动: http://localhost:{PORT}")
+    if serve is None:
+        print("未安装 waitress，回退到 Flask 开发服务器（pip install waitress）")
+        app.run(host=HOST, port=PORT)
+        return
+    # channel_timeout 放宽到 10 分钟，避免大文件上传与 SSE 连接被提前断开
+    serve(app, host=HOST, port=PORT, threads=THREADS, channel_timeout=600)
+
+
+def main():
+    from web_api import app
+    run(app)
+
+
+if __name__ == '__main__':
+    main()
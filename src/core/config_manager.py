@@ -45,10 +45,10 @@ class ConfigManager:
         """
         try:
             self.config_data = YAMLHandler.load_yaml(str(self.config_file)) or {}
-            self.logger.info(f"配置文件加载成功: {self.config_file}")
+            self.logger.info("配置文件加载成功: %s", self.config_file)
             return True
         except Exception as e:
-            self.logger.error(f"加载配置文件失败: {e}")
+            self.logger.error("加载配置文件失败: %s", e)
             return False
 
     def save_config(self) -> bool:
@@ -61,12 +61,12 @@ class ConfigManager:
         try:
             success = YAMLHandler.save_yaml(str(self.config_file), self.config_data)
             if success:
-                self.logger.info(f"配置文件保存成功: {self.config_file}")
+                self.logger.info("配置文件保存成功: %s", self.config_file)
             else:
-                self.logger.error(f"配置文件保存失败")
+                self.logger.error("配置文件保存失败")
             return success
         except Exception as e:
-            self.logger.error(f"保存配置文件异常: {e}")
+            self.logger.error("保存配置文件异常: %s", e)
             return False
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -91,7 +91,7 @@ class ConfigManager:
             value: 配置值
         """
         YAMLHandler.set_value(self.config_data, key, value)
-        self.logger.debug(f"配置更新: {key} = {value}")
+        self.logger.debug("配置更新: %s = %s", key, value)
 
     def get_all(self) -> Dict[str, Any]:
         """获取所有配置"""
@@ -66,25 +66,25 @@ class Logger:
         error_handler.setFormatter(formatter)
         self.logger.addHandler(error_handler)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """调试日志"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """信息日志"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """警告日志"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """错误日志"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """严重错误日志"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
     def get_logs(self, level: str = "INFO", lines: int = 100) -> list:
         """
@@ -4,11 +4,12 @@
 管理任务的创建、编辑、删除和执行
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 from enum import Enum
 from uuid import uuid4
 import json
+import sys
 
 from src.core.logger import get_logger
 
@@ -40,7 +41,8 @@ class Task:
         self.task_id = task_id or str(uuid4())
         self.title = title
         self.description = description
-        self.task_type = task_type
+        # 任务类型取值有限，驻留后各任务共享同一字符串对象（旧数据中可能为 None）
+        self.task_type = sys.intern(task_type) if isinstance(task_type, str) else task_type
         self.params = params or {}
         self.status = TaskStatus.PENDING
         self.progress = 0
@@ -49,6 +51,16 @@ class Task:
         self.completed_at = None
         self.result = None
         self.error = None
+        self._created_str = None
+
+    @property
+    def created_str(self) -> str:
+        """创建时间的显示字符串（格式化一次后缓存，created_at 被替换时重新格式化）"""
+        cached = self._created_str
+        if cached is None or cached[0] is not self.created_at:
+            cached = (self.created_at, self.created_at.strftime("%Y-%m-%d %H:%M:%S"))
+            self._created_str = cached
+        return cached[1]
 
     def to_dict(self) -> Dict:
         """转换为字典"""
@@ -99,6 +111,30 @@ class TaskManager:
         self.tasks: Dict[str, Task] = {}
         self.task_queue: List[str] = []
         self.current_task_id: Optional[str] = None
+        self._progress_observers: List[Callable[[str, int, TaskStatus], None]] = []
+
+    def subscribe_progress(self, callback: Callable[[str, int, TaskStatus], None]):
+        """
+        订阅任务进度变更
+        
+        Args:
+            callback: 回调函数，签名 (task_id, progress, status)，可能在工作线程中调用
+        """
+        self._progress_observers.append(callback)
+
+    def unsubscribe_progress(self, callback: Callable[[str, int, TaskStatus], None]):
+        """取消订阅"""
+        if callback in self._progress_observers:
+            self._progress_observers.remove(callback)
+
+    def _notify_progress(self, task: Task):
+        """通知所有进度观察者"""
+        # 遍历快照：回调在工作线程中执行时，界面线程可能同时订阅/取消订阅
+        for callback in tuple(self._progress_observers):
+            try:
+                callback(task.task_id, task.progress, task.status)
+            except Exception:
+                pass  # 忽略回调错误
 
     def create_task(self, title: str, description: str = "", task_type: str = "generation",
                     params: Dict = None) -> str:
@@ -119,7 +155,7 @@ class TaskManager:
         self.tasks[task.task_id] = task
         self.task_queue.append(task.task_id)
         
-        self.logger.info(f"创建任务: {title} (ID: {task.task_id})")
+        self.logger.info("创建任务: %s (ID: %s)", title, task.task_id)
         return task.task_id
 
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -150,7 +186,7 @@ class TaskManager:
         """
         task = self.get_task(task_id)
         if not task:
-            self.logger.warning(f"任务不存在: {task_id}")
+            self.logger.warning("任务不存在: %s", task_id)
             return False
         
         task.status = status
@@ -169,7 +205,8 @@ class TaskManager:
             if self.current_task_id == task_id:
                 self.current_task_id = None
         
-        self.logger.debug(f"任务状态更新: {task_id} -> {status.value}")
+        self.logger.debug("任务状态更新: %s -> %s", task_id, status.value)
+        self._notify_progress(task)
         return True
 
     def update_task_progress(self, task_id: str, progress: int, message: str = None) -> bool:
@@ -190,12 +227,18 @@ class TaskManager:
         
         task.progress = max(0, min(100, progress))
         
+        # 状态变更时由 update_task_status 通知观察者
+        status_changed = False
         if progress > 0 and task.status == TaskStatus.PENDING:
             self.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+            status_changed = True
         
         if progress >= 100:
             self.update_task_status(task_id, TaskStatus.COMPLETED)
+            status_changed = True
         
+        if not status_changed:
+            self._notify_progress(task)
         return True
 
     def set_task_result(self, task_id: str, result: Any) -> bool:
@@ -232,7 +275,7 @@ class TaskManager:
             del self.tasks[task_id]
             if task_id in self.task_queue:
                 self.task_queue.remove(task_id)
-            self.logger.info(f"删除任务: {task_id}")
+            self.logger.info("删除任务: %s", task_id)
             return True
         return False
 
@@ -266,7 +309,7 @@ class TaskManager:
             if self.tasks[task_id].status == TaskStatus.COMPLETED:
                 self.delete_task(task_id)
                 count += 1
-        self.logger.info(f"清除了 {count} 个已完成任务")
+        self.logger.info("清除了 %s 个已完成任务", count)
         return count
 
     def get_task_count(self, status: TaskStatus = None) -> int:
@@ -296,10 +339,10 @@ class TaskManager:
             data = [task.to_dict() for task in self.tasks.values()]
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"任务已保存到: {filepath}")
+            self.logger.info("任务已保存到: %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"保存任务失败: {e}")
+            self.logger.error("保存任务失败: %s", e)
             return False
 
     def load_from_file(self, filepath: str) -> bool:
@@ -321,10 +364,10 @@ class TaskManager:
                 task = Task.from_dict(task_data)
                 self.tasks[task.task_id] = task
             
-            self.logger.info(f"从文件加载了 {len(self.tasks)} 个任务")
+            self.logger.info("从文件加载了 %s 个任务", len(self.tasks))
             return True
         except Exception as e:
-            self.logger.error(f"加载任务失败: {e}")
+            self.logger.error("加载任务失败: %s", e)
             return False
 
 
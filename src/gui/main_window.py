@@ -5,13 +5,6 @@
 """
 
 import wx
-import sys
-from pathlib import Path
-
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 from src.gui.themes.themes import ThemeManager, get_theme_color
 from src.gui.panels.config_panel import ConfigPanel
@@ -50,14 +43,34 @@ class MainWindow(wx.Frame):
         # 当前活动面板
         self.current_panel = None
         
-        # 初始化UI
+        # 是否已完成第二阶段初始化（默认面板、主题、配置）
+        self._lazy_initialized = False
+        
+        # 初始化UI（只构建窗口框架，面板在 initialize_heavy 中创建）
         self.init_ui()
         
         # 绑定事件
         self.bind_events()
+
+    def initialize_heavy(self):
+        """
+        第二阶段初始化：窗口显示后再创建默认面板、应用主题并加载配置
         
-        # 应用主题
-        self.apply_theme()
+        由 MainApp 在 Show() 之后通过 wx.CallAfter 调用，缩短首次显示窗口的时间
+        """
+        if self._lazy_initialized:
+            return
+        self._lazy_initialized = True
+        
+        self.Freeze()
+        try:
+            # 显示默认面板（系统配置）
+            self.show_config_panel()
+            
+            # 应用主题
+            self.apply_theme()
+        finally:
+            self.Thaw()
         
         # 加载配置
         self.load_config()
@@ -203,9 +216,6 @@ class MainWindow(wx.Frame):
         # 添加到主布局
         main_sizer.Add(splitter, 1, wx.EXPAND)
         main_panel.SetSizer(main_sizer)
-        
-        # 显示默认面板（系统配置）
-        self.show_config_panel()
 
     def create_navigation_panel(self, parent):
         """创建左侧导航面板"""
@@ -321,7 +331,7 @@ class MainWindow(wx.Frame):
             self.config_manager.load_config()
             self.logger.info("配置加载成功")
         except Exception as e:
-            self.logger.error(f"配置加载失败: {e}")
+            self.logger.error("配置加载失败: %s", e)
             wx.MessageBox(f"配置加载失败: {e}", "错误", wx.OK | wx.ICON_ERROR)
 
     def save_config(self):
@@ -334,7 +344,7 @@ class MainWindow(wx.Frame):
             else:
                 raise Exception("保存失败")
         except Exception as e:
-            self.logger.error(f"配置保存失败: {e}")
+            self.logger.error("配置保存失败: %s", e)
             wx.MessageBox(f"配置保存失败: {e}", "错误", wx.OK | wx.ICON_ERROR)
 
     # 事件处理器
@@ -362,7 +372,7 @@ class MainWindow(wx.Frame):
         new_theme = 'dark' if current == 'light' else 'light'
         ThemeManager.set_theme(new_theme)
         self.apply_theme()
-        self.logger.info(f"主题切换为: {new_theme}")
+        self.logger.info("主题切换为: %s", new_theme)
 
     def on_show_config(self, event):
         """显示配置面板"""
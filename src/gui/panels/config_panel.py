@@ -5,13 +5,6 @@
 """
 
 import wx
-from pathlib import Path
-import sys
-
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 from src.gui.themes.themes import ThemeManager, get_theme_color
 from src.core.config_manager import get_config_manager
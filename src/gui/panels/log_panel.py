@@ -5,16 +5,9 @@
 """
 
 import wx
-from pathlib import Path
-import sys
 from datetime import datetime
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from src.gui.themes.themes import get_theme_color
+from src.gui.themes.themes import get_theme_color, get_theme_rgb
 from src.core.logger import get_logger, LogViewer
 
 
@@ -27,6 +20,7 @@ class LogPanel(wx.Panel):
         self.logger = get_logger()
         self.log_viewer = LogViewer(self.logger)
         self.timer = None
+        self._pending_refresh = None
         self.init_ui()
         self.start_timer()
 
@@ -188,9 +182,9 @@ class LogPanel(wx.Panel):
             
             # 设置级别颜色
             if entry['level'] == 'ERROR' or entry['level'] == 'CRITICAL':
-                self.log_list.SetItemTextColour(index, wx.Colour(get_theme_color('error')))
+                self.log_list.SetItemTextColour(index, wx.Colour(*get_theme_rgb('error')))
             elif entry['level'] == 'WARNING':
-                self.log_list.SetItemTextColour(index, wx.Colour(get_theme_color('warning')))
+                self.log_list.SetItemTextColour(index, wx.Colour(*get_theme_rgb('warning')))
 
     def on_log_selected(self, event):
         """日志选择事件"""
@@ -226,10 +220,21 @@ class LogPanel(wx.Panel):
 
     def on_filter_changed(self, event):
         """过滤器改变事件"""
-        self.refresh_logs()
+        self.schedule_refresh()
 
     def on_search(self, event):
         """搜索事件"""
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """延迟刷新，连续触发的过滤/搜索事件合并为一次刷新"""
+        if self._pending_refresh:
+            self._pending_refresh.Stop()
+        self._pending_refresh = wx.CallLater(150, self._do_refresh)
+
+    def _do_refresh(self):
+        """执行延迟刷新"""
+        self._pending_refresh = None
         self.refresh_logs()
 
     def on_export(self, event):
@@ -264,3 +269,6 @@ class LogPanel(wx.Panel):
         """停止定时器"""
         if self.timer:
             self.timer.Stop()
+        if self._pending_refresh:
+            self._pending_refresh.Stop()
+            self._pending_refresh = None
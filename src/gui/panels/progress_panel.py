@@ -6,15 +6,8 @@
 
 import wx
 import wx.grid
-from pathlib import Path
-import sys
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from src.gui.themes.themes import get_theme_color
+from src.gui.themes.themes import get_theme_color, get_theme_rgb
 from src.core.task_manager import get_task_manager, TaskStatus
 from src.core.logger import get_logger
 
@@ -28,6 +21,9 @@ class ProgressPanel(wx.Panel):
         self.task_manager = get_task_manager()
         self.logger = get_logger()
         self.timer = None
+        self._last_stats = None
+        self._last_detail = None
+        self._task_by_row = []
         self.init_ui()
         self.start_timer()
 
@@ -161,6 +157,12 @@ class ProgressPanel(wx.Panel):
         failed = self.task_manager.get_task_count(TaskStatus.FAILED)
         pending = self.task_manager.get_task_count(TaskStatus.PENDING)
         
+        # 统计未变化时不重设标签，避免每秒触发重绘和布局
+        stats = (total, running, completed, failed, pending)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+        
         self.total_label.SetLabel(f"总任务数: {total}")
         self.running_label.SetLabel(f"执行中: {running}")
         self.completed_label.SetLabel(f"已完成: {completed}")
@@ -170,6 +172,7 @@ class ProgressPanel(wx.Panel):
     def refresh_progress_list(self):
         """刷新进度列表"""
         tasks = self.task_manager.get_all_tasks()
+        self._task_by_row = tasks
         
         # 保存当前选中行
         current_row = self.progress_grid.GetGridCursorRow()
@@ -194,27 +197,32 @@ class ProgressPanel(wx.Panel):
             # 设置状态颜色
             if task.status == TaskStatus.IN_PROGRESS:
                 self.progress_grid.SetCellTextColour(row, 2, 
-                                                    wx.Colour(get_theme_color('primary')))
+                                                    wx.Colour(*get_theme_rgb('primary')))
             elif task.status == TaskStatus.COMPLETED:
                 self.progress_grid.SetCellTextColour(row, 2, 
-                                                    wx.Colour(get_theme_color('success')))
+                                                    wx.Colour(*get_theme_rgb('success')))
             elif task.status == TaskStatus.FAILED:
                 self.progress_grid.SetCellTextColour(row, 2, 
-                                                    wx.Colour(get_theme_color('error')))
+                                                    wx.Colour(*get_theme_rgb('error')))
 
     def on_cell_selected(self, event):
         """单元格选择事件"""
         row = event.GetRow()
-        tasks = self.task_manager.get_all_tasks()
         
-        if row < len(tasks):
-            task = tasks[row]
+        # 使用刷新时缓存的行->任务映射，避免再次获取全部任务
+        if 0 <= row < len(self._task_by_row):
+            task = self._task_by_row[row]
             self.update_progress_detail(task)
         
         event.Skip()
 
     def update_progress_detail(self, task):
         """更新进度详情"""
+        detail = (task.progress, task.status.value, task.error)
+        if detail == self._last_detail:
+            return
+        self._last_detail = detail
+        
         self.progress_bar.SetValue(task.progress)
         self.progress_text.SetLabel(f"{task.progress}%")
         self.status_text.SetLabel(f"状态: {task.status.value}")
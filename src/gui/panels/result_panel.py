@@ -4,18 +4,102 @@
 展示任务执行结果
 """
 
+import hashlib
+import html
+import json
+import string
+import threading
+from datetime import datetime
+
 import wx
-from pathlib import Path
-import sys
+import wx.stc as stc
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.gui.themes.themes import get_theme_color
 from src.core.task_manager import get_task_manager, TaskStatus
 
+# 文本视图分隔线与表头模板
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+_HEADER_TMPL = (
+    _SEP_EQ + "\n"
+    "任务标题: {title}\n"
+    "任务ID: {task_id}\n"
+    "任务类型: {task_type}\n"
+    "状态: {status}\n"
+    "进度: {progress}%\n"
+    "创建时间: {created_at}"
+)
+_RESULT_HEADER = _SEP_EQ + "\n\n任务结果:\n" + _SEP_DASH
+
+# 结果视图最多显示的字符数，超出部分截断（导出和复制仍使用完整内容）
+_MAX_VIEW_CHARS = 200_000
+
+# JSON视图字段（按输出顺序，status 取值后替换为枚举值）
+_JSON_KEYS = ('task_id', 'title', 'description', 'task_type', 'status', 'progress',
+              'created_at', 'started_at', 'completed_at', 'result', 'error')
+
+# 导出文件时每次写入的字符数
+_EXPORT_CHUNK = 64 * 1024
+
+# 结果选项卡索引
+_PAGE_TEXT, _PAGE_HTML, _PAGE_JSON = 0, 1, 2
+
+# HTML视图模板（样式只构建一次，调用时仅替换转义后的动态字段）
+_HTML_TMPL = string.Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <title>$title</title>
+            <style>
+                body { font-family: Arial, sans-serif; padding: 20px; background-color: #f5f5f5; }
+                .container { background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+                h1 { color: #0078D7; }
+                .info { background-color: #f0f0f0; padding: 10px; border-radius: 4px; margin: 10px 0; }
+                .result { margin-top: 20px; }
+                pre { background-color: #f9f9f9; padding: 10px; border-radius: 4px; overflow-x: auto; }
+                .error { background-color: #ffe6e6; padding: 10px; border-radius: 4px; color: #d13438; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>$title</h1>
+                <div class="info">
+                    <p><strong>任务ID:</strong> $task_id</p>
+                    <p><strong>任务类型:</strong> $task_type</p>
+                    <p><strong>状态:</strong> $status</p>
+                    <p><strong>进度:</strong> $progress%</p>
+                </div>
+                <div class="result">
+                    <h2>任务结果</h2>
+                    <pre>$result</pre>
+                </div>
+                $error_block
+            </div>
+        </body>
+        </html>
+        """)
+_HTML_ERROR_TMPL = string.Template('<div class="error"><strong>错误信息:</strong> $error</div>')
+
+
+def _json_default(obj):
+    """标准库json的兜底序列化（datetime转ISO格式）"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_indented(data) -> str:
+    """序列化为缩进JSON文本，优先使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default)
+
 
 class ResultPanel(wx.Panel):
     """结果查看面板"""
@@ -25,6 +109,13 @@ class ResultPanel(wx.Panel):
         super().__init__(parent)
         self.task_manager = get_task_manager()
         self.current_task = None
+        # 格式化结果缓存 {task_id: (version, {页索引: 格式化字符串})}
+        self._fmt_cache = {}
+        # 各选项卡是否需要重新填充 {页索引: bool}，只填充当前可见页
+        self._dirty = {_PAGE_TEXT: False, _PAGE_HTML: False, _PAGE_JSON: False}
+        # 刷新去抖定时器，短时间内的多次刷新请求合并为一次
+        self._refresh_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._do_refresh, self._refresh_timer)
         self.init_ui()
 
     def init_ui(self):
@@ -111,48 +202,123 @@ class ResultPanel(wx.Panel):
         
         # 标题
         title_label = wx.StaticText(text_panel, label="结果内容:")
-        self.result_text = wx.TextCtrl(text_panel, value="", 
-                                      style=wx.TE_MULTILINE | wx.TE_RICH | wx.HSCROLL)
-        self.result_text.SetFont(wx.Font(9, wx.FONTFAMILY_MODERN, 
-                                        wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        self.result_text = self.create_text_view(text_panel)
+        self.result_text.StyleSetFont(stc.STC_STYLE_DEFAULT,
+                                      wx.Font(9, wx.FONTFAMILY_MODERN,
+                                              wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        self.result_text.StyleClearAll()
         
         text_sizer.Add(title_label, 0, wx.ALL, 5)
         text_sizer.Add(self.result_text, 1, wx.EXPAND | wx.ALL, 5)
         text_panel.SetSizer(text_sizer)
         self.notebook.AddPage(text_panel, "文本视图")
         
-        # HTML视图
-        html_panel = wx.Panel(self.notebook)
+        # HTML视图和JSON视图先放占位页，首次切换到该页时再创建实际控件
+        self.result_html = None
+        self.result_json = None
+        self._tab_initialized = {"html": False, "json": False}
+        # 上次加载到WebView的HTML摘要，内容相同时跳过SetPage
+        self._last_html_hash = None
+        self._html_panel = self.create_stub_page("HTML视图")
+        self._json_panel = self.create_stub_page("JSON视图")
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+        
+        parent_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
+
+    def create_stub_page(self, title):
+        """添加只含加载提示的占位页"""
+        panel = wx.Panel(self.notebook)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(wx.StaticText(panel, label="加载中..."), 0, wx.ALL, 10)
+        panel.SetSizer(sizer)
+        self.notebook.AddPage(panel, title)
+        return panel
+
+    def init_html_page(self):
+        """创建HTML视图（WebView初始化开销较大，仅在首次打开该页时执行）"""
+        import wx.html2
+        
+        panel = self._html_panel
+        panel.DestroyChildren()
         html_sizer = wx.BoxSizer(wx.VERTICAL)
         
-        html_label = wx.StaticText(html_panel, label="HTML预览:")
-        self.result_html = wx.html2.WebView.New(html_panel)
+        html_label = wx.StaticText(panel, label="HTML预览:")
+        self.result_html = wx.html2.WebView.New(panel)
         if self.result_html:
             html_sizer.Add(html_label, 0, wx.ALL, 5)
             html_sizer.Add(self.result_html, 1, wx.EXPAND | wx.ALL, 5)
         else:
-            error_label = wx.StaticText(html_panel, label="WebView不可用")
+            error_label = wx.StaticText(panel, label="WebView不可用")
             html_sizer.Add(error_label, 0, wx.ALL, 10)
         
-        html_panel.SetSizer(html_sizer)
-        self.notebook.AddPage(html_panel, "HTML视图")
-        
-        # JSON视图
-        json_panel = wx.Panel(self.notebook)
+        panel.SetSizer(html_sizer, deleteOld=True)
+        panel.Layout()
+        self._tab_initialized["html"] = True
+
+    def init_json_page(self):
+        """创建JSON视图"""
+        panel = self._json_panel
+        panel.DestroyChildren()
         json_sizer = wx.BoxSizer(wx.VERTICAL)
         
-        json_label = wx.StaticText(json_panel, label="JSON数据:")
-        self.result_json = wx.TextCtrl(json_panel, value="", 
-                                      style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_RICH)
+        json_label = wx.StaticText(panel, label="JSON数据:")
+        self.result_json = self.create_text_view(panel, read_only=True)
         
         json_sizer.Add(json_label, 0, wx.ALL, 5)
         json_sizer.Add(self.result_json, 1, wx.EXPAND | wx.ALL, 5)
-        json_panel.SetSizer(json_sizer)
-        self.notebook.AddPage(json_panel, "JSON视图")
-        
-        parent_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
+        panel.SetSizer(json_sizer, deleteOld=True)
+        panel.Layout()
+        self._tab_initialized["json"] = True
+
+    def on_page_changed(self, event):
+        """选项卡切换事件，首次打开HTML/JSON页时创建控件，内容过期时重新填充"""
+        index = event.GetSelection()
+        self.ensure_page(index)
+        if self._dirty.get(index):
+            self._populate(index)
+        event.Skip()
+
+    def ensure_page(self, index):
+        """确保指定选项卡的实际控件已创建"""
+        if index == _PAGE_HTML and not self._tab_initialized["html"]:
+            self.init_html_page()
+        elif index == _PAGE_JSON and not self._tab_initialized["json"]:
+            self.init_json_page()
+
+    def create_text_view(self, parent, read_only=False):
+        """创建基于Scintilla的文本视图，大文本按行渲染而非整体重排"""
+        view = stc.StyledTextCtrl(parent)
+        view.SetWrapMode(stc.STC_WRAP_NONE)
+        view.SetMarginWidth(1, 0)
+        view.SetReadOnly(read_only)
+        return view
+
+    def set_view_text(self, view, text: str) -> None:
+        """设置文本视图内容，超长内容截断显示"""
+        if len(text) > _MAX_VIEW_CHARS:
+            text = text[:_MAX_VIEW_CHARS] + "\n...[内容过长已截断，完整结果请使用导出或复制]"
+        read_only = view.GetReadOnly()
+        if read_only:
+            view.SetReadOnly(False)
+        # ChangeValue 不发送 EVT_TEXT，避免更新期间触发事件处理
+        view.ChangeValue(text)
+        view.EmptyUndoBuffer()
+        if read_only:
+            view.SetReadOnly(True)
+
+    def set_html_page(self, html_str: str) -> None:
+        """加载HTML到WebView，内容与上次相同时跳过，避免重建DOM"""
+        digest = hashlib.blake2b(html_str.encode('utf-8'), digest_size=8).digest()
+        if digest != self._last_html_hash:
+            self.result_html.SetPage(html_str, "")
+            self._last_html_hash = digest
 
     def refresh_task_list(self):
+        """请求刷新任务列表（100ms 内的多次请求合并执行）"""
+        if not self._refresh_timer.IsRunning():
+            self._refresh_timer.StartOnce(100)
+
+    def _do_refresh(self, event=None):
         """刷新任务列表"""
         self.task_combo.Clear()
         
@@ -161,6 +327,12 @@ class ResultPanel(wx.Panel):
         for task in tasks:
             display_text = f"{task.title} ({task.task_id[:8]}...)"
             self.task_combo.Append(display_text, task.task_id)
+        
+        # 丢弃已不在列表中的任务缓存
+        task_ids = {task.task_id for task in tasks}
+        for task_id in list(self._fmt_cache):
+            if task_id not in task_ids:
+                del self._fmt_cache[task_id]
 
     def on_task_selected(self, event):
         """任务选择事件"""
@@ -171,113 +343,108 @@ class ResultPanel(wx.Panel):
                 self.display_result(task)
 
     def display_result(self, task):
-        """显示任务结果"""
+        """显示任务结果（只填充当前可见的选项卡，其余切换时再填充）"""
         self.current_task = task
-        
-        # 文本视图
-        result_str = self.format_result_as_text(task)
-        self.result_text.SetValue(result_str)
-        
-        # HTML视图
-        if self.result_html:
-            html_str = self.format_result_as_html(task)
-            self.result_html.SetPage(html_str, "")
-        
-        # JSON视图
-        json_str = self.format_result_as_json(task)
-        self.result_json.SetValue(json_str)
+        for index in self._dirty:
+            self._dirty[index] = True
+        self._populate(self.notebook.GetSelection())
+
+    def _populate(self, index):
+        """格式化并填充指定选项卡"""
+        if self.current_task is None or index not in self._dirty:
+            return
+        self.ensure_page(index)
+        content = self.get_formatted_result(self.current_task, index)
+        
+        self.Freeze()
+        try:
+            if index == _PAGE_TEXT:
+                self.set_view_text(self.result_text, content)
+            elif index == _PAGE_HTML:
+                if self.result_html:
+                    self.set_html_page(content)
+            elif self.result_json:
+                self.set_view_text(self.result_json, content)
+        finally:
+            self.Thaw()
+            self.Refresh()
+        self._dirty[index] = False
+
+    def get_formatted_result(self, task, index) -> str:
+        """获取任务在指定选项卡下的格式化结果，任务未变化时复用缓存"""
+        version = (task.progress, task.status, task.completed_at)
+        cached = self._fmt_cache.get(task.task_id)
+        if cached is None or cached[0] != version:
+            cached = (version, {})
+            self._fmt_cache[task.task_id] = cached
+        
+        views = cached[1]
+        content = views.get(index)
+        if content is None:
+            if index == _PAGE_TEXT:
+                content = self.format_result_as_text(task)
+            elif index == _PAGE_HTML:
+                content = self.format_result_as_html(task)
+            else:
+                content = self.format_result_as_json(task)
+            views[index] = content
+        return content
 
     def format_result_as_text(self, task) -> str:
         """格式化为文本"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append(f"任务标题: {task.title}")
-        lines.append(f"任务ID: {task.task_id}")
-        lines.append(f"任务类型: {task.task_type}")
-        lines.append(f"状态: {task.status.value}")
-        lines.append(f"进度: {task.progress}%")
-        lines.append(f"创建时间: {task.created_at}")
+        lines = [_HEADER_TMPL.format(
+            title=task.title,
+            task_id=task.task_id,
+            task_type=task.task_type,
+            status=task.status.value,
+            progress=task.progress,
+            created_at=task.created_at
+        )]
         if task.started_at:
             lines.append(f"开始时间: {task.started_at}")
         if task.completed_at:
             lines.append(f"完成时间: {task.completed_at}")
-        lines.append("=" * 60)
-        lines.append("\n任务结果:")
-        lines.append("-" * 60)
+        lines.append(_RESULT_HEADER)
         
         if task.result:
             if isinstance(task.result, dict):
-                for key, value in task.result.items():
-                    lines.append(f"{key}: {value}")
+                lines.extend(f"{key}: {value}" for key, value in task.result.items())
             elif isinstance(task.result, list):
-                for item in task.result:
-                    lines.append(f"- {item}")
+                lines.extend(f"- {item}" for item in task.result)
             else:
                 lines.append(str(task.result))
         else:
             lines.append("暂无结果")
         
         if task.error:
-            lines.append("\n" + "-" * 60)
+            lines.append("\n" + _SEP_DASH)
             lines.append(f"错误信息: {task.error}")
         
         return "\n".join(lines)
 
     def format_result_as_html(self, task) -> str:
         """格式化为HTML"""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>{task.title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; padding: 20px; background-color: #f5f5f5; }}
-                .container {{ background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                h1 {{ color: #0078D7; }}
-                .info {{ background-color: #f0f0f0; padding: 10px; border-radius: 4px; margin: 10px 0; }}
-                .result {{ margin-top: 20px; }}
-                pre {{ background-color: #f9f9f9; padding: 10px; border-radius: 4px; overflow-x: auto; }}
-                .error {{ background-color: #ffe6e6; padding: 10px; border-radius: 4px; color: #d13438; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>{task.title}</h1>
-                <div class="info">
-                    <p><strong>任务ID:</strong> {task.task_id}</p>
-                    <p><strong>任务类型:</strong> {task.task_type}</p>
-                    <p><strong>状态:</strong> {task.status.value}</p>
-                    <p><strong>进度:</strong> {task.progress}%</p>
-                </div>
-                <div class="result">
-                    <h2>任务结果</h2>
-                    <pre>{str(task.result) if task.result else '暂无结果'}</pre>
-                </div>
-                {f'<div class="error"><strong>错误信息:</strong> {task.error}</div>' if task.error else ''}
-            </div>
-        </body>
-        </html>
-        """
-        return html
-
-    def format_result_as_json(self, task) -> str:
-        """格式化为JSON"""
-        import json
-        data = {
-            'task_id': task.task_id,
+        fields = {
             'title': task.title,
-            'description': task.description,
+            'task_id': task.task_id,
             'task_type': task.task_type,
             'status': task.status.value,
             'progress': task.progress,
-            'created_at': task.created_at.isoformat(),
-            'started_at': task.started_at.isoformat() if task.started_at else None,
-            'completed_at': task.completed_at.isoformat() if task.completed_at else None,
-            'result': task.result,
-            'error': task.error
+            'result': task.result if task.result else '暂无结果',
         }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        safe = {key: html.escape(str(value)) for key, value in fields.items()}
+        if task.error:
+            safe['error_block'] = _HTML_ERROR_TMPL.substitute(error=html.escape(str(task.error)))
+        else:
+            safe['error_block'] = ''
+        return _HTML_TMPL.substitute(safe)
+
+    def format_result_as_json(self, task) -> str:
+        """格式化为JSON"""
+        # datetime 由 orjson 原生序列化（回退路径使用 _json_default）
+        data = {key: getattr(task, key) for key in _JSON_KEYS}
+        data['status'] = task.status.value
+        return _dumps_indented(data)
 
     def on_export(self, event):
         """导出结果"""
@@ -291,24 +458,40 @@ class ResultPanel(wx.Panel):
                            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
         
         if dlg.ShowModal() == wx.ID_OK:
-            filepath = dlg.GetPath()
-            try:
-                content = self.format_result_as_text(self.current_task)
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                wx.MessageBox("导出成功", "成功", wx.OK | wx.ICON_INFORMATION)
-            except Exception as e:
-                wx.MessageBox(f"导出失败: {e}", "错误", wx.OK | wx.ICON_ERROR)
+            # 格式化和写文件在后台线程执行，避免大结果阻塞界面
+            threading.Thread(target=self._do_export,
+                             args=(self.current_task, dlg.GetPath()),
+                             daemon=True).start()
         
         dlg.Destroy()
 
+    def _do_export(self, task, filepath):
+        """后台线程：格式化结果并分块写入文件"""
+        try:
+            content = self.format_result_as_text(task)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                for i in range(0, len(content), _EXPORT_CHUNK):
+                    f.write(content[i:i + _EXPORT_CHUNK])
+            wx.CallAfter(wx.MessageBox, "导出成功", "成功", wx.OK | wx.ICON_INFORMATION)
+        except Exception as e:
+            wx.CallAfter(wx.MessageBox, f"导出失败: {e}", "错误", wx.OK | wx.ICON_ERROR)
+
     def on_copy(self, event):
         """复制结果"""
         if not self.current_task:
             wx.MessageBox("请先选择任务", "提示", wx.OK | wx.ICON_WARNING)
             return
         
-        content = self.format_result_as_text(self.current_task)
+        task = self.current_task
+        
+        def worker():
+            content = self.format_result_as_text(task)
+            wx.CallAfter(self._set_clipboard, content)
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _set_clipboard(self, content):
+        """写入剪贴板（需在GUI线程调用）"""
         if wx.TheClipboard.Open():
             wx.TheClipboard.SetData(wx.TextDataObject(content))
             wx.TheClipboard.Close()
@@ -316,11 +499,15 @@ class ResultPanel(wx.Panel):
 
     def on_clear(self, event):
         """清空结果"""
-        self.result_text.SetValue("")
-        self.result_json.SetValue("")
+        self.set_view_text(self.result_text, "")
+        if self.result_json:
+            self.set_view_text(self.result_json, "")
         if self.result_html:
-            self.result_html.SetPage("", "")
+            self.set_html_page("")
         self.current_task = None
+        self._fmt_cache.clear()
+        for index in self._dirty:
+            self._dirty[index] = False
 
     def on_print(self, event):
         """打印结果"""
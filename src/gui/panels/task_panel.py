@@ -6,20 +6,17 @@
 
 import wx
 import wx.dataview as dv
-from pathlib import Path
-import sys
 from datetime import datetime
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent.parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from src.gui.themes.themes import get_theme_color
 from src.core.task_manager import get_task_manager, TaskStatus
 from src.core.logger import get_logger
 
 
+# 进度显示字符串表，避免每次刷新重新格式化
+_PCT = {i: f"{i}%" for i in range(101)}
+
+
 class TaskPanel(wx.Panel):
     """任务管理面板"""
 
@@ -29,8 +26,20 @@ class TaskPanel(wx.Panel):
         self.task_manager = get_task_manager()
         self.logger = get_logger()
         self.current_task_id = None
+        # 刷新去抖定时器，短时间内的多次刷新请求合并为一次
+        self._refresh_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._do_refresh, self._refresh_timer)
+        # 列表行缓存 {task_id: 行号} 与 {task_id: 各列显示值}，用于增量更新
+        self._row_map = {}
+        self._last_values = {}
+        # 按行号排列的任务快照，选择事件直接按行取任务
+        self._row_tasks = []
         self.init_ui()
         self.refresh_task_list()
+        
+        # 进度变化直接更新对应单元格，无需刷新整个列表
+        self.task_manager.subscribe_progress(self._on_task_progress)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
 
     def init_ui(self):
         """初始化UI"""
@@ -149,19 +158,87 @@ class TaskPanel(wx.Panel):
         parent_sizer.Add(detail_sizer, 1, wx.EXPAND | wx.ALL, 5)
 
     def refresh_task_list(self):
-        """刷新任务列表"""
-        self.task_list.DeleteAllItems()
-        
+        """请求刷新任务列表（100ms 内的多次请求合并执行）"""
+        if not self._refresh_timer.IsRunning():
+            self._refresh_timer.StartOnce(100)
+
+    @staticmethod
+    def _row_values(task) -> tuple:
+        """任务在列表中各列的显示值"""
+        return (
+            task.task_id[:8] + "...",
+            task.title,
+            task.task_type,
+            task.status.value,
+            _PCT.get(task.progress) or f"{task.progress}%",
+            task.created_str
+        )
+
+    def _do_refresh(self, event=None):
+        """刷新任务列表（与上次结果对比，只更新变化的行和单元格）"""
         tasks = self.task_manager.get_all_tasks()
-        for task in tasks:
-            self.task_list.AppendItem([
-                task.task_id[:8] + "...",
-                task.title,
-                task.task_type,
-                task.status.value,
-                f"{task.progress}%",
-                task.created_at.strftime("%Y-%m-%d %H:%M:%S")
-            ])
+        new_ids = [task.task_id for task in tasks]
+        new_set = set(new_ids)
+        
+        # 删除已不存在的任务行（倒序删除，保证行号有效）
+        removed = sorted((row for task_id, row in self._row_map.items()
+                          if task_id not in new_set), reverse=True)
+        for row in removed:
+            self.task_list.DeleteItem(row)
+        old_ids = [task_id for task_id, _ in sorted(self._row_map.items(), key=lambda kv: kv[1])
+                   if task_id in new_set]
+        
+        # 保留行的相对顺序发生变化时无法增量更新，退回整体重建
+        if old_ids != [task_id for task_id in new_ids if task_id in self._row_map]:
+            self.task_list.DeleteAllItems()
+            self._row_map = {}
+            self._last_values = {}
+        
+        last_values = {}
+        for row, task in enumerate(tasks):
+            values = self._row_values(task)
+            old_values = self._last_values.get(task.task_id)
+            if old_values is None:
+                self.task_list.InsertItem(row, list(values))
+            else:
+                for col, value in enumerate(values):
+                    if value != old_values[col]:
+                        self.task_list.SetValue(value, row, col)
+            last_values[task.task_id] = values
+        
+        self._row_map = {task_id: row for row, task_id in enumerate(new_ids)}
+        self._last_values = last_values
+        self._row_tasks = list(tasks)
+
+    def update_progress(self, task_id, progress, status=None):
+        """只更新指定任务的进度（及状态）单元格"""
+        if not self:
+            return  # 面板已销毁
+        row = self._row_map.get(task_id)
+        if row is None:
+            # 列表中尚无该任务，交给常规刷新
+            self.refresh_task_list()
+            return
+        
+        values = list(self._last_values[task_id])
+        progress_str = _PCT.get(progress) or f"{progress}%"
+        if values[4] != progress_str:
+            self.task_list.SetValue(progress_str, row, 4)
+            values[4] = progress_str
+        if status is not None and values[3] != status.value:
+            self.task_list.SetValue(status.value, row, 3)
+            values[3] = status.value
+        self._last_values[task_id] = tuple(values)
+
+    def _on_task_progress(self, task_id, progress, status):
+        """任务管理器进度回调（可能来自工作线程）"""
+        wx.CallAfter(self.update_progress, task_id, progress, status)
+
+    def on_destroy(self, event):
+        """面板销毁时取消进度订阅"""
+        if event.GetEventObject() is self:
+            self.task_manager.unsubscribe_progress(self._on_task_progress)
+        event.Skip()
 
     def on_task_selected(self, event):
         """任务选择事件"""
@@ -170,15 +247,11 @@ class TaskPanel(wx.Panel):
             return
         
         row = self.task_list.ItemToRow(item)
-        if row >= 0:
-            # 获取任务ID（完整ID）
-            task_id_value = self.task_list.GetTextValue(row, 0)
-            # 由于显示的是缩略ID，需要从任务管理器获取完整ID
-            tasks = self.task_manager.get_all_tasks()
-            if row < len(tasks):
-                task = tasks[row]
-                self.current_task_id = task.task_id
-                self.show_task_detail(task)
+        # 列表显示的是缩略ID，从刷新时的快照按行取完整任务
+        if 0 <= row < len(self._row_tasks):
+            task = self._row_tasks[row]
+            self.current_task_id = task.task_id
+            self.show_task_detail(task)
 
     def show_task_detail(self, task):
         """显示任务详情"""
@@ -254,7 +327,7 @@ class TaskPanel(wx.Panel):
                 task.title = title
                 task.description = self.desc_text.GetValue()
                 task.task_type = self.type_combo.GetValue()
-                self.logger.info(f"更新任务: {self.current_task_id}")
+                self.logger.info("更新任务: %s", self.current_task_id)
         else:
             # 创建新任务
             self.current_task_id = self.task_manager.create_task(
@@ -263,7 +336,7 @@ class TaskPanel(wx.Panel):
                 task_type=self.type_combo.GetValue()
             )
             self.id_text.SetValue(self.current_task_id)
-            self.logger.info(f"创建任务: {self.current_task_id}")
+            self.logger.info("创建任务: %s", self.current_task_id)
         
         self.refresh_task_list()
         wx.MessageBox("任务保存成功", "成功", wx.OK | wx.ICON_INFORMATION)
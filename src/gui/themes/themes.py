@@ -5,9 +5,40 @@
 """
 
 import wx
+from collections import deque
 from typing import Dict, Tuple, Any
 
 
+def _style_button(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['button_bg'])
+    ctrl.SetForegroundColour(colors['button_fg'])
+
+
+def _style_input(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['input_bg'])
+    ctrl.SetForegroundColour(colors['input_fg'])
+
+
+def _style_panel(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['panel_bg'])
+    ctrl.SetForegroundColour(colors['fg_primary'])
+
+
+def _style_label(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['bg_primary'])
+    ctrl.SetForegroundColour(colors['fg_secondary'])
+
+
+def _style_statusbar(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['statusbar_bg'])
+    ctrl.SetForegroundColour(colors['fg_primary'])
+
+
+def _style_default(ctrl: wx.Window, colors: Dict[str, wx.Colour]) -> None:
+    ctrl.SetBackgroundColour(colors['bg_primary'])
+    ctrl.SetForegroundColour(colors['fg_primary'])
+
+
 class ThemeManager:
     """主题管理器，统一管理界面颜色方案"""
 
@@ -88,6 +119,49 @@ class ThemeManager:
     # 当前主题
     _current_theme = 'light'
 
+    # 主题RGB缓存 {theme_name: {color_key: (r, g, b)}}
+    _rgb_cache: Dict[str, Dict[str, Tuple[int, int, int]]] = {}
+
+    # 预转换的主题颜色 {theme_name: {color_key: wx.Colour}}，首次使用时构建（需已创建wx.App）
+    _THEMES_COLOURS: Dict[str, Dict[str, wx.Colour]] = None
+
+    # 字体缓存 {(size, bold, face_name): wx.Font}
+    _FONTS: Dict[Tuple[int, bool, str], wx.Font] = {}
+
+    # 控件类型 -> 着色函数，按精确类型查找；子类首次命中后也会缓存到此表
+    _HANDLERS = {
+        wx.Button: _style_button,
+        wx.TextCtrl: _style_input,
+        wx.ComboBox: _style_input,
+        wx.Panel: _style_panel,
+        wx.StaticBox: _style_panel,
+        wx.StaticText: _style_label,
+        wx.StatusBar: _style_statusbar,
+    }
+
+    # 子类回退匹配顺序（与原isinstance判断顺序一致）
+    _HANDLER_FALLBACK = (
+        (wx.Button, _style_button),
+        ((wx.TextCtrl, wx.ComboBox), _style_input),
+        ((wx.Panel, wx.StaticBox), _style_panel),
+        (wx.StaticText, _style_label),
+        (wx.StatusBar, _style_statusbar),
+    )
+
+    # 未知颜色键时返回的默认颜色
+    _DEFAULT_COLOUR: wx.Colour = None
+
+    @classmethod
+    def _ensure_colours(cls) -> Dict[str, Dict[str, wx.Colour]]:
+        """将所有主题的十六进制颜色一次性转换为wx.Colour"""
+        if cls._THEMES_COLOURS is None:
+            cls._THEMES_COLOURS = {
+                theme: {key: wx.Colour(value) for key, value in colors.items()}
+                for theme, colors in cls.THEMES.items()
+            }
+            cls._DEFAULT_COLOUR = wx.Colour('#000000')
+        return cls._THEMES_COLOURS
+
     @classmethod
     def set_theme(cls, theme_name: str) -> None:
         """设置当前主题"""
@@ -114,11 +188,39 @@ class ThemeManager:
         if theme_name is None:
             theme_name = cls._current_theme
         
+        theme_colours = cls._ensure_colours()
+        colours = theme_colours.get(theme_name) or theme_colours['light']
+        return colours.get(color_key, cls._DEFAULT_COLOUR)
+
+    @classmethod
+    def get_rgb(cls, color_key: str, theme_name: str = None) -> Tuple[int, int, int]:
+        """
+        获取主题颜色的RGB元组
+        
+        每个主题的十六进制颜色只在首次使用时解析一次
+        
+        Args:
+            color_key: 颜色键名
+            theme_name: 主题名称，默认使用当前主题
+            
+        Returns:
+            (r, g, b) 元组
+        """
+        if theme_name is None:
+            theme_name = cls._current_theme
+        
         if theme_name not in cls.THEMES:
             theme_name = 'light'
         
-        color_hex = cls.THEMES[theme_name].get(color_key, '#000000')
-        return wx.Colour(color_hex)
+        rgb_map = cls._rgb_cache.get(theme_name)
+        if rgb_map is None:
+            rgb_map = {
+                key: (int(value[1:3], 16), int(value[3:5], 16), int(value[5:7], 16))
+                for key, value in cls.THEMES[theme_name].items()
+            }
+            cls._rgb_cache[theme_name] = rgb_map
+        
+        return rgb_map.get(color_key, (0, 0, 0))
 
     @classmethod
     def apply_theme_to_window(cls, window: wx.Window, theme_name: str = None) -> None:
@@ -132,45 +234,41 @@ class ThemeManager:
         if theme_name is None:
             theme_name = cls._current_theme
         
-        colors = cls.THEMES[theme_name]
-        
-        # 设置背景色
-        window.SetBackgroundColour(wx.Colour(colors['bg_primary']))
-        window.SetForegroundColour(wx.Colour(colors['fg_primary']))
-        
-        # 递归应用到子窗口
-        for child in window.GetChildren():
-            cls.apply_theme_to_control(child, theme_name)
+        colors = cls._ensure_colours()[theme_name]
         
-        window.Refresh()
+        # 冻结窗口，所有控件着色完成后统一重绘一次
+        window.Freeze()
+        try:
+            # 设置背景色
+            window.SetBackgroundColour(colors['bg_primary'])
+            window.SetForegroundColour(colors['fg_primary'])
+            
+            # 广度优先遍历整棵子窗口树（含孙级控件）
+            pending = deque(window.GetChildren())
+            while pending:
+                child = pending.popleft()
+                cls.apply_theme_to_control(child, theme_name)
+                pending.extend(child.GetChildren())
+        finally:
+            window.Thaw()
+            window.Refresh()
 
     @classmethod
     def apply_theme_to_control(cls, control: wx.Window, theme_name: str) -> None:
         """应用主题到单个控件"""
-        colors = cls.THEMES[theme_name]
-        
-        # 根据控件类型设置不同颜色
-        if isinstance(control, wx.Button):
-            control.SetBackgroundColour(wx.Colour(colors['button_bg']))
-            control.SetForegroundColour(wx.Colour(colors['button_fg']))
-        elif isinstance(control, (wx.TextCtrl, wx.ComboBox)):
-            control.SetBackgroundColour(wx.Colour(colors['input_bg']))
-            control.SetForegroundColour(wx.Colour(colors['input_fg']))
-        elif isinstance(control, (wx.Panel, wx.StaticBox)):
-            control.SetBackgroundColour(wx.Colour(colors['panel_bg']))
-            control.SetForegroundColour(wx.Colour(colors['fg_primary']))
-        elif isinstance(control, wx.StaticText):
-            control.SetBackgroundColour(wx.Colour(colors['bg_primary']))
-            control.SetForegroundColour(wx.Colour(colors['fg_secondary']))
-        elif isinstance(control, wx.StatusBar):
-            control.SetBackgroundColour(wx.Colour(colors['statusbar_bg']))
-            control.SetForegroundColour(wx.Colour(colors['fg_primary']))
-        else:
-            # 默认设置
-            control.SetBackgroundColour(wx.Colour(colors['bg_primary']))
-            control.SetForegroundColour(wx.Colour(colors['fg_primary']))
+        colors = cls._ensure_colours()[theme_name]
         
-        control.Refresh()
+        # 根据控件类型查表设置颜色
+        control_type = type(control)
+        handler = cls._HANDLERS.get(control_type)
+        if handler is None:
+            handler = _style_default
+            for types, candidate in cls._HANDLER_FALLBACK:
+                if isinstance(control, types):
+                    handler = candidate
+                    break
+            cls._HANDLERS[control_type] = handler
+        handler(control, colors)
 
     @classmethod
     def get_font(cls, size: int = 9, bold: bool = False) -> wx.Font:
@@ -187,10 +285,14 @@ class ThemeManager:
         from src.utils.encoding_helper import EncodingHelper
         
         font_name = EncodingHelper.get_available_font()
-        weight = wx.FONTWEIGHT_BOLD if bold else wx.FONTWEIGHT_NORMAL
-        
-        return wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, 
-                       weight, faceName=font_name)
+        key = (size, bold, font_name)
+        font = cls._FONTS.get(key)
+        if font is None:
+            weight = wx.FONTWEIGHT_BOLD if bold else wx.FONTWEIGHT_NORMAL
+            font = wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, 
+                           weight, faceName=font_name)
+            cls._FONTS[key] = font
+        return font
 
 
 # 全局函数
@@ -199,6 +301,11 @@ def get_theme_color(color_key: str) -> wx.Colour:
     return ThemeManager.get_color(color_key)
 
 
+def get_theme_rgb(color_key: str) -> Tuple[int, int, int]:
+    """获取当前主题颜色的RGB元组"""
+    return ThemeManager.get_rgb(color_key)
+
+
 def apply_theme(window: wx.Window) -> None:
     """应用当前主题到窗口"""
     ThemeManager.apply_theme_to_window(window)
@@ -7,22 +7,30 @@
 import wx
 import sys
 import io
+from importlib.util import find_spec
 from pathlib import Path
 
+def _needs_utf8_wrap(stream) -> bool:
+    """流存在（pythonw.exe下为None）且编码不是UTF-8时才需要包装"""
+    if stream is None or not hasattr(stream, 'buffer'):
+        return False
+    return (getattr(stream, 'encoding', None) or '').lower() not in ('utf-8', 'utf8')
+
+
 # 设置控制台输出编码（解决Windows中文乱码问题）
 if sys.platform == 'win32':
     import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    if _needs_utf8_wrap(sys.stdout):
+        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    if _needs_utf8_wrap(sys.stderr):
+        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 # 添加项目根目录到路径
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.gui.main_window import MainWindow
-from src.core.logger import get_logger
-from src.gui.themes.themes import ThemeManager
+# 主窗口、日志等模块在实际使用时再导入，缩短启动时间
 
 
 class MainApp(wx.App):
@@ -34,17 +42,27 @@ class MainApp(wx.App):
         super().__init__(False)
         
         # 初始化日志
+        from src.core.logger import get_logger
         self.logger = get_logger()
         self.logger.info("=" * 60)
         self.logger.info("商业计划书自动化系统启动")
         self.logger.info("=" * 60)
+        
+        from src.utils.yaml_handler import YAML_BACKEND
+        self.logger.info("YAML解析器: %s", YAML_BACKEND)
 
     def enableHighDPIAware(self):
         """启用高DPI支持"""
         # Windows平台
         if sys.platform == 'win32':
             try:
+                import ctypes
                 from ctypes import windll
+                # 程序清单或系统已设置DPI感知时无需再次设置
+                current = ctypes.c_int()
+                windll.shcore.GetProcessDpiAwareness(None, ctypes.byref(current))
+                if current.value >= 1:
+                    return
                 windll.shcore.SetProcessDpiAwareness(1)
             except:
                 pass
@@ -52,15 +70,23 @@ class MainApp(wx.App):
     def OnInit(self):
         """应用程序初始化"""
         try:
+            # 预先查询可用中文字体，后续创建字体直接使用缓存结果
+            from src.utils.encoding_helper import EncodingHelper
+            EncodingHelper.get_available_font()
+            
             # 创建主窗口
+            from src.gui.main_window import MainWindow
             self.frame = MainWindow()
             self.frame.Show()
             
+            # 窗口显示后再构建面板、应用主题和加载配置
+            wx.CallAfter(self.frame.initialize_heavy)
+            
             self.logger.info("GUI初始化完成，主窗口已显示")
             return True
             
         except Exception as e:
-            self.logger.error(f"GUI初始化失败: {e}")
+            self.logger.error("GUI初始化失败: %s", e)
             wx.MessageBox(f"程序启动失败: {e}", "错误", 
                          wx.OK | wx.ICON_ERROR)
             return False
@@ -74,17 +100,13 @@ class MainApp(wx.App):
 
 
 def check_dependencies():
-    """检查依赖是否已安装"""
+    """检查依赖是否已安装（只查找模块，不执行导入）"""
     missing = []
     
-    try:
-        import yaml
-    except ImportError:
+    if find_spec('yaml') is None:
         missing.append("PyYAML")
     
-    try:
-        import wx
-    except ImportError:
+    if find_spec('wx') is None:
         missing.append("wxPython")
     
     if missing:
@@ -4,10 +4,37 @@
 处理中文字符编码问题
 """
 
+import os
 import sys
+import mmap
+import codecs
 import locale
 
 
+# 字节序标记 -> 编码，命中时无需逐个尝试
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 大数据先用前缀试探编码，前缀即非法时无需解码整个缓冲区
+_PROBE_SIZE = 4096
+
+# 超过此大小的文件通过mmap读取，直接从页缓存解码，不再复制一份bytes
+_MMAP_THRESHOLD = 64_000
+
+# 系统/区域编码在进程启动后不会变化，首次查询后缓存
+_SYSTEM_ENCODING = None
+_LOCALE_ENCODING = None
+
+# 可用字体查询结果缓存 {tuple(字体列表): 字体名}
+_AVAILABLE_FONT_CACHE = {}
+
+# 单个字体是否可用 {字体名: bool}
+_FONT_AVAILABLE = {}
+
+
 class EncodingHelper:
     """编码处理工具类"""
 
@@ -26,15 +53,21 @@ class EncodingHelper:
     @staticmethod
     def get_system_encoding() -> str:
         """获取系统默认编码"""
-        return sys.getdefaultencoding()
+        global _SYSTEM_ENCODING
+        if _SYSTEM_ENCODING is None:
+            _SYSTEM_ENCODING = sys.getdefaultencoding()
+        return _SYSTEM_ENCODING
 
     @staticmethod
     def get_locale_encoding() -> str:
         """获取区域设置编码"""
-        try:
-            return locale.getpreferredencoding()
-        except:
-            return 'utf-8'
+        global _LOCALE_ENCODING
+        if _LOCALE_ENCODING is None:
+            try:
+                _LOCALE_ENCODING = locale.getpreferredencoding() or 'utf-8'
+            except:
+                _LOCALE_ENCODING = 'utf-8'
+        return _LOCALE_ENCODING
 
     @staticmethod
     def try_decode(data: bytes, encodings: list = None) -> tuple:
@@ -42,7 +75,7 @@ class EncodingHelper:
         尝试用多种编码解码数据
         
         Args:
-            data: 要解码的字节数据
+            data: 要解码的字节数据（bytes或mmap等字节缓冲区）
             encodings: 要尝试的编码列表，默认使用中文编码列表
             
         Returns:
@@ -51,15 +84,30 @@ class EncodingHelper:
         if encodings is None:
             encodings = EncodingHelper.CHINESE_ENCODINGS
         
+        # 有BOM时直接按BOM确定的编码解码
+        for bom, encoding in _BOM_ENCODINGS:
+            if data[:len(bom)] == bom:
+                try:
+                    return str(data, encoding), encoding
+                except UnicodeDecodeError:
+                    break
+        
         for encoding in encodings:
+            # 先用增量解码器检查前缀，前缀已非法的编码直接跳过
+            if len(data) > _PROBE_SIZE:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+                try:
+                    decoder.decode(data[:_PROBE_SIZE], final=False)
+                except UnicodeDecodeError:
+                    continue
             try:
-                text = data.decode(encoding)
+                text = str(data, encoding)
                 return text, encoding
             except UnicodeDecodeError:
                 continue
         
         # 如果所有编码都失败，使用utf-8并忽略错误
-        return data.decode('utf-8', errors='ignore'), 'utf-8'
+        return str(data, 'utf-8', errors='ignore'), 'utf-8'
 
     @staticmethod
     def safe_read_text(filepath: str, encodings: list = None) -> tuple:
@@ -74,6 +122,9 @@ class EncodingHelper:
             (文件内容, 使用的编码) 元组
         """
         with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return EncodingHelper.try_decode(data, encodings)
             data = f.read()
         
         return EncodingHelper.try_decode(data, encodings)
@@ -81,7 +132,7 @@ class EncodingHelper:
     @staticmethod
     def get_available_font(font_list: list = None) -> str:
         """
-        获取第一个可用的中文字体
+        获取第一个可用的中文字体（结果按进程缓存）
         
         Args:
             font_list: 要检查的字体列表，默认使用CHINESE_FONTS
@@ -89,25 +140,40 @@ class EncodingHelper:
         Returns:
             第一个可用的字体名称
         """
-        import wx
-        
         if font_list is None:
             font_list = EncodingHelper.CHINESE_FONTS
         
+        cache_key = tuple(font_list)
+        cached = _AVAILABLE_FONT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        import wx
+        
+        result = None
         for font_name in font_list:
-            try:
-                # 尝试创建字体测试是否可用
-                test_font = wx.Font(9, wx.FONTFAMILY_DEFAULT, 
-                                    wx.FONTSTYLE_NORMAL, 
-                                    wx.FONTWEIGHT_NORMAL,
-                                    faceName=font_name)
-                if test_font.GetFaceName() == font_name:
-                    return font_name
-            except:
-                continue
+            available = _FONT_AVAILABLE.get(font_name)
+            if available is None:
+                try:
+                    # 尝试创建字体测试是否可用
+                    test_font = wx.Font(9, wx.FONTFAMILY_DEFAULT, 
+                                        wx.FONTSTYLE_NORMAL, 
+                                        wx.FONTWEIGHT_NORMAL,
+                                        faceName=font_name)
+                    available = test_font.GetFaceName() == font_name
+                except:
+                    available = False
+                _FONT_AVAILABLE[font_name] = available
+            if available:
+                result = font_name
+                break
         
         # 如果都不可用，返回默认
-        return wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT).GetFaceName()
+        if result is None:
+            result = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT).GetFaceName()
+        
+        _AVAILABLE_FONT_CACHE[cache_key] = result
+        return result
 
     @staticmethod
     def ensure_utf8(text: str) -> str:
@@ -120,11 +186,18 @@ class EncodingHelper:
         Returns:
             UTF-8编码的字符串
         """
+        # 按类型身份比较，常见的str输入只需一次判断
+        text_type = type(text)
+        if text_type is str:
+            return text
+        if text_type is bytes:
+            return text.decode('utf-8', errors='ignore')
+        # str/bytes 的子类较少见，保留 isinstance 兜底
+        if isinstance(text, str):
+            return text
         if isinstance(text, bytes):
             return text.decode('utf-8', errors='ignore')
-        elif not isinstance(text, str):
-            return str(text)
-        return text
+        return str(text)
 
 
 # 全局函数
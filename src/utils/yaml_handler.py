@@ -6,8 +6,28 @@ YAML文件处理器
 
 import yaml
 import os
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# 优先使用libyaml的C实现（PyYAML官方wheel已内置），不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+    YAML_BACKEND = "libyaml"
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+    YAML_BACKEND = "pure-python"
+
+
+# 已解析文件缓存 {绝对路径: (st_mtime_ns, st_size, data)}，文件未变化时跳过解析
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点号分隔的嵌套键（结果缓存）"""
+    return tuple(key.split('.'))
 
 
 class YAMLHandler:
@@ -18,6 +38,22 @@ class YAMLHandler:
         """
         加载YAML文件
         
+        Args:
+            filepath: YAML文件路径
+            
+        Returns:
+            解析后的数据字典（调用方可自由修改），失败返回None
+        """
+        data = YAMLHandler.load_yaml_shared(filepath)
+        return copy.deepcopy(data) if data is not None else None
+
+    @staticmethod
+    def load_yaml_shared(filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        加载YAML文件，返回缓存中的共享数据（只读使用，不要修改）
+        
+        文件的修改时间和大小未变化时直接返回上次的解析结果
+        
         Args:
             filepath: YAML文件路径
             
@@ -25,15 +61,25 @@ class YAMLHandler:
             解析后的数据字典，失败返回None
         """
         try:
-            if not os.path.exists(filepath):
+            try:
+                st = os.stat(filepath)
+            except FileNotFoundError:
                 print(f"文件不存在: {filepath}")
                 return None
             
-            # 使用UTF-8编码读取
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            key = os.path.abspath(filepath)
+            cached = _YAML_CACHE.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
             
-            return data if data else {}
+            # 以字节读取，由libyaml直接按UTF-8扫描，省去一次整体解码
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = yaml.load(raw, Loader=_Loader)
+            
+            data = data if data else {}
+            _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+            return data
             
         except yaml.YAMLError as e:
             print(f"YAML解析错误: {e}")
@@ -42,6 +88,23 @@ class YAMLHandler:
             print(f"读取文件错误: {e}")
             return None
 
+    @staticmethod
+    def iter_yaml(filepath: str) -> Iterator[Any]:
+        """
+        逐个解析YAML文件中的文档（多文档文件以 --- 分隔）
+        
+        每次只构建当前文档，调用方只需前几个文档时可提前结束迭代。
+        解析错误会直接抛出 yaml.YAMLError，不经过缓存。
+        
+        Args:
+            filepath: YAML文件路径
+            
+        Yields:
+            依次解析出的文档数据
+        """
+        with open(filepath, 'rb') as f:
+            yield from yaml.load_all(f, Loader=_Loader)
+
     @staticmethod
     def save_yaml(filepath: str, data: Dict[str, Any]) -> bool:
         """
@@ -58,13 +121,20 @@ class YAMLHandler:
             # 确保目录存在
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
-            # 使用UTF-8编码写入，允许Unicode字符
-            with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(data, f, allow_unicode=True, 
-                              default_flow_style=False,
-                              sort_keys=False,
-                              indent=2)
+            # 直接序列化为UTF-8字节后一次写入，允许Unicode字符
+            raw = yaml.dump(data, Dumper=_Dumper,
+                            encoding='utf-8',
+                            allow_unicode=True,
+                            default_flow_style=False,
+                            sort_keys=False,
+                            indent=2)
+            # 先写临时文件再原子替换，保存中途出错不会留下半截配置文件
+            tmp_path = f"{filepath}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, filepath)
             
+            _YAML_CACHE.pop(os.path.abspath(filepath), None)
             return True
             
         except Exception as e:
@@ -84,7 +154,7 @@ class YAMLHandler:
         Returns:
             键对应的值或默认值
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         value = data
         
         try:
@@ -103,14 +173,19 @@ class YAMLHandler:
             data: 数据字典
             key: 键名（支持点号分隔的嵌套键）
             value: 要设置的值
+            
+        Raises:
+            TypeError: 路径中间的节点已存在但不是字典
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         current = data
         
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+        for i in range(len(keys) - 1):
+            current = current.setdefault(keys[i], {})
+            if not isinstance(current, dict):
+                raise TypeError(
+                    f"无法设置 '{key}': 节点 '{'.'.join(keys[:i + 1])}' "
+                    f"是 {type(current).__name__} 而不是字典")
         
         current[keys[-1]] = value
 
@@ -21,7 +21,7 @@ if not exist "venv" (
 
 :: 3. 启动Web服务器（后台运行）
 echo [INFO] Starting Web Server...
-start /b python web_api.py
+start /b python serve.py
 
 :: 4. 等待服务器启动
 echo [INFO] Waiting for server to initialize...
@@ -5,6 +5,9 @@ import sys
 import io
 from datetime import datetime
 
+# 日志系统是否已初始化，重复调用 setup_logging 时直接返回
+_INITIALIZED = False
+
 def setup_logging(log_path="logs/generation.log", level="INFO"):
     """
     配置日志系统
@@ -13,6 +16,10 @@ def setup_logging(log_path="logs/generation.log", level="INFO"):
         log_path: 日志文件路径
         level: 日志级别
     """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return logging.getLogger(__name__)
+    
     # 确保日志目录存在
     os.makedirs(os.path.dirname(log_path), exist_ok=True)
     
@@ -44,8 +51,11 @@ def setup_logging(log_path="logs/generation.log", level="INFO"):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=handlers
     )
+    # 日志调用统一使用 %-style 参数（logger.info("...: %s", value)），
+    # 被级别过滤掉的日志不会产生任何格式化开销
     
     logger = logging.getLogger(__name__)
-    logger.info(f"日志系统已初始化: {log_file}")
+    logger.info("日志系统已初始化: %s", log_file)
     
+    _INITIALIZED = True
     return logger
@@ -1,34 +1,105 @@
 """简易Web API服务器 - 支持UI界面、文献池上传和论文生成"""
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, stream_with_context
 from flask_cors import CORS
 import os
+import re
+import sys
+import json
+import hashlib
+import shutil
+import subprocess
 import time
 import logging
 import threading
 import uuid
-import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from itertools import islice
+from functools import lru_cache
+from pathlib import Path
 from main import main as generate_paper_main
 from core.project_manager import ProjectLiteratureManager
 
-# 自定义日志处理器，用于将日志输出到内存队列，供前端轮询
-class QueueHandler(logging.Handler):
-    def __init__(self, log_queue):
-        super().__init__()
-        self.log_queue = log_queue
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# 前端超过此时间（秒）未读取日志时，只收集 WARNING 及以上级别
+LOG_IDLE_TIMEOUT = 60
+
+# 仅用于带异常信息的记录（需要即时格式化 traceback）
+_VERBOSE_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_PLAIN_FORMATTER = logging.Formatter()
+
+# 当前执行上下文中正在收集日志的任务；由 task_log_capture 设置，线程/协程间互不影响
+_active_log_tasks = ContextVar('active_log_tasks', default=())
+
+# 自定义日志处理器，用于将日志输出到任务的内存队列，供前端轮询
+class TaskLogDispatcher(logging.Handler):
+    """
+    全局唯一的根日志处理器，将日志分发给当前上下文中的任务（_active_log_tasks）
+    
+    只入队轻量数据，格式化推迟到读取时（_format_log）：
+    任务 log_verbose 为 True 时入队 (created, name, levelname, message) 元组，读取时格式化为
+    "asctime - name - levelname - message"；否则只入队消息文本
+    """
     def emit(self, record):
+        active = _active_log_tasks.get()
+        if not active:
+            return
         try:
-            msg = self.format(record)
-            self.log_queue.put(msg)
+            for task in active:
+                # 无人读取时丢弃低级别日志，省去大量 INFO 的处理
+                if (record.levelno < logging.WARNING
+                        and time.monotonic() - task['last_read'] > LOG_IDLE_TIMEOUT):
+                    continue
+                verbose = task.get('log_verbose', False)
+                if record.exc_info:
+                    formatter = _VERBOSE_FORMATTER if verbose else _PLAIN_FORMATTER
+                    _push_log(task, formatter.format(record))
+                elif verbose:
+                    _push_log(task, (record.created, record.name, record.levelname, record.getMessage()))
+                else:
+                    _push_log(task, record.getMessage())
         except Exception:
             self.handleError(record)
 
+@contextmanager
+def task_log_capture(task, verbose=False):
+    """在此上下文内（当前线程及其派生的协程）产生的日志写入 task 的日志队列"""
+    task['log_verbose'] = verbose
+    token = _active_log_tasks.set(_active_log_tasks.get() + (task,))
+    try:
+        yield
+    finally:
+        _active_log_tasks.reset(token)
+
+def _push_log(task, entry):
+    """追加一条日志到任务的待读队列并唤醒等待中的 SSE 连接（deque.append 本身线程安全）"""
+    task['log_queue'].append(entry)
+    task['log_event'].set()
+
+def _format_log(entry):
+    """将 TaskLogDispatcher 入队的条目格式化为日志文本"""
+    if type(entry) is str:
+        return entry
+    created, name, levelname, message = entry
+    asctime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+    return "%s,%03d - %s - %s - %s" % (asctime, (created - int(created)) * 1000, name, levelname, message)
+
 app = Flask(__name__, static_folder='static', static_url_path='')
 CORS(app)
+# 部署在 nginx 等反向代理之后时，设置 USE_X_SENDFILE=1 交由代理以 sendfile 零拷贝发送下载文件
+app.use_x_sendfile = bool(os.getenv('USE_X_SENDFILE'))
 
 # 基础配置
 logging.basicConfig(level=logging.INFO)
+# 启动时挂载一次，任务通过 task_log_capture 订阅，无需每个任务增删根日志处理器
+logging.getLogger().addHandler(TaskLogDispatcher())
 system_logger = logging.getLogger(__name__)
 
 TEMP_DIR = "temp_uploads"
@@ -39,46 +110,125 @@ proj_mgr = ProjectLiteratureManager("data/projects")
 # 全局任务存储 {task_id: task_info}
 tasks = {}
 
+# 每个任务在内存中保留的最近日志条数
+LOG_BUFFER_SIZE = 10000
+
+# 保护日志出队与计数，避免并发轮询时 log_count 与 logs 不一致
+_logs_lock = threading.Lock()
+
+# SSE 无新日志时的心跳间隔（秒），同时也是检查任务结束状态的周期
+SSE_HEARTBEAT = 15
+
+_FINISHED_STATUSES = ('completed', 'failed')
+
+# 论文生成线程池：限制同时运行的生成任务数，超出的任务排队等待（状态保持 pending）
+GEN_WORKERS = int(os.getenv('GEN_WORKERS', '2'))
+_gen_executor = ThreadPoolExecutor(max_workers=GEN_WORKERS, thread_name_prefix='gen')
+
+# 已结束任务在内存中的保留时间（秒）及清理周期
+TASK_TTL = 3600
+REAP_INTERVAL = 60
+
+def _drain_logs(task):
+    """将待读队列中的新日志移入任务日志缓冲区（调用方需持有 _logs_lock）"""
+    # popleft 与生产者的 append 均为原子操作，无需额外加锁
+    pending = task['log_queue']
+    batch = []
+    while pending:
+        batch.append(pending.popleft())
+    task['logs'].extend(batch)
+    task['log_count'] += len(batch)
+
+def _logs_since(task, since):
+    """出队新日志并返回 (游标之后的日志, 新游标)；since 为 None 时返回缓冲区内全部日志"""
+    with _logs_lock:
+        task['last_read'] = time.monotonic()
+        _drain_logs(task)
+        logs = task['logs']
+        log_count = task['log_count']
+        if since is None:
+            entries = list(logs)
+        else:
+            # 游标早于缓冲区起点（已被淘汰）时从缓冲区开头返回
+            start = max(0, since - (log_count - len(logs)))
+            entries = list(islice(logs, start, None))
+    return [_format_log(e) for e in entries], log_count
+
+def _task_result(task):
+    """任务状态与结果字段（不含日志）"""
+    # 先整体复制一次，保证各字段取自同一次状态转换
+    state = task.copy()
+    return {
+        'status': state['status'],
+        'project_id': state.get('project_id'),
+        'output_result': state.get('output_result'), # Pass full result dict
+        'error': state.get('error')
+    }
+
+@lru_cache(maxsize=256)
+def _project_root(project_id):
+    """项目根目录（缓存解析结果与存在性检查），项目不存在返回None；创建项目后需 cache_clear()"""
+    path = Path(proj_mgr.base_dir) / project_id
+    return path if path.is_dir() else None
+
+def _json_bytes(obj):
+    """序列化为 UTF-8 JSON 字节，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _json_response(obj):
+    """jsonify 的替代：热点接口使用 _json_bytes 直接生成响应体"""
+    return Response(_json_bytes(obj), mimetype='application/json')
+
+def _find_project_id(project_name):
+    """
+    按名称查找最新的项目ID，无匹配时返回最新项目
+    
+    项目ID以创建时间戳开头，按名称字典序即可比较新旧，
+    只需一次 scandir，无需 list_projects 对每个项目 stat 并排序
+    """
+    try:
+        with os.scandir(proj_mgr.base_dir) as it:
+            ids = [entry.name for entry in it if entry.is_dir()]
+    except FileNotFoundError:
+        return None
+    matched = [pid for pid in ids if project_name in pid]
+    return max(matched or ids, default=None)
+
 def run_generation_task(task_id, project_name, literature_txt_path, pdf_folder_path):
     """后台运行生成任务"""
     task = tasks[task_id]
-    log_queue = task['log_queue']
     
-    # 设置根日志记录器以捕获所有模块的日志
-    root_logger = logging.getLogger()
-    queue_handler = QueueHandler(log_queue)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    queue_handler.setFormatter(formatter)
-    root_logger.addHandler(queue_handler)
-    
-    try:
-        task['status'] = 'running'
-        task['logs'].append(f"任务开始: {project_name}")
+    # 捕获本任务执行期间所有模块的日志
+    with task_log_capture(task, verbose=True):
+        try:
+            task['status'] = 'running'
+            _push_log(task, f"任务开始: {project_name}")
         
-        # 调用主程序
-        output_path = generate_paper_main(
-            project_name=project_name,
-            literature_txt_path=literature_txt_path,
-            pdf_folder_path=pdf_folder_path
-        )
+            # 调用主程序
+            output_path = generate_paper_main(
+                project_name=project_name,
+                literature_txt_path=literature_txt_path,
+                pdf_folder_path=pdf_folder_path
+            )
         
-        # 获取项目ID（假设是最新的一个）
-        projects = proj_mgr.list_projects()
-        current_project = next((p for p in projects if project_name in p['id']), projects[0] if projects else None)
+            # 提交时已知项目ID则直接使用，否则按名称查找
+            project_id = task.get('project_id') or _find_project_id(project_name)
         
-        task['status'] = 'completed'
-        task['output_result'] = output_path  # Now a dict
-        task['project_id'] = current_project['id'] if current_project else None
-        task['logs'].append("任务完成！")
+            # 一次 update 原子地写入终态，读取方不会看到 completed 但结果尚未写入的中间状态
+            task.update({
+                'output_result': output_path,  # Now a dict
+                'project_id': project_id,
+                'completed_at': time.time(),
+                'status': 'completed'
+            })
+            _push_log(task, "任务完成！")
         
-    except Exception as e:
-        task['status'] = 'failed'
-        task['error'] = str(e)
-        task['logs'].append(f"任务出错: {str(e)}")
-        system_logger.error(f"Task {task_id} failed: {e}", exc_info=True)
-    finally:
-        # 清理handler
-        root_logger.removeHandler(queue_handler)
+        except Exception as e:
+            task.update({'error': str(e), 'completed_at': time.time(), 'status': 'failed'})
+            _push_log(task, f"任务出错: {str(e)}")
+            system_logger.error("Task %s failed: %s", task_id, e, exc_info=True)
 
 @app.route('/')
 def index():
@@ -100,6 +250,7 @@ def create_project_api():
         
         project_path = proj_mgr.create_project(title)
         project_id = os.path.basename(project_path)
+        _project_root.cache_clear()
         
         # 可以选择保存idea到文件
         
@@ -111,12 +262,33 @@ def create_project_api():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# 流式上传时每次读写的块大小
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# 并行保存上传PDF的线程数
+UPLOAD_SAVE_WORKERS = 4
+
+# 合法的PDF文件名：不以点开头，不含路径分隔符、Windows保留字符与控制字符（允许中文）
+_SAFE_PDF_NAME = re.compile(r'^(?!\.)[^<>:"/\\|?*\x00-\x1f]{1,200}\.pdf$', re.IGNORECASE)
+
+def _safe_pdf_name(filename):
+    """校验上传的PDF文件名，不合法返回None（在任何文件系统调用之前拒绝）"""
+    name = (filename or '').strip()
+    return name if _SAFE_PDF_NAME.match(name) else None
+
+def _save_upload(file, target_path):
+    """以 1 MiB 块将上传文件写入目标路径"""
+    with open(target_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as out:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        shutil.copyfileobj(file.stream, out, UPLOAD_CHUNK_SIZE)
+
 @app.route('/api/projects/<project_id>/upload', methods=['POST'])
 def upload_to_project(project_id):
     """上传文件到指定项目"""
     try:
-        project_path = os.path.join(proj_mgr.base_dir, project_id)
-        if not os.path.exists(project_path):
+        project_path = _project_root(project_id)
+        if project_path is None:
             return jsonify({'success': False, 'error': 'Project not found'}), 404
 
         uploaded = []
@@ -127,7 +299,7 @@ def upload_to_project(project_id):
             if file.filename:
                 # 存到 literature/literature_pool.txt
                 # 直接保存到目标位置
-                target_path = os.path.join(project_path, "literature", "literature_pool.txt")
+                target_path = project_path / "literature" / "literature_pool.txt"
                 file.save(target_path)
                 uploaded.append("literature_pool.txt")
 
@@ -135,77 +307,148 @@ def upload_to_project(project_id):
         if 'pdf_files' in request.files:
             files = request.files.getlist('pdf_files')
             pdf_dir = proj_mgr.get_pdf_folder_path(project_path)
+            jobs = []
             for file in files:
-                if file.filename:
-                    file.save(os.path.join(pdf_dir, file.filename))
-                    uploaded.append(file.filename)
+                name = _safe_pdf_name(file.filename)
+                if name is not None:
+                    jobs.append((file, os.path.join(pdf_dir, name)))
+                    uploaded.append(name)
+            # 写文件时释放GIL，多个文件并行保存可重叠磁盘I/O
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(UPLOAD_SAVE_WORKERS, len(jobs))) as executor:
+                    list(executor.map(lambda job: _save_upload(*job), jobs))
                     
         return jsonify({'success': True, 'message': f"Uploaded {len(uploaded)} files"})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def run_gen_task(task_id, project_id, extra_idea):
-    task = tasks[task_id]
-    log_queue = task['log_queue']
-    root_logger = logging.getLogger()
-    queue_handler = QueueHandler(log_queue)
-    root_logger.addHandler(queue_handler)
+@app.route('/api/projects/<project_id>/upload_stream', methods=['POST'])
+def upload_stream_to_project(project_id):
+    """
+    流式上传单个文件到指定项目（请求体即文件内容）
+    
+    查询参数:
+        kind: literature（文献池TXT）或 pdf
+        filename: 原始文件名（kind=pdf 时必填）
     
+    绕过 multipart 表单解析，按 1 MiB 块直接写入目标文件，大文件内存占用恒定
+    """
     try:
-        task['status'] = 'running'
-        task['logs'].append(f"启动生成任务: {project_id}")
+        project_path = _project_root(project_id)
+        if project_path is None:
+            return jsonify({'success': False, 'error': 'Project not found'}), 404
+
+        kind = request.args.get('kind', 'pdf')
+        if kind == 'literature':
+            target_path = project_path / "literature" / "literature_pool.txt"
+            saved_name = "literature_pool.txt"
+        else:
+            filename = _safe_pdf_name(request.args.get('filename'))
+            if filename is None:
+                return jsonify({'success': False, 'error': 'Invalid filename'}), 400
+            target_path = os.path.join(proj_mgr.get_pdf_folder_path(project_path), filename)
+            saved_name = filename
+
+        with open(target_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as f:
+            while True:
+                chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+
+        return jsonify({'success': True, 'message': f"Uploaded {saved_name}"})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def run_gen_task(task_id, project_id, extra_idea):
+    task = tasks[task_id]
+    with task_log_capture(task):
+        try:
+            task['status'] = 'running'
+            _push_log(task, f"启动生成任务: {project_id}")
         
-        # 强制重新加载配置文件，确保获取最新的模型模式设置
-        from config import config
-        config._config = config._load_config()
-        task['logs'].append(f"当前模型模式: {config.get('model_routing.default')}")
+            # 配置文件有变化时重新加载，确保获取最新的模型模式设置
+            from config import config
+            config.reload_if_changed()
+            _push_log(task, f"当前模型模式: {config.get('model_routing.default')}")
         
-        # 获取项目特定的绝对路径
-        project_path = os.path.join(proj_mgr.base_dir, project_id)
+            # 获取项目特定的绝对路径
+            project_path = _project_root(project_id)
+            if project_path is None:
+                raise FileNotFoundError(f"项目不存在: {project_id}")
         
-        # 1. 明确指定文献池路径
-        uploaded_pool = os.path.join(project_path, "literature", "literature_pool.txt")
-        if os.path.exists(uploaded_pool):
-            lit_path = uploaded_pool
-        else:
-            # 即使不存在也传这个路径（让main去处理"纯网络模式"）
-            # 或者传None让main处理? main如果不传会用默认。
-            # 为了避免用默认，如果文件不存在，应该传None? 
-            # 不，main里如果传了path但文件不存在，LiteratureParser会返回空列表（符合预期）
+            # 1. 明确指定文献池路径
+            # 即使文件不存在也传这个路径（让main去处理"纯网络模式"）：
+            # main里如果传了path但文件不存在，LiteratureParser会返回空列表（符合预期），
             # 但如果传None，main可能会去读config.yaml里的默认路径
-            lit_path = uploaded_pool
+            lit_path = str(project_path / "literature" / "literature_pool.txt")
 
-        # 2. 明确指定PDF路径
-        project_pdf_dir = os.path.join(project_path, "pdfs")
-        # 确保PDF目录存在
-        if not os.path.exists(project_pdf_dir):
-            os.makedirs(project_pdf_dir)
-        pdf_path = project_pdf_dir
+            # 2. 明确指定PDF路径
+            project_pdf_dir = project_path / "pdfs"
+            # 确保PDF目录存在
+            project_pdf_dir.mkdir(exist_ok=True)
+            pdf_path = str(project_pdf_dir)
 
-        # 3. 强制确保配置已更新（如果main重新加载config）
-        # 在这里再次尝试重新应用一下当前内存里的配置到环境变量，作为双重保险
-        from config import config
-        if config.get('model_routing.default') == 'lmstudio':
-             pass # 已经是一个内存对象了
-        
-        # 调用main
-        output_path = generate_paper_main(
-            project_name=project_id,
-            literature_txt_path=lit_path,
-            pdf_folder_path=pdf_path,
-            extra_idea=extra_idea
-        )
+            # 调用main
+            output_path = generate_paper_main(
+                project_name=project_id,
+                literature_txt_path=lit_path,
+                pdf_folder_path=pdf_path,
+                extra_idea=extra_idea
+            )
         
-        task['status'] = 'completed'
-        task['output_result'] = output_path # Now a dict
-        task['project_id'] = project_id
-        task['logs'].append("任务完成！")
-    except Exception as e:
-        task['status'] = 'failed'
-        task['error'] = str(e)
-        system_logger.error(f"Task failed: {e}", exc_info=True)
-    finally:
-        root_logger.removeHandler(queue_handler)
+            # 一次 update 原子地写入终态，读取方不会看到 completed 但结果尚未写入的中间状态
+            task.update({
+                'output_result': output_path, # Now a dict
+                'project_id': project_id,
+                'completed_at': time.time(),
+                'status': 'completed'
+            })
+            _push_log(task, "任务完成！")
+        except Exception as e:
+            task.update({'error': str(e), 'completed_at': time.time(), 'status': 'failed'})
+            system_logger.error("Task failed: %s", e, exc_info=True)
+
+def _persist_task_logs(task_id, task):
+    """任务被清理前，将缓冲区中的日志写入 项目/output/logs/<task_id>.log"""
+    project_path = _project_root(task['project_id']) if task.get('project_id') else None
+    if project_path is None:
+        return
+    log_dir = project_path / "output" / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with _logs_lock:
+        _drain_logs(task)
+        entries = list(task['logs'])
+    with open(log_dir / f"{task_id}.log", 'w', encoding='utf-8') as f:
+        f.writelines(_format_log(e) + '\n' for e in entries)
+
+def _reap_tasks():
+    """后台线程：定期清理结束超过 TASK_TTL 的任务，防止 tasks 无限增长"""
+    while True:
+        time.sleep(REAP_INTERVAL)
+        now = time.time()
+        for task_id, task in list(tasks.items()):
+            if task['status'] in _FINISHED_STATUSES and now - task.get('completed_at', now) > TASK_TTL:
+                try:
+                    _persist_task_logs(task_id, task)
+                except Exception as e:
+                    system_logger.warning("保存任务日志失败 %s: %s", task_id, e)
+                tasks.pop(task_id, None)
+
+threading.Thread(target=_reap_tasks, name='task-reaper', daemon=True).start()
+
+def _on_gen_done(task_id, future):
+    """生成任务结束回调：统一设置终态并释放 future 引用"""
+    task = tasks.get(task_id)
+    if task is None:
+        return
+    task.pop('future', None)
+    if task['status'] in _FINISHED_STATUSES:
+        return
+    # 被取消或 run_gen_task 之外抛出的异常
+    error = '任务已取消' if future.cancelled() else str(future.exception())
+    task.update({'error': error, 'completed_at': time.time(), 'status': 'failed'})
+    _push_log(task, f"任务出错: {error}")
 
 @app.route('/api/generate_ex', methods=['POST'])
 def generate_ex():
@@ -215,65 +458,131 @@ def generate_ex():
     extra_idea = data.get('extra_idea')
     
     task_id = str(uuid.uuid4())
-    log_queue = queue.Queue()
     tasks[task_id] = {
         'id': task_id,
         'status': 'pending', 
-        'logs': [], 
-        'log_queue': log_queue,
+        'logs': deque(maxlen=LOG_BUFFER_SIZE),  # 最近日志（环形缓冲）
+        'log_count': 0,  # 累计日志条数，作为增量读取的游标
+        'log_queue': deque(),  # 生产者写入、读取时批量移入 logs
+        'log_event': threading.Event(),  # 有新日志时置位，唤醒 SSE 连接
+        'last_read': time.monotonic(),  # 前端最近一次读取日志的时间
         'created_at': datetime.now().isoformat()
     }
     
-    t = threading.Thread(target=run_gen_task, args=(task_id, project_id, extra_idea))
-    t.daemon = True
-    t.start()
+    future = _gen_executor.submit(run_gen_task, task_id, project_id, extra_idea)
+    tasks[task_id]['future'] = future
+    future.add_done_callback(lambda f, task_id=task_id: _on_gen_done(task_id, f))
     
     return jsonify({'success': True, 'task_id': task_id})
 
 
 @app.route('/api/task_status/<task_id>', methods=['GET'])
 def get_task_status(task_id):
-    """获取任务状态和新日志"""
+    """
+    获取任务状态和日志
+    
+    查询参数 since: 上次返回的 next_since，只返回此后的新日志；不传则返回缓冲区内全部日志
+    """
     task = tasks.get(task_id)
     if not task:
         return jsonify({'success': False, 'error': '任务不存在'}), 404
-        
-    # 从队列读取新日志并追加到logs列表
-    new_logs = []
-    try:
+    
+    since = request.args.get('since', type=int)
+    new_logs, next_since = _logs_since(task, since)
+    result = _task_result(task)
+    
+    # (游标, 新游标, 状态) 唯一确定响应内容：未变化时返回 304 或复用上次序列化结果
+    etag = hashlib.blake2b(repr((since, next_since, result)).encode('utf-8'), digest_size=8).hexdigest()
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    
+    cached = task.get('status_cache')
+    if cached is not None and cached[0] == etag:
+        body = cached[1]
+    else:
+        body = _json_bytes({
+            'success': True,
+            'logs': new_logs,
+            'next_since': next_since,
+            **result
+        })
+        task['status_cache'] = (etag, body)
+    
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+@app.route('/api/task_stream/<task_id>', methods=['GET'])
+def stream_task(task_id):
+    """
+    以 Server-Sent Events 推送任务日志，任务结束时发送 done 事件后关闭
+    
+    事件 id 为日志游标，浏览器断线重连时通过 Last-Event-ID 续传
+    """
+    task = tasks.get(task_id)
+    if not task:
+        return jsonify({'success': False, 'error': '任务不存在'}), 404
+    
+    since = request.headers.get('Last-Event-ID', type=int)
+    if since is None:
+        since = request.args.get('since', 0, type=int)
+    
+    def gen():
+        cursor = since
         while True:
-            msg = task['log_queue'].get_nowait()
-            task['logs'].append(msg)
-            new_logs.append(msg)
-    except queue.Empty:
-        pass
+            # 阻塞等待新日志，避免空转轮询；先 clear 再读取，不会漏掉期间写入的日志
+            woke = task['log_event'].wait(timeout=SSE_HEARTBEAT)
+            task['log_event'].clear()
+            new_logs, cursor = _logs_since(task, cursor)
+            if new_logs:
+                yield f"id: {cursor}\ndata: {_json_bytes({'logs': new_logs}).decode('utf-8')}\n\n"
+            elif not woke:
+                yield ": heartbeat\n\n"
+            if task['status'] in _FINISHED_STATUSES:
+                new_logs, cursor = _logs_since(task, cursor)
+                payload = {'logs': new_logs, **_task_result(task)}
+                yield f"id: {cursor}\nevent: done\ndata: {_json_bytes(payload).decode('utf-8')}\n\n"
+                return
     
-    return jsonify({
-        'success': True,
-        'status': task['status'],
-        'logs': task['logs'],  # 返回所有日志或增量日志，前端可以处理
-        'project_id': task.get('project_id'),
-        'output_result': task.get('output_result'), # Pass full result dict
-        'error': task.get('error')
-    })
+    return Response(stream_with_context(gen()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/download/<project_id>/<filename>', methods=['GET'])
 def download_file(project_id, filename):
     try:
-        project_path = os.path.join(proj_mgr.base_dir, project_id)
-        file_path = os.path.join(project_path, "output", filename)
-        if not os.path.exists(file_path):
+        project_path = _project_root(project_id)
+        if project_path is None:
+            return jsonify({'success': False, 'error': '文件不存在'}), 404
+        file_path = project_path / "output" / filename
+        if not file_path.is_file():
             return jsonify({'success': False, 'error': '文件不存在'}), 404
-        return send_file(file_path, as_attachment=True)
+        # conditional/etag 支持 Range 与 If-None-Match（304 跳过文件体）；
+        # 传入路径而非文件对象，服务器提供 wsgi.file_wrapper（如 waitress）时由其直接发送文件
+        return send_file(file_path, as_attachment=True, download_name=file_path.name,
+                         conditional=True, etag=True, max_age=0)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _spawn_open(path):
+    """用系统文件管理器打开目录，启动后立即返回，不等待其结束"""
+    if sys.platform == 'win32':
+        subprocess.Popen(['explorer', str(path)], close_fds=True,
+                         creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+        subprocess.Popen([opener, str(path)], close_fds=True, start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
 @app.route('/api/open_folder/<project_id>', methods=['GET'])
 def open_folder(project_id):
     """在资源管理器中打开文件夹"""
     try:
-        project_path = os.path.join(proj_mgr.base_dir, project_id, "output")
-        os.startfile(project_path)  # 仅Windows有效
+        project_path = _project_root(project_id)
+        if project_path is None:
+            return jsonify({'success': False, 'error': 'Project not found'}), 404
+        _spawn_open(project_path / "output")
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -283,20 +592,21 @@ def get_all_config():
     """获取所有配置"""
     try:
         from config import config
-        return jsonify({
+        snap = config.snapshot()
+        return _json_response({
             'success': True,
             'config': {
-                'default_mode': config.get('model_routing.default'),
+                'default_mode': snap.get('model_routing.default'),
                 'silicon': {
-                    'model': config.get('model_routing.silicon.model'),
-                    'max_tokens': config.get('model_routing.silicon.max_tokens'),
-                    'temperature': config.get('model_routing.silicon.temperature'),
-                    'enable_thinking': config.get('model_routing.silicon.enable_thinking'),
-                    'thinking_budget': config.get('model_routing.silicon.thinking_budget')
+                    'model': snap.get('model_routing.silicon.model'),
+                    'max_tokens': snap.get('model_routing.silicon.max_tokens'),
+                    'temperature': snap.get('model_routing.silicon.temperature'),
+                    'enable_thinking': snap.get('model_routing.silicon.enable_thinking'),
+                    'thinking_budget': snap.get('model_routing.silicon.thinking_budget')
                 },
                 'lmstudio': {
-                    'base_url': config.get('model_routing.lmstudio.base_url'),
-                    'model': config.get('model_routing.lmstudio.model')
+                    'base_url': snap.get('model_routing.lmstudio.base_url'),
+                    'model': snap.get('model_routing.lmstudio.model')
                 }
             }
         })
@@ -331,15 +641,20 @@ def update_config():
         if 'local_url' in data: lmstudio['base_url'] = data['local_url']
         if 'local_model' in data: lmstudio['model'] = data['local_model']
         
-        # 保存到文件
-        config.save()
+        # 后台合并写盘，请求无需等待 YAML 序列化与磁盘写入
+        config.save_async()
         
-        system_logger.info(f"配置已更新并保存: {data}")
+        system_logger.info("配置已更新并保存: %s", data)
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 if __name__ == '__main__':
-    print(f"WEB UI服务启动: http://localhost:5000")
-    app.run(host='0.0.0.0', port=5000, threaded=True)
+    if os.getenv('FLASK_DEV'):
+        # 开发调试：Werkzeug 开发服务器
+        print(f"WEB UI服务启动(开发模式): http://localhost:5000")
+        app.run(host='0.0.0.0', port=5000)
+    else:
+        from serve import run
+        run(app)
 
@@ -11,32 +11,63 @@ import wx.adv
 import wx.lib.newevent
 import sys
 import threading
+import time
+import traceback
 import logging
 import os
 import queue
 import json
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 import webbrowser
 import asyncio
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 设置 logger
 logger = logging.getLogger(__name__)
 
+# requests 导入较慢（urllib3 等），仅在首次测试API连接时导入并缓存
+_requests = None
+
+def _get_requests():
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
 # Custom Events
-LogEvent, EVT_LOG = wx.lib.newevent.NewEvent()
 DoneEvent, EVT_DONE = wx.lib.newevent.NewEvent()
 OutlineEvent, EVT_OUTLINE = wx.lib.newevent.NewEvent()
-ProgressEvent, EVT_PROGRESS = wx.lib.newevent.NewEvent()  # 进度更新事件
+
+# 提示文字颜色（wx.Colour 为纯值对象，可在 wx.App 创建前构造）
+_GREY_100 = wx.Colour(100, 100, 100)
+_GREY_80 = wx.Colour(80, 80, 80)
+
+# 进度合并刷新的间隔（毫秒），界面最多约 20 次/秒更新进度
+_PROGRESS_FLUSH_MS = 50
+
+# 日志框合并刷新的间隔（毫秒）
+_LOG_FLUSH_MS = 50
+# 日志框字符上限，超出后从头部删除，保留最近 _LOG_KEEP_CHARS 个字符
+_LOG_MAX_CHARS = 200_000
+_LOG_KEEP_CHARS = 150_000
 
 # Import system modules
 try:
     from main import main as generate_paper_main
     from config import config
     from core.project_manager import ProjectLiteratureManager
+    from core.model_router import ModelRouter
 except ImportError as e:
     print(f"Import Error: {e}")
 
-# 历史记录管理
 # 历史记录管理
 if getattr(sys, 'frozen', False):
     # Frozen: use executable directory
@@ -45,35 +76,155 @@ else:
     # Dev: use script directory
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-HISTORY_FILE = os.path.join(BASE_DIR, "output", "history.json")
+# "打开输出目录"按钮对应的目录（脚本所在目录下的 output）
+_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+
+HISTORY_PATH = Path(BASE_DIR) / "output" / "history.json"
+# 追加写入的增量记录（每行一条），读取时合并到 HISTORY_PATH 的内容之上
+HISTORY_JSONL_PATH = HISTORY_PATH.with_suffix(".jsonl")
+# 增量文件超过此大小时，退出程序时合并回 HISTORY_PATH
+HISTORY_COMPACT_SIZE = 1 << 20
+
+# 历史项目数超过此值时刷新后不再全部展开，由用户按需展开
+_HISTORY_EXPAND_LIMIT = 50
+
+# 输出目录是否已确认存在，避免每次写入都 makedirs
+_HISTORY_DIR_READY = False
+
+def _ensure_history_dir():
+    global _HISTORY_DIR_READY
+    if not _HISTORY_DIR_READY:
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _HISTORY_DIR_READY = True
+
+def _json_loads(data):
+    """解析 UTF-8 JSON 字节，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """序列化为缩进的 UTF-8 JSON 字节，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 def load_history():
-    """加载历史记录"""
-    if os.path.exists(HISTORY_FILE):
-        try:
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    """加载历史记录（HISTORY_PATH + HISTORY_JSONL_PATH 中的增量记录）"""
+    # 直接读取，不存在时由异常处理，省去单独的 exists 检查
+    try:
+        history = _json_loads(HISTORY_PATH.read_bytes())
+    except FileNotFoundError:
+        history = {}
+    except (OSError, ValueError) as e:
+        logger.warning("历史记录文件无法读取: %s", e)
+        history = {}
+    try:
+        with HISTORY_JSONL_PATH.open('rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                    record = {'timestamp': entry['timestamp'], 'files': entry['files']}
+                    history.setdefault(entry['title'], []).append(record)
+                except (ValueError, KeyError, TypeError):
+                    continue  # 跳过写入中断导致的残缺行或缺字段的记录
+    except FileNotFoundError:
+        pass
+    return history
 
 def save_history(history):
-    """保存历史记录"""
-    os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
-    with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(history, f, ensure_ascii=False, indent=2)
-
-def add_to_history(title, files):
-    """添加到历史记录"""
-    history = load_history()
+    """保存完整历史记录，并清空已合并的增量文件"""
+    _ensure_history_dir()
+    tmp_path = HISTORY_PATH.with_suffix(".json.tmp")
+    with tmp_path.open('wb') as f:
+        f.write(_json_dumps(history))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, HISTORY_PATH)
+    try:
+        HISTORY_JSONL_PATH.unlink()
+    except FileNotFoundError:
+        pass
+
+def new_history_entry(title, files):
+    """构造一条历史记录"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    if title not in history:
-        history[title] = []
-    history[title].append({
-        'timestamp': timestamp,
-        'files': files
-    })
-    save_history(history)
+    return {'title': title, 'timestamp': timestamp, 'files': files}
+
+def append_history(entries):
+    """追加多条历史记录（一次写入 + fsync，不重写整个文件）"""
+    if orjson is not None:
+        data = b''.join(orjson.dumps(entry) + b'\n' for entry in entries)
+    else:
+        data = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries).encode('utf-8')
+    _ensure_history_dir()
+    with HISTORY_JSONL_PATH.open('ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+def _file_stamp(path):
+    """文件的 (mtime_ns, size)，不存在时返回None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _history_stamp():
+    """HISTORY_PATH 与 HISTORY_JSONL_PATH 的文件戳"""
+    return tuple(_file_stamp(path) for path in (HISTORY_PATH, HISTORY_JSONL_PATH))
+
+def compact_history():
+    """增量文件过大时合并回 HISTORY_PATH"""
+    try:
+        if HISTORY_JSONL_PATH.stat().st_size > HISTORY_COMPACT_SIZE:
+            save_history(load_history())
+    except OSError:
+        pass
+
+
+# 大纲文本预处理：全角冒号/括号统一为半角
+_OUTLINE_NORMALIZE = str.maketrans({'：': ':', '（': '(', '）': ')'})
+
+# 大纲解析规则 (类别, 正则)：同一类别内靠前的优先级更高；
+# 合并为一个交替正则一次 finditer 扫描全文，同一位置按此顺序尝试。
+# 匹配互不重叠，标签后的分隔符只取空格/制表符、取值不以冒号开头，
+# 避免空标签行越过换行吞掉下一行的内容
+_OUTLINE_RULES = [
+    ('intro_title', r'引言标题[:\t ]*([^:\s].*?)(?:\n|$)'),
+    ('intro_title', r'一[、.．][\t ]*引言[:\t ]*([^:\s].*?)(?:\n|$)'),
+    ('intro_idea', r'引言思路[:\t ]*([^:\s].*?)(?:\n|$)'),
+    ('intro_idea', r'引言[\t ]*[:：]?[\t ]*思路[:\t ]*([^:\s].*?)(?:\n|$)'),
+    ('intro_idea', r'引言(?:写作)?方向[:\t ]*([^:\s].*?)(?:\n|$)'),
+    # 标题可为空：空的"主体N标题"行仍需切换当前章节
+    ('chapter', r'主体([123])标题[:\t ]*(.*?)(?:\n|$)'),
+    ('chapter_alt', r'第([一二三])部分[:\t ]*([^:\s].*?)(?:\n|$)'),
+    # 捕获组：序号、紧随其后的"思路"标记
+    ('subtitle', r'^[^\n]*?二级标题\s*(\d)(\s*思路)?[^\n]*'),
+    ('concl_title', r'(?i:结论标题[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    # 结论思路须排在宽松的结论标题规则之前，否则"结论思路:"会被当作标题
+    ('concl_idea', r'(?i:结论思路[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    ('concl_idea', r'(?i:结论[\t ]*[:：]?[\t ]*思路[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    ('concl_idea', r'(?i:结论(?:部分|章节)?(?:的)?(?:写作)?思路[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    ('concl_idea', r'(?i:结论(?:部分|章节)?(?:内容|要点|方向)[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    ('concl_idea', r'(?i:Conclusion[\t ]*(?:Idea|思路)[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+    # 原"(?:五|六)?[、.．]?\s*结论"的前缀不影响捕获内容，去掉以免匹配起点前移到上一行换行处
+    ('concl_title', r'(?i:结论[:：]?[\t ]*([^:\s].*?)(?:\n|$))'),
+    ('concl_title', r'(?i:Conclusion[\t ]*(?:Title)?[:：][\t ]*([^:\s].*?)(?:\n|$))'),
+]
+_OUTLINE_MASTER_RE = re.compile(
+    '|'.join(f'(?P<r{i}>{pattern})' for i, (_, pattern) in enumerate(_OUTLINE_RULES)), re.M)
+# 规则名 -> (类别, 类别内优先级, 第一个捕获组的组号)
+_OUTLINE_RULE_INFO = {}
+for _i, (_kind, _) in enumerate(_OUTLINE_RULES):
+    _OUTLINE_RULE_INFO[f'r{_i}'] = (
+        _kind,
+        sum(1 for k, _ in _OUTLINE_RULES[:_i] if k == _kind),
+        _OUTLINE_MASTER_RE.groupindex[f'r{_i}'] + 1,
+    )
+_CHAPTER_NUMS = {'一': 0, '二': 1, '三': 2}
+_CONCL_SECTION_RE = re.compile(r'结论[标题]*[:：].*?\n(.+?)(?:\n\n|$)', re.DOTALL)
 
 
 class OutlineEditorDialog(wx.Dialog):
@@ -89,13 +240,14 @@ class OutlineEditorDialog(wx.Dialog):
     
     def init_ui(self):
         panel = wx.ScrolledWindow(self)
-        panel.SetScrollRate(5, 5)
+        # 冻结重绘，全部控件创建完成后再设置滚动范围并统一布局
+        panel.Freeze()
         
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # 说明文字
         intro = wx.StaticText(panel, label="请检查并编辑AI生成的大纲。您可以修改标题和思路，确认后将继续生成论文正文。")
-        intro.SetForegroundColour(wx.Colour(100, 100, 100))
+        intro.SetForegroundColour(_GREY_100)
         main_sizer.Add(intro, 0, wx.ALL, 10)
         
         # 引言部分
@@ -178,6 +330,9 @@ class OutlineEditorDialog(wx.Dialog):
         main_sizer.Add(btn_sizer, 0, wx.ALIGN_CENTER | wx.ALL, 10)
         
         panel.SetSizer(main_sizer)
+        panel.SetScrollRate(5, 5)
+        panel.Thaw()
+        panel.Layout()
         
         btn_confirm.Bind(wx.EVT_BUTTON, self.on_confirm)
         btn_cancel.Bind(wx.EVT_BUTTON, self.on_cancel)
@@ -214,6 +369,22 @@ class OutlineEditorDialog(wx.Dialog):
         self.EndModal(wx.ID_CANCEL)
 
 
+def _set_if_changed(ctrl, value):
+    """值不同才调用 SetValue，避免多余的刷新与事件"""
+    if ctrl.GetValue() != value:
+        ctrl.SetValue(value)
+
+
+# 按字号缓存的粗体字体（需在 wx.App 创建后首次调用）
+_BOLD_FONTS = {}
+
+def _bold_font(size=11):
+    font = _BOLD_FONTS.get(size)
+    if font is None:
+        font = _BOLD_FONTS[size] = wx.Font(size, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+    return font
+
+
 class WorkerThread(threading.Thread):
     """后台工作线程"""
     
@@ -229,13 +400,8 @@ class WorkerThread(threading.Thread):
     def _create_progress_callback(self):
         """创建进度回调函数"""
         def progress_callback(progress, stage=None, word_count=None, api_calls=None):
-            """发送进度事件到UI"""
-            wx.PostEvent(self.notify_window, ProgressEvent(
-                progress=progress,
-                stage=stage or "",
-                word_count=word_count,
-                api_calls=api_calls
-            ))
+            """合并到界面的待刷新进度（不逐条 PostEvent）"""
+            self.notify_window.queue_progress(progress, stage, word_count, api_calls)
         return progress_callback
 
     def run(self):
@@ -271,19 +437,31 @@ class WorkerThread(threading.Thread):
 class OutlineWorkerThread(threading.Thread):
     """大纲生成线程 - 先生成大纲，再通知主界面显示编辑对话框"""
     
-    def __init__(self, notify_window, project_name, idea, lit_path):
+    def __init__(self, notify_window, project_name, idea, lit_path, router):
         threading.Thread.__init__(self)
         self.notify_window = notify_window
         self.project_name = project_name
         self.idea = idea
         self.lit_path = lit_path
+        self.router = router  # 由 MainFrame.get_router 提供，跨多次生成复用
+        self._stop_event = threading.Event()
+    
+    def stop(self):
+        """请求停止：中断重试等待，不再发送结果"""
+        self._stop_event.set()
+    
+    def _log(self, message):
+        # stop() 后窗口可能已销毁，日志与事件都不再发送
+        if not self._stop_event.is_set():
+            self.notify_window.queue_log(message)
+    
+    def _post(self, event):
+        if not self._stop_event.is_set():
+            wx.PostEvent(self.notify_window, event)
     
     def run(self):
         try:
-            from core.model_router import ModelRouter
-            
-            # 初始化模型路由
-            router = ModelRouter(config)
+            router = self.router
             
             # 生成大纲的提示词
             prompt = f"""根据以下论文选题，设计主体内容大纲。
@@ -328,7 +506,7 @@ class OutlineWorkerThread(threading.Thread):
 
 【重要】请直接输出大纲内容，不要有任何开场白或额外说明。
 """
-            wx.PostEvent(self.notify_window, LogEvent(message="📝 正在调用AI生成大纲...\n"))
+            self._log("📝 正在调用AI生成大纲...\n")
             
             # 带重试的大纲生成
             max_retries = 3
@@ -338,15 +516,18 @@ class OutlineWorkerThread(threading.Thread):
             for attempt in range(max_retries):
                 try:
                     response = router.generate(prompt, context="你是学术论文大纲设计专家", max_tokens=8000)
+                    if self._stop_event.is_set():
+                        return
                     if response and len(response.strip()) > 100:
                         break
                     else:
-                        wx.PostEvent(self.notify_window, LogEvent(message=f"⚠️ 大纲响应过短，重试({attempt+1}/{max_retries})...\n"))
+                        self._log(f"⚠️ 大纲响应过短，重试({attempt+1}/{max_retries})...\n")
                 except Exception as retry_e:
                     last_error = retry_e
-                    wx.PostEvent(self.notify_window, LogEvent(message=f"⚠️ 大纲生成出错({attempt+1}/{max_retries}): {str(retry_e)[:100]}\n"))
-                    import time
-                    time.sleep(5)  # 等待5秒后重试
+                    self._log(f"⚠️ 大纲生成出错({attempt+1}/{max_retries}): {str(retry_e)[:100]}\n")
+                    # 指数退避（1、2秒）后重试，stop() 时立即退出
+                    if attempt + 1 < max_retries and self._stop_event.wait(1 << attempt):
+                        return
             
             if not response or len(response.strip()) < 100:
                 raise Exception(f"大纲生成失败，响应为空或过短。最后错误: {last_error}")
@@ -354,24 +535,23 @@ class OutlineWorkerThread(threading.Thread):
             # 解析AI返回的大纲
             outline_data = self._parse_outline_response(response)
             
-            wx.PostEvent(self.notify_window, LogEvent(message="✅ 大纲生成完成！\n"))
+            self._log("✅ 大纲生成完成！\n")
             
             # 发送大纲事件
-            wx.PostEvent(self.notify_window, LogEvent(message="🔔 正在发送大纲事件到主界面...\n"))
-            wx.PostEvent(self.notify_window, OutlineEvent(outline=outline_data, success=True))
-            wx.PostEvent(self.notify_window, LogEvent(message="✔️ 事件已发送，等待对话框弹出...\n"))
+            self._log("🔔 正在发送大纲事件到主界面...\n")
+            self._post(OutlineEvent(outline=outline_data, success=True))
+            self._log("✔️ 事件已发送，等待对话框弹出...\n")
             
         except Exception as e:
-            import traceback
+            if self._stop_event.is_set():
+                return
             error_details = traceback.format_exc()
-            logger.error(f"大纲生成异常: {error_details}")
-            wx.PostEvent(self.notify_window, LogEvent(message=f"❌ 大纲生成失败: {str(e)}\n"))
-            wx.PostEvent(self.notify_window, OutlineEvent(outline=None, success=False, error=str(e)))
+            logger.error("大纲生成异常: %s", error_details)
+            self._log(f"❌ 大纲生成失败: {str(e)}\n")
+            self._post(OutlineEvent(outline=None, success=False, error=str(e)))
     
     def _parse_outline_response(self, response):
         """解析AI返回的大纲格式 - 超强健壮版"""
-        import re
-        
         # 默认结构
         outline = {
             'introduction': {'title': '一、引言', 'idea': ''},
@@ -384,140 +564,102 @@ class OutlineWorkerThread(threading.Thread):
         }
         
         # 统一替换中文冒号和全角符号
-        response = response.replace('：', ':').replace('（', '(').replace('）', ')')
-        
-        # 按主体章节分块解析
-        # 先提取引言（多模式匹配）
-        intro_patterns = [
-            r'引言标题[:\s]*(.+?)(?:\n|$)',
-            r'一[、.．]\s*引言[:\s]*(.+?)(?:\n|$)',
-        ]
-        for pattern in intro_patterns:
-            intro_match = re.search(pattern, response)
-            if intro_match and intro_match.group(1).strip():
-                outline['introduction']['title'] = intro_match.group(1).strip()
-                break
-        
-        intro_idea_patterns = [
-            r'引言思路[:\s]*(.+?)(?:\n|$)',
-            r'引言\s*[:：]?\s*思路[:\s]*(.+?)(?:\n|$)',
-            r'引言(?:写作)?方向[:\s]*(.+?)(?:\n|$)',
-        ]
-        for pattern in intro_idea_patterns:
-            intro_idea_match = re.search(pattern, response)
-            if intro_idea_match and intro_idea_match.group(1).strip():
-                outline['introduction']['idea'] = intro_idea_match.group(1).strip()
-                break
+        response = response.translate(_OUTLINE_NORMALIZE)
+        
+        # 一次扫描全文：按类别记录各优先级首次出现的值，二级标题跟随最近的"主体N标题"
+        best = {}  # 类别 -> (优先级, 值)；chapter 类别的键为 ('chapter', 序号)
+        current_chapter_idx = -1
+        for m in _OUTLINE_MASTER_RE.finditer(response):
+            kind, priority, group = _OUTLINE_RULE_INFO[m.lastgroup]
+            
+            if kind == 'subtitle':
+                # 匹配不跨行，冒号后的值单独 strip，整行无需再 strip
+                line = m.group(0)
+                # 序号与"思路"标记已由规则捕获，这里只做子串判断，不再逐行跑正则
+                if ':' not in line:
+                    continue
+                # 解析二级标题思路（"二级标题1思路"）
+                if m.group(group + 1) is not None:
+                    field = 'idea'
+                # 解析二级标题（不含"思路"）
+                elif '思路' not in line:
+                    field = 'title'
+                else:
+                    continue
+                sub_idx = int(m.group(group)) - 1
+                if 0 <= current_chapter_idx < 3 and 0 <= sub_idx < 3:
+                    outline['chapters'][current_chapter_idx]['subsections'][sub_idx][field] = line.split(':', 1)[1].strip()
+                continue
+            
+            if kind in ('chapter', 'chapter_alt'):
+                # 提取主体章节（支持"主体N标题"或"第N部分"等多种格式）
+                num = m.group(group)
+                ch_idx = int(num) - 1 if kind == 'chapter' else _CHAPTER_NUMS[num]
+                if kind == 'chapter':
+                    current_chapter_idx = ch_idx
+                key, value = ('chapter', ch_idx), m.group(group + 1).strip()
+                if not value:
+                    continue
+            else:
+                key, value = kind, m.group(group).strip()
+                if not value:
+                    continue  # 引言/结论要求非空，继续尝试其它模式
+            if key not in best or priority < best[key][0]:
+                best[key] = (priority, value)
+        
+        if 'intro_title' in best:
+            outline['introduction']['title'] = best['intro_title'][1]
+        if 'intro_idea' in best:
+            outline['introduction']['idea'] = best['intro_idea'][1]
+        for ch_idx in range(3):
+            if ('chapter', ch_idx) in best:
+                outline['chapters'][ch_idx]['title'] = best[('chapter', ch_idx)][1]
         
         # 引言思路保底
         if not outline['introduction'].get('idea'):
             outline['introduction']['idea'] = f"阐述{self.project_name}的研究背景、现实意义、研究问题与方法。"
             logger.warning("引言思路解析失败，使用自动生成的默认思路")
         
-        # 提取主体章节（支持"主体N标题"或"第N部分"等多种格式）
-        for ch_idx in range(3):
-            patterns = [
-                rf'主体{ch_idx+1}标题[:\s]*(.+?)(?:\n|$)',
-                rf'第{["一","二","三"][ch_idx]}部分[:\s]*(.+?)(?:\n|$)',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, response)
-                if match:
-                    outline['chapters'][ch_idx]['title'] = match.group(1).strip()
-                    break
-        
-        # 逐行解析二级标题，跟踪当前主体章节
-        lines = response.strip().split('\n')
-        current_chapter_idx = -1
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 检测主体章节切换
-            if re.search(r'主体1标题', line):
-                current_chapter_idx = 0
-            elif re.search(r'主体2标题', line):
-                current_chapter_idx = 1
-            elif re.search(r'主体3标题', line):
-                current_chapter_idx = 2
-            
-            # 解析二级标题思路（必须在标题之前匹配，因为"二级标题1思路"包含"二级标题1"）
-            if re.search(r'二级标题\s*(\d)\s*思路', line) and ':' in line:
-                match = re.search(r'二级标题\s*(\d)', line)
-                if match:
-                    sub_idx = int(match.group(1)) - 1
-                    if 0 <= current_chapter_idx < 3 and 0 <= sub_idx < 3:
-                        idea = line.split(':', 1)[1].strip()
-                        outline['chapters'][current_chapter_idx]['subsections'][sub_idx]['idea'] = idea
-            
-            # 解析二级标题（不含"思路"）
-            elif re.search(r'二级标题\s*(\d)', line) and '思路' not in line and ':' in line:
-                match = re.search(r'二级标题\s*(\d)', line)
-                if match:
-                    sub_idx = int(match.group(1)) - 1
-                    if 0 <= current_chapter_idx < 3 and 0 <= sub_idx < 3:
-                        title = line.split(':', 1)[1].strip()
-                        outline['chapters'][current_chapter_idx]['subsections'][sub_idx]['title'] = title
-        
-        # 提取结论 - 超级健壮版（多模式匹配）
-        # 1. 尝试标准格式
-        concl_title_patterns = [
-            r'结论标题[:：]\s*(.+?)(?:\n|$)',
-            r'(?:五|六)?[、.．]?\s*结论[:：]?\s*(.+?)(?:\n|$)',
-            r'Conclusion\s*(?:Title)?[:：]\s*(.+?)(?:\n|$)',
-        ]
-        for pattern in concl_title_patterns:
-            concl_match = re.search(pattern, response, re.IGNORECASE)
-            if concl_match and concl_match.group(1).strip():
-                outline['conclusion']['title'] = concl_match.group(1).strip()
-                logger.debug(f"结论标题匹配成功: {concl_match.group(1).strip()}")
-                break
+        # 提取结论
+        if 'concl_title' in best:
+            outline['conclusion']['title'] = best['concl_title'][1]
+            logger.debug("结论标题匹配成功: %s", best['concl_title'][1])
         
         # 如果标题还是空的，设置默认值
         if not outline['conclusion'].get('title'):
             outline['conclusion']['title'] = '结论'
             logger.warning("结论标题解析失败，使用默认值")
-            
-        # 2. 尝试多种结论思路格式
-        concl_idea_patterns = [
-            r'结论思路[:：]\s*(.+?)(?:\n|$)',
-            r'结论\s*[:：]?\s*思路[:：]\s*(.+?)(?:\n|$)',
-            r'结论(?:部分|章节)?(?:的)?(?:写作)?思路[:：]\s*(.+?)(?:\n|$)',
-            r'结论(?:部分|章节)?(?:内容|要点|方向)[:：]\s*(.+?)(?:\n|$)',
-            r'Conclusion\s*(?:Idea|思路)[:：]\s*(.+?)(?:\n|$)',
-        ]
-        for pattern in concl_idea_patterns:
-            concl_idea_match = re.search(pattern, response, re.IGNORECASE)
-            if concl_idea_match and concl_idea_match.group(1).strip():
-                outline['conclusion']['idea'] = concl_idea_match.group(1).strip()
-                logger.debug(f"结论思路匹配成功: {concl_idea_match.group(1).strip()[:50]}...")
-                break
+        
+        if 'concl_idea' in best:
+            outline['conclusion']['idea'] = best['concl_idea'][1]
+            logger.debug("结论思路匹配成功: %s...", best['concl_idea'][1][:50])
         
         # 3. 如果仍然没有找到结论思路，尝试从全文末尾提取
         if not outline['conclusion'].get('idea'):
             # 查找"结论"后面的第一个非空行作为思路
-            concl_section = re.search(r'结论[标题]*[:：].*?\n(.+?)(?:\n\n|$)', response, re.DOTALL)
+            concl_section = _CONCL_SECTION_RE.search(response)
             if concl_section:
                 potential_idea = concl_section.group(1).strip().split('\n')[0]
                 if potential_idea and not potential_idea.startswith('主体') and len(potential_idea) > 5:
                     outline['conclusion']['idea'] = potential_idea
-                    logger.debug(f"结论思路（从上下文推断）: {potential_idea[:50]}...")
+                    logger.debug("结论思路（从上下文推断）: %s...", potential_idea[:50])
         
         # 4. 最终保底：如果还是没有，使用基于论文主题的默认思路
         if not outline['conclusion'].get('idea'):
             outline['conclusion']['idea'] = f"总结全文研究发现，阐述{self.project_name}的理论贡献与实践意义，并指出未来研究方向。"
-            logger.warning(f"结论思路解析失败，使用自动生成的默认思路")
+            logger.warning("结论思路解析失败，使用自动生成的默认思路")
         
-        # 日志输出解析结果
-        wx.PostEvent(self.notify_window, LogEvent(message=f"📋 解析大纲:\n"))
-        wx.PostEvent(self.notify_window, LogEvent(message=f"   引言: {outline['introduction']['title'][:30]}... 思路长度={len(outline['introduction'].get('idea', ''))}\n"))
+        # 日志输出解析结果（拼成一条，只入队一次）
+        lines = ["📋 解析大纲:\n",
+                 f"   引言: {outline['introduction']['title'][:30]}... 思路长度={len(outline['introduction'].get('idea', ''))}\n"]
         for i, ch in enumerate(outline['chapters']):
-            filled_subs = len([s for s in ch['subsections'] if s['title']])
-            filled_ideas = len([s for s in ch['subsections'] if s['idea']])
-            wx.PostEvent(self.notify_window, LogEvent(message=f"   章节{i+1}: {ch['title'][:25]}... ({filled_subs}标题/{filled_ideas}思路)\n"))
-        wx.PostEvent(self.notify_window, LogEvent(message=f"   结论: {outline['conclusion']['title'][:20]}... 思路长度={len(outline['conclusion'].get('idea', ''))}\n"))
+            filled_subs = filled_ideas = 0
+            for sub in ch['subsections']:
+                filled_subs += bool(sub['title'])
+                filled_ideas += bool(sub['idea'])
+            lines.append(f"   章节{i+1}: {ch['title'][:25]}... ({filled_subs}标题/{filled_ideas}思路)\n")
+        lines.append(f"   结论: {outline['conclusion']['title'][:20]}... 思路长度={len(outline['conclusion'].get('idea', ''))}\n")
+        self._log(''.join(lines))
         
         return outline
 
@@ -534,15 +676,42 @@ class MainFrame(wx.Frame):
         self.pending_idea = ""
         self.pending_lit_path = ""
         
+        # 大纲生成复用的模型路由器，模型配置变更时重建（见 get_router）
+        self._router = None
+        config.subscribe(self._on_config_changed)
+        self._outline_worker = None
+        
+        # 已解析的历史记录，按文件 mtime 失效（见 get_history）
+        self._history_cache = None
+        self._history_mtime = None
+        # 已入队但未写完的历史写入数；非零时缓存比磁盘新，不可重新加载
+        self._history_pending = 0
+        self._history_lock = threading.Lock()
+        # 历史文件路径 -> 是否存在，刷新历史树时清空（见 _history_file_exists）
+        self._path_exists = {}
+        # 历史记录写盘交给后台线程，界面线程只更新缓存并入队
+        self._history_q = queue.Queue()
+        self._history_thread = threading.Thread(target=self._history_writer, daemon=True)
+        self._history_thread.start()
+        
         self.init_ui()
         self.Center()
         self.Show()
 
         # Event Bindings
-        self.Bind(EVT_LOG, self.on_log_update)
         self.Bind(EVT_DONE, self.on_task_done)
         self.Bind(EVT_OUTLINE, self.on_outline_ready)
-        self.Bind(EVT_PROGRESS, self.on_progress_update)  # 进度事件绑定
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        # 工作线程日志先写入缓冲区，由界面线程每 _LOG_FLUSH_MS 合并追加一次
+        self._log_buf = deque()
+        self._log_lock = threading.Lock()
+        self._log_pending = False
+
+        # 进度同理：工作线程只覆盖最新值，界面线程定时取走
+        self._progress_latest = {}
+        self._progress_lock = threading.Lock()
+        self._progress_pending = False
 
         # Setup logging handler to redirect to GUI
         self.setup_logging()
@@ -551,6 +720,87 @@ class MainFrame(wx.Frame):
         self.generation_start_time = None
         self.generation_api_calls = 0
         self.generation_word_count = 0
+        # 上次显示的进度/耗时秒数，未变化时跳过 SetValue/SetLabel
+        self._last_progress = -1
+        self._last_elapsed_sec = -1
+
+    def get_history(self):
+        """获取历史记录，文件未变化或仍有待写入项时直接返回缓存"""
+        with self._history_lock:
+            if self._history_cache is None or (
+                    self._history_pending == 0 and _history_stamp() != self._history_mtime):
+                self._history_cache = load_history()
+                self._history_mtime = _history_stamp()
+            return self._history_cache
+
+    def _queue_history_write(self, item):
+        with self._history_lock:
+            self._history_pending += 1
+        self._history_q.put(item)
+
+    def _history_writer(self):
+        """后台写历史记录：一次取出所有待写项，合并为一次写盘"""
+        while True:
+            items = [self._history_q.get()]
+            while True:
+                try:
+                    items.append(self._history_q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in items
+            items = [item for item in items if item is not None]
+            # 最后一次全量保存已包含之前的所有变更，只需再追加其后的记录
+            last_save = max((i for i, (kind, _) in enumerate(items) if kind == 'save'), default=-1)
+            try:
+                if last_save >= 0:
+                    save_history(items[last_save][1])
+                entries = [payload for kind, payload in items[last_save + 1:] if kind == 'append']
+                if entries:
+                    append_history(entries)
+            except Exception as e:
+                logger.error("保存历史记录失败: %s", e)
+            with self._history_lock:
+                self._history_pending -= len(items)
+                # 自己写入造成的文件变化不应触发重新加载
+                if self._history_pending == 0 and self._history_cache is not None:
+                    self._history_mtime = _history_stamp()
+            if stop:
+                return
+
+    def add_to_history(self, title, files):
+        """添加到历史记录（立即更新缓存，后台追加写盘）"""
+        entry = new_history_entry(title, files)
+        self.get_history().setdefault(title, []).append({
+            'timestamp': entry['timestamp'],
+            'files': files
+        })
+        self._queue_history_write(('append', entry))
+
+    def save_history(self, history):
+        """保存完整历史记录（后台写盘，写入的是当前内容的副本）"""
+        self._queue_history_write(('save', {title: list(records) for title, records in history.items()}))
+
+    def get_router(self):
+        """获取共享的 ModelRouter（复用其HTTP连接池与限速状态）"""
+        if self._router is None:
+            self._router = ModelRouter(config)
+        return self._router
+
+    def _on_config_changed(self, key_path, old_value, new_value):
+        if key_path == '__reload__' or key_path.startswith('model_routing.'):
+            self._router = None
+
+    def on_close(self, event):
+        if self._outline_worker is not None:
+            self._outline_worker.stop()
+        config.unsubscribe(self._on_config_changed)
+        # 等待后台线程写完剩余的历史记录，再做合并
+        self._history_q.put(None)
+        self._history_thread.join(timeout=5)
+        # 超时未写完时跳过合并，避免与仍在写入的后台线程冲突
+        if not self._history_thread.is_alive():
+            compact_history()
+        event.Skip()
 
     def setup_logging(self):
         self.log_queue = queue.Queue()
@@ -561,14 +811,16 @@ class MainFrame(wx.Frame):
                 self.notify_window = notify_window
 
             def emit(self, record):
-                msg = self.format(record)
-                wx.PostEvent(self.notify_window, LogEvent(message=msg + "\n"))
+                # 只入队记录本身，格式化推迟到界面线程批量刷新时（_flush_logs）
+                if not self.notify_window:
+                    return
+                self.notify_window.queue_log(record)
 
         root_logger = logging.getLogger()
         handler = QueueHandler(self)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
         root_logger.addHandler(handler)
+        # 只含时分秒，比默认带毫秒的 asctime 格式化更快
+        self._log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
 
     def init_ui(self):
         panel = wx.Panel(self)
@@ -581,17 +833,38 @@ class MainFrame(wx.Frame):
         self.create_task_tab(self.task_tab)
         self.notebook.AddPage(self.task_tab, "任务与生成")
 
+        # 配置页与检索页控件较多，首次切换到该页时才创建（见 on_page_changed）
         self.config_tab = wx.Panel(self.notebook)
-        self.create_config_tab(self.config_tab)
         self.notebook.AddPage(self.config_tab, "模型配置")
         
         self.search_tab = wx.Panel(self.notebook)
-        self.create_search_tab(self.search_tab)
         self.notebook.AddPage(self.search_tab, "网络检索")
 
+        self._lazy_tabs = {
+            self.config_tab: self.create_config_tab,
+            self.search_tab: self.create_search_tab,
+        }
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+
         main_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 5)
         panel.SetSizer(main_sizer)
 
+    def on_page_changed(self, event):
+        """首次显示延迟创建的标签页时构建其控件"""
+        self._build_lazy_tab(self.notebook.GetPage(event.GetSelection()))
+        event.Skip()
+
+    def _build_lazy_tab(self, page):
+        """若 page 尚未构建则立即构建（也供需要读取其控件的处理函数调用）"""
+        builder = self._lazy_tabs.pop(page, None)
+        if builder is not None:
+            page.Freeze()
+            try:
+                builder(page)
+                page.Layout()
+            finally:
+                page.Thaw()
+
     def create_task_tab(self, parent):
         sizer = wx.BoxSizer(wx.VERTICAL)
         
@@ -661,7 +934,7 @@ class MainFrame(wx.Frame):
         
         # 模式说明标签
         self.mode_tip_label = wx.StaticText(parent, label="💡 均衡：速度与质量的最佳平衡")
-        self.mode_tip_label.SetForegroundColour(wx.Colour(80, 80, 80))
+        self.mode_tip_label.SetForegroundColour(_GREY_80)
         sbs_mode.Add(self.mode_tip_label, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 10)
         
         sizer.Add(sbs_mode, 0, wx.EXPAND | wx.ALL, 10)
@@ -697,7 +970,7 @@ class MainFrame(wx.Frame):
 
         # 5. Action
         self.start_btn = wx.Button(parent, label="🚀 开始生成论文", size=(200, 50))
-        self.start_btn.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.start_btn.SetFont(_bold_font(12))
         self.start_btn.Bind(wx.EVT_BUTTON, self.on_start)
         sizer.Add(self.start_btn, 0, wx.ALIGN_CENTER | wx.ALL, 15)
 
@@ -708,7 +981,7 @@ class MainFrame(wx.Frame):
         log_panel = wx.Panel(splitter)
         log_sizer = wx.BoxSizer(wx.VERTICAL)
         log_label = wx.StaticText(log_panel, label="生成日志")
-        log_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        log_label.SetFont(_bold_font(9))
         log_sizer.Add(log_label, 0, wx.ALL, 5)
         self.log_ctrl = wx.TextCtrl(log_panel, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL)
         self.log_ctrl.SetFont(wx.Font(9, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
@@ -719,12 +992,13 @@ class MainFrame(wx.Frame):
         history_panel = wx.Panel(splitter)
         history_sizer = wx.BoxSizer(wx.VERTICAL)
         history_label = wx.StaticText(history_panel, label="历史生成记录")
-        history_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        history_label.SetFont(_bold_font(9))
         history_sizer.Add(history_label, 0, wx.ALL, 5)
         
         self.history_tree = wx.TreeCtrl(history_panel, style=wx.TR_DEFAULT_STYLE | wx.TR_HIDE_ROOT)
         self.history_tree.Bind(wx.EVT_TREE_ITEM_ACTIVATED, self.on_history_item_activated)
         self.history_tree.Bind(wx.EVT_TREE_ITEM_RIGHT_CLICK, self.on_history_right_click)  # 右键菜单
+        self.history_tree.Bind(wx.EVT_TREE_ITEM_EXPANDING, self.on_history_item_expanding)  # 按需创建子节点
         history_sizer.Add(self.history_tree, 1, wx.EXPAND | wx.ALL, 5)
         
         # 历史记录按钮栏
@@ -753,8 +1027,8 @@ class MainFrame(wx.Frame):
         
         parent.SetSizer(sizer)
         
-        # 加载历史记录
-        self.refresh_history_tree()
+        # 加载历史记录：推迟到窗口首次显示之后，读盘不阻塞启动
+        wx.CallAfter(self.refresh_history_tree)
 
     def create_config_tab(self, parent):
         # 使用滚动面板以容纳更多内容
@@ -762,32 +1036,35 @@ class MainFrame(wx.Frame):
         scroll.SetScrollRate(5, 5)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
+        # 一次取出所需的配置子树，各控件直接从子树读取
+        er_conf = config.get('expert_review', {}) or {}
+        default_prov = config.get('model_routing.default_provider', 'siliconflow')
+        p_conf = config.get(f'model_routing.providers.{default_prov}', {}) or {}
+        
         # ==================== 1. 专家审稿设置 ====================
         sb_expert = wx.StaticBox(scroll, label="1. 专家审稿")
         sbs_expert = wx.StaticBoxSizer(sb_expert, wx.VERTICAL)
         self.expert_enable_cb = wx.CheckBox(scroll, label="启用专家审稿 (质量更优，耗时较长)")
-        self.expert_enable_cb.SetValue(config.get('expert_review.enabled', True))
+        self.expert_enable_cb.SetValue(er_conf.get('enabled', True))
         sbs_expert.Add(self.expert_enable_cb, 0, wx.ALL, 5)
         
-        # 审稿轮次
-        hbox_rounds = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_rounds.Add(wx.StaticText(scroll, label="最大审稿轮次:"), 0, wx.ALIGN_CENTER_VERTICAL)
-        self.rounds_spin = wx.SpinCtrl(scroll, value=str(config.get('expert_review.max_rounds', 3)), 
+        # 审稿轮次 / 及格分数：同一个 (标签, 输入) 两列网格
+        self.rounds_spin = wx.SpinCtrl(scroll, value=str(er_conf.get('max_rounds', 3)), 
                                         min=1, max=10, size=(60, -1))
-        hbox_rounds.Add(self.rounds_spin, 0, wx.LEFT, 5)
-        sbs_expert.Add(hbox_rounds, 0, wx.ALL, 5)
-        
-        # 及格分数
-        hbox_score = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_score.Add(wx.StaticText(scroll, label="及格分数 (达到后停止审稿):"), 0, wx.ALIGN_CENTER_VERTICAL)
-        self.pass_score_spin = wx.SpinCtrl(scroll, value=str(config.get('expert_review.target_score', 80)),
+        self.pass_score_spin = wx.SpinCtrl(scroll, value=str(er_conf.get('target_score', 80)),
                                             min=60, max=100, size=(60, -1))
-        hbox_score.Add(self.pass_score_spin, 0, wx.LEFT, 5)
-        sbs_expert.Add(hbox_score, 0, wx.ALL, 5)
+        expert_grid = wx.FlexGridSizer(2, 2, 5, 5)
+        expert_grid.AddMany([
+            (wx.StaticText(scroll, label="最大审稿轮次:"), 0, wx.ALIGN_CENTER_VERTICAL),
+            (self.rounds_spin, 0),
+            (wx.StaticText(scroll, label="及格分数 (达到后停止审稿):"), 0, wx.ALIGN_CENTER_VERTICAL),
+            (self.pass_score_spin, 0),
+        ])
+        sbs_expert.Add(expert_grid, 0, wx.ALL, 5)
         
         # 提示信息
         score_tip = wx.StaticText(scroll, label="提示：如果修改后分数反而下降，系统会自动回滚到之前的高分版本。")
-        score_tip.SetForegroundColour(wx.Colour(100, 100, 100))
+        score_tip.SetForegroundColour(_GREY_100)
         sbs_expert.Add(score_tip, 0, wx.ALL, 5)
         
         sizer.Add(sbs_expert, 0, wx.EXPAND | wx.ALL, 10)
@@ -813,17 +1090,17 @@ class MainFrame(wx.Frame):
         grid = wx.FlexGridSizer(3, 2, 10, 10)
         grid.AddGrowableCol(1, 1)
         
-        grid.Add(wx.StaticText(scroll, label="Base URL:"), 0, wx.ALIGN_CENTER_VERTICAL)
         self.base_url_input = wx.TextCtrl(scroll)
-        grid.Add(self.base_url_input, 1, wx.EXPAND)
-        
-        grid.Add(wx.StaticText(scroll, label="API Key:"), 0, wx.ALIGN_CENTER_VERTICAL)
         self.api_key_input = wx.TextCtrl(scroll, style=wx.TE_PASSWORD)
-        grid.Add(self.api_key_input, 1, wx.EXPAND)
-        
-        grid.Add(wx.StaticText(scroll, label="Model Name:"), 0, wx.ALIGN_CENTER_VERTICAL)
         self.model_name_input = wx.TextCtrl(scroll)
-        grid.Add(self.model_name_input, 1, wx.EXPAND)
+        grid.AddMany([
+            (wx.StaticText(scroll, label="Base URL:"), 0, wx.ALIGN_CENTER_VERTICAL),
+            (self.base_url_input, 1, wx.EXPAND),
+            (wx.StaticText(scroll, label="API Key:"), 0, wx.ALIGN_CENTER_VERTICAL),
+            (self.api_key_input, 1, wx.EXPAND),
+            (wx.StaticText(scroll, label="Model Name:"), 0, wx.ALIGN_CENTER_VERTICAL),
+            (self.model_name_input, 1, wx.EXPAND),
+        ])
         
         sbs_api.Add(grid, 0, wx.EXPAND | wx.ALL, 10)
         sizer.Add(sbs_api, 0, wx.EXPAND | wx.ALL, 10)
@@ -834,15 +1111,14 @@ class MainFrame(wx.Frame):
         
         # 思考链开关
         self.thinking_enable_cb = wx.CheckBox(scroll, label="启用思考链 (深度推理，质量更高但速度更慢)")
-        default_prov = config.get('model_routing.default_provider', 'siliconflow')
-        thinking_enabled = config.get(f'model_routing.providers.{default_prov}.enable_thinking', False)
+        thinking_enabled = p_conf.get('enable_thinking', False)
         self.thinking_enable_cb.SetValue(thinking_enabled)
         sbs_thinking.Add(self.thinking_enable_cb, 0, wx.ALL, 5)
         
         # 思考预算
         hbox_budget = wx.BoxSizer(wx.HORIZONTAL)
         hbox_budget.Add(wx.StaticText(scroll, label="思考预算 (tokens):"), 0, wx.ALIGN_CENTER_VERTICAL)
-        thinking_budget = config.get(f'model_routing.providers.{default_prov}.thinking_budget', 4096)
+        thinking_budget = p_conf.get('thinking_budget', 4096)
         self.thinking_budget_spin = wx.SpinCtrl(scroll, value=str(thinking_budget), 
                                                  min=1000, max=16000, size=(80, -1))
         hbox_budget.Add(self.thinking_budget_spin, 0, wx.LEFT, 5)
@@ -851,7 +1127,7 @@ class MainFrame(wx.Frame):
         
         # 思考链提示
         thinking_tip = wx.StaticText(scroll, label="💡 提示: 关闭=1-5秒/次 | 开启(4096)=20-60秒/次 | 仅DeepSeek/Qwen等模型支持")
-        thinking_tip.SetForegroundColour(wx.Colour(80, 80, 80))
+        thinking_tip.SetForegroundColour(_GREY_80)
         sbs_thinking.Add(thinking_tip, 0, wx.ALL, 5)
         
         sizer.Add(sbs_thinking, 0, wx.EXPAND | wx.ALL, 10)
@@ -860,45 +1136,35 @@ class MainFrame(wx.Frame):
         sb_advanced = wx.StaticBox(scroll, label="4. 高级参数")
         sbs_advanced = wx.StaticBoxSizer(sb_advanced, wx.VERTICAL)
         
-        # Temperature
-        hbox_temp = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_temp.Add(wx.StaticText(scroll, label="Temperature:"), 0, wx.ALIGN_CENTER_VERTICAL)
-        temperature = config.get(f'model_routing.providers.{default_prov}.temperature', 0.7)
+        # Temperature / Top-P / Max Tokens / 最大引用数：(标签, 输入, 说明) 三列网格
+        temperature = p_conf.get('temperature', 0.7)
         self.temperature_spin = wx.SpinCtrlDouble(scroll, value=str(temperature), 
                                                    min=0.1, max=1.5, inc=0.1, size=(80, -1))
-        hbox_temp.Add(self.temperature_spin, 0, wx.LEFT, 5)
-        hbox_temp.Add(wx.StaticText(scroll, label="(创造性: 0.1=保守, 1.0=创意)"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
-        sbs_advanced.Add(hbox_temp, 0, wx.ALL, 5)
-        
-        # Top-P
-        hbox_topp = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_topp.Add(wx.StaticText(scroll, label="Top-P:"), 0, wx.ALIGN_CENTER_VERTICAL)
-        top_p = config.get(f'model_routing.providers.{default_prov}.top_p', 0.7)
+        top_p = p_conf.get('top_p', 0.7)
         self.top_p_spin = wx.SpinCtrlDouble(scroll, value=str(top_p), 
                                              min=0.1, max=1.0, inc=0.1, size=(80, -1))
-        hbox_topp.Add(self.top_p_spin, 0, wx.LEFT, 5)
-        hbox_topp.Add(wx.StaticText(scroll, label="(多样性: 0.1-1.0)"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
-        sbs_advanced.Add(hbox_topp, 0, wx.ALL, 5)
-        
-        # Max Tokens
-        hbox_maxtokens = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_maxtokens.Add(wx.StaticText(scroll, label="Max Tokens:"), 0, wx.ALIGN_CENTER_VERTICAL)
-        max_tokens = config.get(f'model_routing.providers.{default_prov}.max_tokens', 100000)
+        max_tokens = p_conf.get('max_tokens', 100000)
         self.max_tokens_spin = wx.SpinCtrl(scroll, value=str(max_tokens), 
                                             min=1000, max=200000, size=(100, -1))
-        hbox_maxtokens.Add(self.max_tokens_spin, 0, wx.LEFT, 5)
-        hbox_maxtokens.Add(wx.StaticText(scroll, label="(最大输出长度)"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
-        sbs_advanced.Add(hbox_maxtokens, 0, wx.ALL, 5)
-        
         # [*] 新增：最大引用数量
-        hbox_maxcite = wx.BoxSizer(wx.HORIZONTAL)
-        hbox_maxcite.Add(wx.StaticText(scroll, label="最大引用数:"), 0, wx.ALIGN_CENTER_VERTICAL)
         max_citations = config.get('citation.max_total', 25)
         self.max_citations_spin = wx.SpinCtrl(scroll, value=str(max_citations), 
                                                min=5, max=100, size=(70, -1))
-        hbox_maxcite.Add(self.max_citations_spin, 0, wx.LEFT, 5)
-        hbox_maxcite.Add(wx.StaticText(scroll, label="(论文中最多引用多少条文献，建议15-30)"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
-        sbs_advanced.Add(hbox_maxcite, 0, wx.ALL, 5)
+        
+        adv_grid = wx.FlexGridSizer(4, 3, 6, 10)
+        adv_grid.AddGrowableCol(2)
+        for label, ctrl, hint in (
+            ("Temperature:", self.temperature_spin, "(创造性: 0.1=保守, 1.0=创意)"),
+            ("Top-P:", self.top_p_spin, "(多样性: 0.1-1.0)"),
+            ("Max Tokens:", self.max_tokens_spin, "(最大输出长度)"),
+            ("最大引用数:", self.max_citations_spin, "(论文中最多引用多少条文献，建议15-30)"),
+        ):
+            adv_grid.AddMany([
+                (wx.StaticText(scroll, label=label), 0, wx.ALIGN_CENTER_VERTICAL),
+                (ctrl, 0),
+                (wx.StaticText(scroll, label=hint), 0, wx.ALIGN_CENTER_VERTICAL),
+            ])
+        sbs_advanced.Add(adv_grid, 0, wx.EXPAND | wx.ALL, 5)
         
         sizer.Add(sbs_advanced, 0, wx.EXPAND | wx.ALL, 10)
         
@@ -911,7 +1177,7 @@ class MainFrame(wx.Frame):
 
         # Save Button
         save_btn = wx.Button(scroll, label="💾 保存并应用配置", size=(200, 40))
-        save_btn.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        save_btn.SetFont(_bold_font(11))
         save_btn.Bind(wx.EVT_BUTTON, self.on_save_config)
         sizer.Add(save_btn, 0, wx.ALIGN_CENTER | wx.ALL, 20)
         
@@ -951,7 +1217,7 @@ class MainFrame(wx.Frame):
         
         # Info
         info = wx.StaticText(parent, label="注意：深度模式需要下载浏览器组件（首次运行会自动下载），效果类似 Page Assist 插件。\n标准模式速度快但只获取摘要。")
-        info.SetForegroundColour(wx.Colour(100, 100, 100))
+        info.SetForegroundColour(_GREY_100)
         sbs.Add(info, 0, wx.ALL, 10)
 
         sizer.Add(sbs, 0, wx.EXPAND | wx.ALL, 10)
@@ -964,35 +1230,78 @@ class MainFrame(wx.Frame):
         parent.SetSizer(sizer)
 
     def refresh_history_tree(self):
-        """刷新历史记录树"""
-        self.history_tree.DeleteAllItems()
-        root = self.history_tree.AddRoot("历史记录")
-        
-        history = load_history()
-        for title, records in history.items():
-            title_node = self.history_tree.AppendItem(root, f"📄 {title}")
-            for record in records:
-                time_node = self.history_tree.AppendItem(title_node, f"  ⏰ {record['timestamp']}")
-                for file_info in record.get('files', []):
-                    if isinstance(file_info, dict):
-                        file_path = file_info.get('path', '')
-                        file_name = os.path.basename(file_path)
-                    else:
-                        file_path = file_info
-                        file_name = os.path.basename(file_info)
-                    file_node = self.history_tree.AppendItem(time_node, f"    📁 {file_name}")
-                    self.history_tree.SetItemData(file_node, file_path)
+        """刷新历史记录树（只创建项目节点，记录与文件节点在展开时创建）"""
+        # 冻结重绘，批量重建完成后只刷新一次
+        self.history_tree.Freeze()
+        try:
+            self.history_tree.DeleteAllItems()
+            self._path_exists.clear()
+            root = self.history_tree.AddRoot("历史记录")
+        
+            history = self.get_history()
+            expand = len(history) <= _HISTORY_EXPAND_LIMIT
+            for title in history:
+                # 节点数据即对应的记录：('title', 标题) / ('time', 标题, 时间戳) / ('file', 路径)，
+                # 显示文本只用于展示，查找与删除都不解析它
+                title_node = self.history_tree.AppendItem(root, f"📄 {title}")
+                self.history_tree.SetItemData(title_node, ('title', title))
+                if expand:
+                    self._populate_history_node(title_node)
+                else:
+                    self.history_tree.SetItemHasChildren(title_node, True)
         
-        self.history_tree.ExpandAll()
+            if expand:
+                self.history_tree.ExpandAll()
+        finally:
+            self.history_tree.Thaw()
+
+    def _populate_history_node(self, title_node):
+        """为项目节点创建其时间记录与文件子节点（已创建过则跳过）"""
+        if self.history_tree.GetChildrenCount(title_node, False):
+            return
+        title = self.history_tree.GetItemData(title_node)[1]
+        for record in self.get_history().get(title, []):
+            time_node = self.history_tree.AppendItem(title_node, f"  ⏰ {record['timestamp']}")
+            self.history_tree.SetItemData(time_node, ('time', title, record['timestamp']))
+            for file_info in record.get('files', []):
+                if isinstance(file_info, dict):
+                    file_path = file_info.get('path', '')
+                    file_name = os.path.basename(file_path)
+                else:
+                    file_path = file_info
+                    file_name = os.path.basename(file_info)
+                file_node = self.history_tree.AppendItem(time_node, f"    📁 {file_name}")
+                self.history_tree.SetItemData(file_node, ('file', file_path))
+            self.history_tree.Expand(time_node)
+
+    def on_history_item_expanding(self, event):
+        """首次展开项目节点时按需创建子节点"""
+        item = event.GetItem()
+        data = self.history_tree.GetItemData(item)
+        if isinstance(data, tuple) and data[0] == 'title':
+            self._populate_history_node(item)
+        event.Skip()
 
     def on_refresh_history(self, event):
         self.refresh_history_tree()
 
+    def _history_file_path(self, item):
+        """文件节点返回其路径，项目/时间节点返回None"""
+        data = self.history_tree.GetItemData(item)
+        return data[1] if data and data[0] == 'file' else None
+
+    def _history_file_exists(self, file_path):
+        """历史文件是否存在；结果缓存到下次刷新历史树，双击与右键菜单共用"""
+        exists = self._path_exists.get(file_path)
+        if exists is None:
+            exists = self._path_exists[file_path] = os.path.exists(file_path)
+        return exists
+
     def on_history_item_activated(self, event):
         """双击历史项目"""
         item = event.GetItem()
-        file_path = self.history_tree.GetItemData(item)
-        if file_path and os.path.exists(file_path):
+        file_path = self._history_file_path(item)
+        if file_path and self._history_file_exists(file_path):
             try:
                 os.startfile(file_path)
             except Exception as e:
@@ -1000,10 +1309,9 @@ class MainFrame(wx.Frame):
     
     def on_open_output_dir(self, event):
         """打开输出目录"""
-        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
-        if os.path.exists(output_dir):
+        if os.path.exists(_OUTPUT_DIR):
             try:
-                os.startfile(output_dir)
+                os.startfile(_OUTPUT_DIR)
             except Exception as e:
                 wx.MessageBox(f"无法打开目录: {str(e)}", "错误", wx.OK | wx.ICON_ERROR)
         else:
@@ -1016,8 +1324,12 @@ class MainFrame(wx.Frame):
             wx.MessageBox("请先选择要删除的记录", "提示", wx.OK | wx.ICON_WARNING)
             return
         
-        # 获取项目文本用于确认
-        item_text = self.history_tree.GetItemText(item)
+        # 只能删除项目或时间记录，文件节点跟随其记录
+        tag = self.history_tree.GetItemData(item)
+        if not tag or tag[0] == 'file':
+            wx.MessageBox("请选择要删除的项目或时间记录", "提示", wx.OK | wx.ICON_WARNING)
+            return
+        item_text = tag[1] if tag[0] == 'title' else f"{tag[1]} ({tag[2]})"
         
         # 确认删除
         dlg = wx.MessageDialog(
@@ -1031,32 +1343,32 @@ class MainFrame(wx.Frame):
             return
         dlg.Destroy()
         
-        # 从历史记录中删除
-        history = load_history()
+        # 从历史记录中删除（原地修改缓存对象，写盘后按文件变化自动失效）
+        history = self.get_history()
         
-        # 确定是删除整个项目还是单个记录
-        parent = self.history_tree.GetItemParent(item)
-        if parent == self.history_tree.GetRootItem():
-            # 删除整个项目（一级节点）
-            for title in list(history.keys()):
-                if f"📄 {title}" == item_text:
+        # 按节点数据确定是删除整个项目还是单个记录，直接按标题取用
+        if tag[1] in history:
+            title = tag[1]
+            if tag[0] == 'title':
+                # 删除整个项目（一级节点）
+                del history[title]
+            else:
+                # 删除匹配时间戳的记录（二级节点）
+                history[title] = [r for r in history[title] if r['timestamp'] != tag[2]]
+                if not history[title]:
                     del history[title]
-                    break
-        else:
-            # 删除单个时间记录（二级节点）
-            grandparent = self.history_tree.GetItemParent(parent)
-            if grandparent == self.history_tree.GetRootItem():
-                parent_text = self.history_tree.GetItemText(parent)
-                for title in list(history.keys()):
-                    if f"📄 {title}" == parent_text:
-                        # 删除匹配时间戳的记录
-                        history[title] = [r for r in history[title] if f"  ⏰ {r['timestamp']}" != item_text]
-                        if not history[title]:
-                            del history[title]
-                        break
         
-        save_history(history)
-        self.refresh_history_tree()
+        self.save_history(history)
+        
+        # 只移除受影响的节点，不重建整棵树
+        parent = self.history_tree.GetItemParent(item)
+        self.history_tree.Freeze()
+        try:
+            self.history_tree.Delete(item)
+            if tag[0] == 'time' and not self.history_tree.GetChildrenCount(parent, False):
+                self.history_tree.Delete(parent)
+        finally:
+            self.history_tree.Thaw()
         wx.MessageBox("记录已删除", "成功", wx.OK | wx.ICON_INFORMATION)
     
     def on_history_right_click(self, event):
@@ -1066,12 +1378,12 @@ class MainFrame(wx.Frame):
             return
         
         self.history_tree.SelectItem(item)
-        file_path = self.history_tree.GetItemData(item)
+        file_path = self._history_file_path(item)
         
         # 创建右键菜单
         menu = wx.Menu()
         
-        if file_path and os.path.exists(file_path):
+        if file_path and self._history_file_exists(file_path):
             item_open = menu.Append(wx.ID_ANY, "📄 打开文件")
             self.Bind(wx.EVT_MENU, lambda e: os.startfile(file_path), item_open)
             
@@ -1098,20 +1410,21 @@ class MainFrame(wx.Frame):
 
     def load_provider_fields(self, provider_name):
         """加载提供商配置到UI控件"""
-        p_conf = config.get(f'model_routing.providers.{provider_name}', {})
-        self.base_url_input.SetValue(p_conf.get('base_url', ''))
-        self.api_key_input.SetValue(p_conf.get('api_key', ''))
+        p_conf = config.get(f'model_routing.providers.{provider_name}', {}) or {}
+        # ChangeValue 不触发 EVT_TEXT；数值控件仅在值变化时更新
+        self.base_url_input.ChangeValue(p_conf.get('base_url', ''))
+        self.api_key_input.ChangeValue(p_conf.get('api_key', ''))
         models = p_conf.get('models', [])
-        self.model_name_input.SetValue(models[0] if models else '')
+        self.model_name_input.ChangeValue(models[0] if models else '')
         
         # 加载思考链配置
-        self.thinking_enable_cb.SetValue(p_conf.get('enable_thinking', False))
-        self.thinking_budget_spin.SetValue(p_conf.get('thinking_budget', 4096))
+        _set_if_changed(self.thinking_enable_cb, p_conf.get('enable_thinking', False))
+        _set_if_changed(self.thinking_budget_spin, p_conf.get('thinking_budget', 4096))
         
         # 加载高级参数
-        self.temperature_spin.SetValue(p_conf.get('temperature', 0.7))
-        self.top_p_spin.SetValue(p_conf.get('top_p', 0.7))
-        self.max_tokens_spin.SetValue(p_conf.get('max_tokens', 100000))
+        _set_if_changed(self.temperature_spin, p_conf.get('temperature', 0.7))
+        _set_if_changed(self.top_p_spin, p_conf.get('top_p', 0.7))
+        _set_if_changed(self.max_tokens_spin, p_conf.get('max_tokens', 100000))
 
     def on_provider_changed(self, event):
         provider = self.provider_choice.GetStringSelection()
@@ -1119,6 +1432,8 @@ class MainFrame(wx.Frame):
     
     def on_mode_changed(self, event):
         """快捷模式切换事件处理"""
+        # 模式按钮在任务页，下面读写的控件在配置页，配置页可能尚未打开过
+        self._build_lazy_tab(self.config_tab)
         provider = self.provider_choice.GetStringSelection()
         
         # 定义模式预设
@@ -1171,37 +1486,37 @@ class MainFrame(wx.Frame):
         api_key = self.api_key_input.GetValue().strip()
         model = self.model_name_input.GetValue().strip()
         
-        config.set('model_routing.default_provider', provider)
-        config.set(f'model_routing.providers.{provider}.base_url', base_url)
-        config.set(f'model_routing.providers.{provider}.api_key', api_key)
-        config.set(f'model_routing.providers.{provider}.models', [model])
-        config.set(f'model_routing.providers.{provider}.enabled', True)
-        
-        # Save Thinking Chain Config
-        config.set(f'model_routing.providers.{provider}.enable_thinking', self.thinking_enable_cb.GetValue())
-        config.set(f'model_routing.providers.{provider}.thinking_budget', self.thinking_budget_spin.GetValue())
-        
-        # Save Advanced Parameters
-        config.set(f'model_routing.providers.{provider}.temperature', self.temperature_spin.GetValue())
-        config.set(f'model_routing.providers.{provider}.top_p', self.top_p_spin.GetValue())
-        config.set(f'model_routing.providers.{provider}.max_tokens', self.max_tokens_spin.GetValue())
-        
-        # Save Expert Config
-        config.set('expert_review.enabled', self.expert_enable_cb.GetValue())
-        config.set('expert_review.max_rounds', self.rounds_spin.GetValue())
-        config.set('expert_review.target_score', self.pass_score_spin.GetValue())
-        
-        # [*] 保存引用配置
-        config.set('citation.max_total', self.max_citations_spin.GetValue())
+        prefix = f'model_routing.providers.{provider}.'
+        config.update({
+            'model_routing.default_provider': provider,
+            prefix + 'base_url': base_url,
+            prefix + 'api_key': api_key,
+            prefix + 'models': [model],
+            prefix + 'enabled': True,
+            
+            # Save Thinking Chain Config
+            prefix + 'enable_thinking': self.thinking_enable_cb.GetValue(),
+            prefix + 'thinking_budget': self.thinking_budget_spin.GetValue(),
+            
+            # Save Advanced Parameters
+            prefix + 'temperature': self.temperature_spin.GetValue(),
+            prefix + 'top_p': self.top_p_spin.GetValue(),
+            prefix + 'max_tokens': self.max_tokens_spin.GetValue(),
+            
+            # Save Expert Config
+            'expert_review.enabled': self.expert_enable_cb.GetValue(),
+            'expert_review.max_rounds': self.rounds_spin.GetValue(),
+            'expert_review.target_score': self.pass_score_spin.GetValue(),
+            
+            # [*] 保存引用配置
+            'citation.max_total': self.max_citations_spin.GetValue(),
+        })
         
         config.save()
         wx.MessageBox("所有配置已保存！", "成功", wx.OK | wx.ICON_INFORMATION)
     
     def on_test_api(self, event):
         """测试API连接"""
-        import requests
-        import time
-        
         base_url = self.base_url_input.GetValue().strip()
         api_key = self.api_key_input.GetValue().strip()
         model = self.model_name_input.GetValue().strip()
@@ -1221,10 +1536,19 @@ class MainFrame(wx.Frame):
         
         self.test_api_btn.SetLabel("测试中...")
         self.test_api_btn.Disable()
-        wx.Yield()  # 刷新UI
         
+        # 请求放到后台线程，最长 30 秒的超时期间界面保持响应
+        threading.Thread(target=self._do_api_test, args=(endpoint, api_key, model), daemon=True).start()
+
+    def _do_api_test(self, endpoint, api_key, model):
+        """后台线程：发送测试请求，结果交回界面线程显示"""
+        try:
+            requests = _get_requests()
+        except ImportError as e:
+            wx.CallAfter(self._on_api_test_result, f"❌ 测试出错！\n\n{e}", "API测试失败", wx.OK | wx.ICON_ERROR)
+            return
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             response = requests.post(
                 endpoint,
                 headers={
@@ -1238,12 +1562,12 @@ class MainFrame(wx.Frame):
                 },
                 timeout=30
             )
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             
             if response.ok:
                 data = response.json()
                 content = data.get('choices', [{}])[0].get('message', {}).get('content', 'OK')
-                wx.MessageBox(
+                result = (
                     f"✅ 连接成功！\n\n"
                     f"响应时间: {elapsed:.2f}秒\n"
                     f"模型响应: {content[:50]}\n"
@@ -1252,7 +1576,7 @@ class MainFrame(wx.Frame):
                 )
             else:
                 error_msg = response.text[:300] if response.text else f"HTTP {response.status_code}"
-                wx.MessageBox(
+                result = (
                     f"❌ 连接失败！\n\n"
                     f"状态码: {response.status_code}\n"
                     f"错误信息: {error_msg}",
@@ -1260,14 +1584,19 @@ class MainFrame(wx.Frame):
                 )
                 
         except requests.exceptions.Timeout:
-            wx.MessageBox("❌ 连接超时！请检查网络或API地址。", "API测试失败", wx.OK | wx.ICON_ERROR)
+            result = ("❌ 连接超时！请检查网络或API地址。", "API测试失败", wx.OK | wx.ICON_ERROR)
         except requests.exceptions.ConnectionError as e:
-            wx.MessageBox(f"❌ 无法连接！\n\n{str(e)[:200]}", "API测试失败", wx.OK | wx.ICON_ERROR)
+            result = (f"❌ 无法连接！\n\n{str(e)[:200]}", "API测试失败", wx.OK | wx.ICON_ERROR)
         except Exception as e:
-            wx.MessageBox(f"❌ 测试出错！\n\n{str(e)[:200]}", "API测试失败", wx.OK | wx.ICON_ERROR)
-        finally:
-            self.test_api_btn.SetLabel("🔗 测试连接")
-            self.test_api_btn.Enable()
+            result = (f"❌ 测试出错！\n\n{str(e)[:200]}", "API测试失败", wx.OK | wx.ICON_ERROR)
+        wx.CallAfter(self._on_api_test_result, *result)
+
+    def _on_api_test_result(self, message, caption, style):
+        if not self:
+            return
+        self.test_api_btn.SetLabel("🔗 测试连接")
+        self.test_api_btn.Enable()
+        wx.MessageBox(message, caption, style)
 
     def on_save_search_config(self, event):
         enabled = self.search_enable_cb.GetValue()
@@ -1275,9 +1604,11 @@ class MainFrame(wx.Frame):
         mode = 'deep' if mode_idx == 1 else 'standard'
         limit = self.search_limit_spin.GetValue()
         
-        config.set('literature.web_search.enabled', enabled)
-        config.set('literature.web_search.mode', mode)
-        config.set('literature.web_search.results_per_query', limit)
+        config.update({
+            'literature.web_search.enabled': enabled,
+            'literature.web_search.mode': mode,
+            'literature.web_search.results_per_query': limit,
+        })
         
         config.save()
         wx.MessageBox("搜索配置已保存！", "成功", wx.OK | wx.ICON_INFORMATION)
@@ -1299,9 +1630,8 @@ class MainFrame(wx.Frame):
         self.log_ctrl.Clear()
         self.log_ctrl.AppendText("🚀 正在生成大纲，请稍候...\n")
         
-        # 初始化进度统计
-        import time
-        self.generation_start_time = time.time()
+        # 初始化进度统计（单调时钟，不受系统时间调整影响）
+        self.generation_start_time = time.monotonic()
         self.generation_api_calls = 0
         self.generation_word_count = 0
         
@@ -1312,18 +1642,29 @@ class MainFrame(wx.Frame):
         self.stats_words_label.SetLabel("已生成: 0 字")
         self.stats_api_label.SetLabel("API调用: 0 次")
         self.stats_time_label.SetLabel("耗时: 0 秒")
+        self._last_progress = 0
+        self._last_elapsed_sec = 0
         
         # 保存输入数据，供后续使用
         self.pending_title = title
         self.pending_idea = self.idea_input.GetValue().strip()
         self.pending_lit_path = self.lit_path_ctrl.GetValue().strip()
         
+        # 模型配置有误时 ModelRouter 构造即失败，按大纲生成失败处理（恢复开始按钮并提示）
+        try:
+            router = self.get_router()
+        except Exception as e:
+            logger.error("模型路由初始化失败: %s", traceback.format_exc())
+            wx.PostEvent(self, OutlineEvent(outline=None, success=False, error=str(e)))
+            return
+        
         # 启动大纲生成线程
-        outline_worker = OutlineWorkerThread(
+        self._outline_worker = outline_worker = OutlineWorkerThread(
             self, 
             self.pending_title, 
             self.pending_idea, 
-            self.pending_lit_path
+            self.pending_lit_path,
+            router
         )
         outline_worker.start()
     
@@ -1368,41 +1709,102 @@ class MainFrame(wx.Frame):
             self.start_btn.Enable()
             self.log_ctrl.AppendText("❌ 已取消生成\n")
 
-    def on_progress_update(self, event):
-        """进度更新事件处理器"""
+    def queue_progress(self, progress, stage=None, word_count=None, api_calls=None):
+        """
+        记录最新进度（任意线程可调用），首次待刷新时触发一次延迟刷新
+        
+        未提供的字段保留上一次的值，刷新前的中间进度只保留最后一次
+        """
+        with self._progress_lock:
+            latest = self._progress_latest
+            latest['progress'] = progress
+            if stage:
+                latest['stage'] = stage
+            if word_count is not None:
+                latest['word_count'] = word_count
+            if api_calls is not None:
+                latest['api_calls'] = api_calls
+            if self._progress_pending:
+                return
+            self._progress_pending = True
+        wx.CallAfter(self._schedule_progress_flush)
+
+    def _schedule_progress_flush(self):
+        if self:
+            wx.CallLater(_PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            latest = self._progress_latest
+            self._progress_latest = {}
+            self._progress_pending = False
+        if self and latest:
+            self.update_progress(**latest)
+
+    def update_progress(self, progress=0, stage='', word_count=None, api_calls=None):
+        """更新进度显示"""
         # 更新进度条
-        progress = getattr(event, 'progress', 0)
-        self.progress_bar.SetValue(min(100, max(0, int(progress))))
-        self.progress_percent_label.SetLabel(f"{int(progress)}%")
+        progress = int(progress)
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_bar.SetValue(min(100, max(0, progress)))
+            self.progress_percent_label.SetLabel(f"{progress}%")
         
         # 更新阶段标签
-        stage = getattr(event, 'stage', '')
         if stage:
             self.progress_stage_label.SetLabel(f"当前阶段: {stage}")
         
         # 更新统计信息
-        word_count = getattr(event, 'word_count', None)
         if word_count is not None:
             self.generation_word_count = word_count
             self.stats_words_label.SetLabel(f"已生成: {word_count:,} 字")
         
-        api_calls = getattr(event, 'api_calls', None)
         if api_calls is not None:
             self.generation_api_calls = api_calls
             self.stats_api_label.SetLabel(f"API调用: {api_calls} 次")
         
         # 更新耗时
         if self.generation_start_time:
-            import time
-            elapsed = int(time.time() - self.generation_start_time)
-            minutes, seconds = divmod(elapsed, 60)
-            if minutes > 0:
-                self.stats_time_label.SetLabel(f"耗时: {minutes}分{seconds}秒")
-            else:
-                self.stats_time_label.SetLabel(f"耗时: {seconds} 秒")
-
-    def on_log_update(self, event):
-        self.log_ctrl.AppendText(event.message)
+            elapsed = int(time.monotonic() - self.generation_start_time)
+            if elapsed != self._last_elapsed_sec:
+                self._last_elapsed_sec = elapsed
+                minutes, seconds = divmod(elapsed, 60)
+                if minutes > 0:
+                    self.stats_time_label.SetLabel(f"耗时: {minutes}分{seconds}秒")
+                else:
+                    self.stats_time_label.SetLabel(f"耗时: {seconds} 秒")
+
+    def queue_log(self, message):
+        """
+        追加日志（任意线程可调用），首条待刷新日志触发一次延迟刷新
+        
+        message 为文本或 logging.LogRecord（刷新时格式化）
+        """
+        with self._log_lock:
+            self._log_buf.append(message)
+            if self._log_pending:
+                return
+            self._log_pending = True
+        wx.CallAfter(self._schedule_log_flush)
+
+    def _schedule_log_flush(self):
+        if self:
+            wx.CallLater(_LOG_FLUSH_MS, self._flush_logs)
+
+    def _flush_logs(self):
+        """将缓冲区中的日志一次性追加到日志框"""
+        with self._log_lock:
+            entries = list(self._log_buf)
+            self._log_buf.clear()
+            self._log_pending = False
+        if not self or not entries:
+            return
+        fmt = self._log_formatter.format
+        batch = ''.join(e if type(e) is str else fmt(e) + "\n" for e in entries)
+        n = self.log_ctrl.GetLastPosition() + len(batch)
+        if n > _LOG_MAX_CHARS:
+            self.log_ctrl.Remove(0, min(n - _LOG_KEEP_CHARS, self.log_ctrl.GetLastPosition()))
+        self.log_ctrl.AppendText(batch)
         self.log_ctrl.ShowPosition(self.log_ctrl.GetLastPosition())
 
     def on_task_done(self, event):
@@ -1420,7 +1822,7 @@ class MainFrame(wx.Frame):
                 if files:
                     # 添加到历史记录
                     title = self.title_input.GetValue().strip()
-                    add_to_history(title, files)
+                    self.add_to_history(title, files)
                     self.refresh_history_tree()
                     
                     # 显示成功消息